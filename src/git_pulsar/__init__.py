@@ -5,16 +5,8 @@ operational logic for creating high-frequency, non-intrusive "shadow backups"
 of local git repositories.
 """
 
-from . import (
-    cli,
-    config,
-    constants,
-    daemon,
-    git_wrapper,
-    ops,
-    service,
-    system,
-)
+import importlib
+from types import ModuleType
 
 __all__ = [
     "cli",
@@ -26,3 +18,23 @@ __all__ = [
     "service",
     "system",
 ]
+
+
+def __getattr__(name: str) -> ModuleType:
+    """Imports submodules on first attribute access.
+
+    Keeps `import git_pulsar` (and the CLI entry point) from eagerly loading
+    the daemon and service modules.
+
+    Args:
+        name (str): The attribute being accessed.
+
+    Returns:
+        ModuleType: The requested submodule.
+
+    Raises:
+        AttributeError: If the name is not a public submodule.
+    """
+    if name in __all__:
+        return importlib.import_module(f".{name}", __name__)
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
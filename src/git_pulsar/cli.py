@@ -1,21 +1,29 @@
 import argparse
 import datetime
+import functools
 import logging
 import os
+import select
 import subprocess
 import sys
+import threading
 import time
 from collections.abc import Callable
+from concurrent.futures import ThreadPoolExecutor
 from dataclasses import dataclass
 from pathlib import Path
+from typing import Any, BinaryIO
 
 from rich.console import Console
+from rich.live import Live
 from rich.panel import Panel
 from rich.prompt import Confirm
 from rich.table import Table
 from rich.text import Text
 
-from . import daemon, ops, service, system
+# `daemon` and `service` are imported where needed: most subcommands never
+# touch them, and importing them is a measurable share of CLI startup.
+from . import ops, system
 from .config import CONFIG_FILE, Config
 from .constants import (
     APP_NAME,
@@ -30,6 +38,18 @@ from .git_wrapper import GitRepo
 logger = logging.getLogger(APP_NAME)
 console = Console()
 
+LOG_FOLLOW_INTERVAL = 0.5
+"""float: Seconds `log` waits between checks when no change notification is available."""
+
+LOG_TAIL_BLOCK = 64 * 1024
+"""int: Bytes read per step when scanning backwards for the initial `log` lines."""
+
+SSH_CONNECT_TIMEOUT = 3
+"""int: Seconds ssh may spend establishing the `doctor` probe's connection."""
+
+SSH_PROBE_TIMEOUT = 4
+"""int: Seconds allowed for the `doctor` GitHub SSH connectivity probe."""
+
 
 @dataclass
 class DoctorAction:
@@ -47,6 +67,23 @@ class DoctorAction:
     action_callable: Callable[[], bool]
 
 
+@functools.lru_cache(maxsize=1)
+def _cwd_git_dir() -> Path | None:
+    """Locates the `.git` entry of the current working directory with one stat.
+
+    Both a directory and a gitfile (as used by worktrees and submodules) are
+    accepted. The result is memoized since the CLI never changes directory.
+
+    Returns:
+        Path | None: The relative `.git` path, or None outside a repository.
+    """
+    try:
+        os.stat(".git")
+    except OSError:
+        return None
+    return Path(".git")
+
+
 def _get_ref(repo: GitRepo) -> str:
     """Resolves the namespaced backup reference for the current repository state.
 
@@ -69,7 +106,9 @@ def _analyze_logs(seconds: int = 86400) -> list[str]:
     Returns:
         list[str]: A list of error or critical log lines found within the time window.
     """
-    if not LOG_FILE.exists():
+    try:
+        file_size = os.stat(LOG_FILE).st_size
+    except FileNotFoundError:
         return []
 
     errors = []
@@ -78,13 +117,14 @@ def _analyze_logs(seconds: int = 86400) -> list[str]:
     try:
         # Read the last 50KB of the log file
         # to capture recent context without parsing the whole file.
-        file_size = LOG_FILE.stat().st_size
         read_size = min(file_size, 50 * 1024)
 
-        with open(LOG_FILE) as f:
+        # Binary mode makes the byte offset seek well-defined; a multi-byte
+        # character split at the window edge is replaced rather than fatal.
+        with open(LOG_FILE, "rb") as f:
             if file_size > read_size:
                 f.seek(file_size - read_size)
-            lines = f.readlines()
+            lines = f.read().decode(errors="replace").splitlines()
 
         for line in lines:
             if "ERROR" in line or "CRITICAL" in line:
@@ -125,11 +165,9 @@ def _check_repo_health(path: Path, config: Config) -> str | None:
         if (path / ".git" / "pulsar_paused").exists():
             return None
 
-        # If the working directory is clean, no backup is required.
-        if not repo.status_porcelain():
-            return None
-
-        # Verify the freshness of the last backup.
+        # Verify the freshness of the last backup first. The working tree scan
+        # below is the most expensive probe, so it only runs when the backup
+        # state alone cannot prove the repository healthy.
         ref = _get_ref(repo)
         try:
             # Retrieve the raw Unix timestamp of the backup reference.
@@ -137,13 +175,16 @@ def _check_repo_health(path: Path, config: Config) -> str | None:
             last_backup_ts = int(ts_str.strip())
         except Exception as e:
             logger.debug(f"Failed to retrieve backup timestamp for {path.name}: {e}")
+            # If the working directory is clean, no backup is required.
+            if not repo.status_porcelain():
+                return None
             return f"Has changes, but NO backup found. (Error: {e})"
 
         # Check against the dynamic stale threshold (2x commit interval).
         # If changes are pending and no backup has occurred recently,
         # the daemon may be stalled.
         stale_threshold = config.daemon.commit_interval * 2
-        if time.time() - last_backup_ts > stale_threshold:
+        if time.time() - last_backup_ts > stale_threshold and repo.status_porcelain():
             return f"Stalled: Changes pending > {stale_threshold // 60} mins."
 
     except Exception as e:
@@ -182,20 +223,46 @@ def open_config() -> None:
         console.print(f"[red]Could not open editor: {e}[/red]")
 
 
+def _pid_alive(pid: int) -> bool:
+    """Checks whether a PID belongs to a running Git Pulsar daemon.
+
+    On Linux, the process command line is read from procfs so that a recycled
+    PID owned by an unrelated process is not reported as the daemon. Other
+    platforms fall back to a signal-0 liveness probe.
+
+    Args:
+        pid (int): The process ID recorded in the PID file.
+
+    Returns:
+        bool: True if the process is alive (and, on Linux, is the daemon).
+    """
+    if sys.platform.startswith("linux"):
+        try:
+            with open(f"/proc/{pid}/cmdline", "rb") as f:
+                cmdline = f.read()
+        except OSError:
+            return False
+        return b"git-pulsar" in cmdline or b"git_pulsar" in cmdline
+
+    try:
+        os.kill(pid, 0)
+        return True
+    except OSError:
+        return False
+
+
 def show_status() -> None:
     """Displays the current status of the daemon and the active repository."""
     # Check daemon process status.
-    pid_running = False
-    if PID_FILE.exists():
-        try:
-            with open(PID_FILE) as f:
-                pid = int(f.read().strip())
-            os.kill(pid, 0)
-            pid_running = True
-        except (ValueError, OSError):
-            pid_running = False
+    # A missing PID file surfaces as FileNotFoundError (an OSError).
+    try:
+        pid_running = _pid_alive(int(PID_FILE.read_text()))
+    except (ValueError, OSError):
+        pid_running = False
 
     # Check if the system service is scheduled/enabled.
+    from . import service
+
     service_enabled = service.is_service_enabled()
 
     if pid_running:
@@ -234,7 +301,7 @@ def show_status() -> None:
     console.print(Panel(system_content, title="System Status", expand=False))
 
     # Display status for the current repository, if applicable.
-    if Path(".git").exists():
+    if _cwd_git_dir() is not None:
         cwd = Path.cwd()
 
         # Check registration status.
@@ -281,8 +348,8 @@ def show_status() -> None:
             logger.debug(f"Failed to retrieve last push time for {remote_ref}: {e}")
             push_str = "Never"
 
-        count = len(repo.status_porcelain())
-        is_paused = (cwd / ".git" / "pulsar_paused").exists()
+        count = repo.count_pending()
+        is_paused = os.path.exists(os.path.join(".git", "pulsar_paused"))
 
         repo_content = Text()
         repo_content.append(f"Last Commit: {commit_str}\n")
@@ -336,20 +403,30 @@ def show_status() -> None:
 
     # Display global repository count if not currently in a repository.
     elif REGISTRY_FILE.exists():
-        count = len(system.get_registered_repos())
+        # Only the number of entries is needed, so avoid building Path objects.
+        with open(REGISTRY_FILE) as f:
+            count = sum(1 for line in f.read().splitlines() if line.strip())
         console.print(f"[dim]Watching {count} repositories.[/dim]")
 
 
 def show_diff() -> None:
     """Displays the diff between the working directory and the last backup."""
-    if not Path(".git").exists():
+    # One rev-parse validates the repository, finds its root and names the
+    # branch, so this also works from a subdirectory.
+    try:
+        probe = GitRepo.probe(Path.cwd())
+    except FileNotFoundError:
+        console.print("[bold red]git is not installed or not on PATH.[/bold red]")
+        sys.exit(1)
+    if probe is None:
         console.print("[bold red]Not a git repository.[/bold red]")
         sys.exit(1)
 
-    repo = GitRepo(Path.cwd())
+    root, branch = probe
+    repo = GitRepo(root)
 
     # Display standard diff for tracked files.
-    ref = _get_ref(repo)
+    ref = ops.get_backup_ref(branch)
 
     console.print(f"[bold]Diff vs {ref}:[/bold]\n")
     repo.run_diff(ref)
@@ -361,6 +438,66 @@ def show_diff() -> None:
             console.print(f"   + {line}", style="green")
 
 
+def _display_path(path_str: str, home: str) -> str:
+    """Abbreviates a path under the home directory with a leading '~'.
+
+    Args:
+        path_str (str): The absolute path to display.
+        home (str): The home directory, resolved once by the caller.
+
+    Returns:
+        str: The path with the home prefix replaced, or unchanged.
+    """
+    if path_str == home or path_str.startswith(home + os.sep):
+        return "~" + path_str[len(home) :]
+    return path_str
+
+
+def _repo_row(path_str: str, home: str) -> tuple[str, str, str]:
+    """Builds the `list` table row describing a single registered repository.
+
+    Args:
+        path_str (str): The registered repository path, as stored in the registry.
+        home (str): The user's home directory, used to shorten the display path.
+
+    Returns:
+        tuple[str, str, str]: The display path, styled status, and last backup time.
+    """
+    display_path = _display_path(path_str, home)
+
+    status_text = "Unknown"
+    status_style = "white"
+    last_backup = "-"
+
+    if not os.path.isdir(path_str):
+        status_text = "Missing"
+        status_style = "red"
+    else:
+        if os.path.exists(os.path.join(path_str, ".git", "pulsar_paused")):
+            status_text = "Paused"
+            status_style = "yellow"
+        else:
+            status_text = "Active"
+            status_style = "green"
+
+        try:
+            r = GitRepo(Path(path_str))
+        except Exception as e:
+            logger.debug(f"Repo instantiation failed for {path_str}: {e}")
+            if status_text == "Active":
+                status_text = "Error"
+                status_style = "bold red"
+        else:
+            try:
+                # One for-each-ref call yields both the branch and the backup time.
+                branch, commit_times = r.branch_summary()
+                last_backup = commit_times.get(ops.get_backup_ref(branch), "-")
+            except Exception as e:
+                logger.debug(f"Failed to retrieve backup info for {path_str}: {e}")
+
+    return display_path, f"[{status_style}]{status_text}[/{status_style}]", last_backup
+
+
 def list_repos() -> None:
     """Lists all repositories currently registered with Git Pulsar and their status."""
     if not REGISTRY_FILE.exists():
@@ -372,45 +509,18 @@ def list_repos() -> None:
     table.add_column("Status")
     table.add_column("Last Backup", justify="right", style="dim")
 
-    repos = system.get_registered_repos()
-
-    for path in repos:
-        display_path = str(path).replace(str(Path.home()), "~")
+    repos = system.get_registered_paths()
 
-        status_text = "Unknown"
-        status_style = "white"
-        last_backup = "-"
-
-        if not path.exists():
-            status_text = "Missing"
-            status_style = "red"
-        else:
-            if (path / ".git" / "pulsar_paused").exists():
-                status_text = "Paused"
-                status_style = "yellow"
-            else:
-                status_text = "Active"
-                status_style = "green"
-
-            try:
-                r = GitRepo(path)
-                ref = _get_ref(r)
-                last_backup = r.get_last_commit_time(ref)
-            except Exception as e:
-                logger.debug(f"Failed to retrieve backup info for {path}: {e}")
-                if status_text == "Active":
-                    try:
-                        GitRepo(path)
-                    except Exception as inner_e:
-                        logger.debug(f"Repo instantiation failed for {path}: {inner_e}")
-                        status_text = "Error"
-                        status_style = "bold red"
-
-        table.add_row(
-            display_path, f"[{status_style}]{status_text}[/{status_style}]", last_backup
-        )
-
-    console.print(table)
+    # Render rows as they are resolved instead of after the slowest git probe.
+    # The probes are independent and spend their time waiting on git, so a
+    # small pool overlaps them; map() keeps rows in registry order.
+    with (
+        Live(table, console=console, refresh_per_second=10),
+        ThreadPoolExecutor(max_workers=min(8, len(repos)) or 1) as pool,
+    ):
+        row_for = functools.partial(_repo_row, home=str(Path.home()))
+        for row in pool.map(row_for, repos):
+            table.add_row(*row)
 
 
 def unregister_repo() -> None:
@@ -420,17 +530,16 @@ def unregister_repo() -> None:
         console.print("Registry is empty.", style="yellow")
         return
 
-    current_paths = [str(p) for p in system.get_registered_repos()]
+    current_paths = system.get_registered_paths()
     if cwd not in current_paths:
         console.print(
             f"Current path not registered: [cyan]{cwd}[/cyan]", style="yellow"
         )
         return
 
+    # Rewrite the registry with a single write call.
     with open(REGISTRY_FILE, "w") as f:
-        for path in current_paths:
-            if path != cwd:
-                f.write(f"{path}\n")
+        f.write("".join(f"{path}\n" for path in current_paths if path != cwd))
     console.print(f"✔ Unregistered: [cyan]{cwd}[/cyan]", style="green")
 
 
@@ -498,13 +607,56 @@ def _check_git_hooks(repo_path: Path) -> list[str]:
     return warnings
 
 
+def _probe_github_ssh(
+    result: list[subprocess.CompletedProcess[str] | Exception],
+) -> None:
+    """Runs the GitHub SSH authentication probe, recording its outcome.
+
+    Intended to run on a background thread while the doctor performs local checks.
+
+    Args:
+        result (list[subprocess.CompletedProcess[str] | Exception]): A list that
+            receives either the completed process or the exception raised.
+    """
+    # BatchMode fails fast instead of prompting; the greeting is on stderr only.
+    try:
+        result.append(
+            subprocess.run(
+                [
+                    "ssh",
+                    "-T",
+                    "-o",
+                    "BatchMode=yes",
+                    "-o",
+                    f"ConnectTimeout={SSH_CONNECT_TIMEOUT}",
+                    "git@github.com",
+                ],
+                stdout=subprocess.DEVNULL,
+                stderr=subprocess.PIPE,
+                text=True,
+                timeout=SSH_PROBE_TIMEOUT,
+            )
+        )
+    except Exception as e:
+        result.append(e)
+
+
 def run_doctor() -> None:
     """
     Diagnoses system health, cleans the registry, and checks connectivity and logs.
     Includes an interactive resolution queue for safe auto-fixes.
     """
+    from . import service
+
     console.print("[bold]Pulsar Doctor[/bold]\n")
 
+    # Start the network-bound SSH probe first so it overlaps the local checks.
+    ssh_result: list[subprocess.CompletedProcess[str] | Exception] = []
+    ssh_probe = threading.Thread(
+        target=_probe_github_ssh, args=(ssh_result,), daemon=True
+    )
+    ssh_probe.start()
+
     actions: list[DoctorAction] = []
 
     # Verify and clean the registry.
@@ -516,10 +668,11 @@ def run_doctor() -> None:
             valid_lines = []
             missing_paths = []
             for p in repos:
-                if p.exists():
-                    valid_lines.append(str(p))
+                path_str = str(p)
+                if os.path.exists(path_str):
+                    valid_lines.append(path_str)
                 else:
-                    missing_paths.append(str(p))
+                    missing_paths.append(path_str)
 
             if missing_paths:
                 console.print(
@@ -593,27 +746,27 @@ def run_doctor() -> None:
 
     # Check network/SSH connectivity.
     with console.status("[bold blue]Checking Connectivity...", spinner="dots"):
-        try:
-            res = subprocess.run(
-                ["ssh", "-T", "git@github.com"],
-                capture_output=True,
-                text=True,
-                timeout=5,
-            )
-            if "successfully authenticated" in res.stderr:
-                console.print("   [green]✔ GitHub SSH connection successful.[/green]")
-            else:
-                console.print(
-                    "   [yellow]⚠ GitHub SSH check returned "
-                    "unexpected response.[/yellow]\n"
-                    "     [dim]Action required: Verify SSH key configuration or remote permissions.[/dim]"
-                )
-
-        except Exception as e:
-            console.print(f"   [red]✘ SSH Check failed: {e}[/red]")
+        # The probe has been running since the start of the doctor run; the
+        # join only waits for whatever is left of its own timeout.
+        ssh_probe.join(timeout=SSH_PROBE_TIMEOUT + 1)
+        res = (
+            ssh_result[0]
+            if ssh_result
+            else TimeoutError("SSH probe did not complete in time")
+        )
+        if isinstance(res, Exception):
+            console.print(f"   [red]✘ SSH Check failed: {res}[/red]")
             console.print(
                 "     [dim]Action required: Check your network connection or run 'ssh-add' to load your keys.[/dim]"
             )
+        elif "successfully authenticated" in res.stderr:
+            console.print("   [green]✔ GitHub SSH connection successful.[/green]")
+        else:
+            console.print(
+                "   [yellow]⚠ GitHub SSH check returned "
+                "unexpected response.[/yellow]\n"
+                "     [dim]Action required: Verify SSH key configuration or remote permissions.[/dim]"
+            )
 
     # Check for remote session drift (if currently in a registered repository).
     cwd = Path.cwd()
@@ -656,7 +809,8 @@ def run_doctor() -> None:
     with console.status("[bold blue]Checking Repository Health...", spinner="dots"):
         if REGISTRY_FILE.exists():
             with open(REGISTRY_FILE) as f:
-                paths = [Path(line.strip()) for line in f if line.strip()]
+                lines = f.read().splitlines()
+            paths = [Path(line.strip()) for line in lines if line.strip()]
 
             issues = []
             for p in paths:
@@ -830,21 +984,93 @@ def add_ignore_cli(pattern: str) -> None:
     Args:
         pattern (str): The file pattern to ignore (e.g., '*.log').
     """
-    if not Path(".git").exists():
+    if _cwd_git_dir() is None:
         console.print("[bold red]Not a git repository.[/bold red]")
         return
     ops.add_ignore(pattern)
 
 
+def _tail_lines(f: BinaryIO, count: int) -> bytes:
+    """Returns the last lines of a file, reading backwards in blocks.
+
+    Leaves the file positioned at its end.
+
+    Args:
+        f (BinaryIO): The file to read, opened in binary mode.
+        count (int): The maximum number of lines to return.
+
+    Returns:
+        bytes: The trailing lines, including their line endings.
+    """
+    end = f.seek(0, os.SEEK_END)
+    pos = end
+    data = b""
+    while pos > 0 and data.count(b"\n") <= count:
+        step = min(LOG_TAIL_BLOCK, pos)
+        pos -= step
+        f.seek(pos)
+        data = f.read(step) + data
+    f.seek(end)
+    return b"".join(data.splitlines(keepends=True)[-count:])
+
+
+def _follow_log(f: BinaryIO, out: BinaryIO) -> None:
+    """Copies data appended to a file to an output stream until interrupted.
+
+    Waits on a kqueue write notification on macOS and falls back to checking
+    every `LOG_FOLLOW_INTERVAL` seconds elsewhere.
+
+    Args:
+        f (BinaryIO): The file to follow, positioned where output should start.
+        out (BinaryIO): The binary stream that receives new data.
+    """
+    kq: Any = None
+    if sys.platform == "darwin":
+        kq = select.kqueue()
+    try:
+        if sys.platform == "darwin":
+            event = select.kevent(
+                f.fileno(),
+                filter=select.KQ_FILTER_VNODE,
+                flags=select.KQ_EV_ADD | select.KQ_EV_CLEAR,
+                fflags=select.KQ_NOTE_WRITE | select.KQ_NOTE_EXTEND,
+            )
+            kq.control([event], 0, 0)
+
+        while True:
+            chunk = f.read()
+            if chunk:
+                out.write(chunk)
+                out.flush()
+                continue
+
+            # Start over if the file was truncated underneath us.
+            if os.fstat(f.fileno()).st_size < f.tell():
+                f.seek(0)
+                continue
+
+            if kq:
+                kq.control(None, 1, LOG_FOLLOW_INTERVAL)
+            else:
+                time.sleep(LOG_FOLLOW_INTERVAL)
+    finally:
+        if kq:
+            kq.close()
+
+
 def tail_log() -> None:
     """Follows the daemon log file in real-time."""
-    if not LOG_FILE.exists():
-        console.print(f"[red]No log file found yet at {LOG_FILE}.[/red]")
-        return
-
-    console.print(f"Tailing [bold cyan]{LOG_FILE}[/bold cyan] (Ctrl+C to stop)...")
+    out = sys.stdout.buffer
     try:
-        subprocess.run(["tail", "-n", "1000", "-f", str(LOG_FILE)])
+        with open(LOG_FILE, "rb") as f:
+            console.print(
+                f"Tailing [bold cyan]{LOG_FILE}[/bold cyan] (Ctrl+C to stop)..."
+            )
+            out.write(_tail_lines(f, 1000))
+            out.flush()
+            _follow_log(f, out)
+    except FileNotFoundError:
+        console.print(f"[red]No log file found yet at {LOG_FILE}.[/red]")
     except KeyboardInterrupt:
         console.print("\nStopped.", style="dim")
 
@@ -855,11 +1081,11 @@ def set_pause_state(paused: bool) -> None:
     Args:
         paused (bool): True to pause backups, False to resume them.
     """
-    if not Path(".git").exists():
+    if (git_dir := _cwd_git_dir()) is None:
         console.print("[bold red]Not a git repository.[/bold red]")
         sys.exit(1)
 
-    pause_file = Path(".git/pulsar_paused")
+    pause_file = git_dir / "pulsar_paused"
     if paused:
         pause_file.touch()
         console.print(
@@ -910,19 +1136,24 @@ def setup_repo(registry_path: Path = REGISTRY_FILE) -> None:
                 "Existing .gitignore found. Checking for missing defaults...",
                 style="dim",
             )
-            with open(gitignore) as f:
-                existing_content = f.read()
-
-            missing_defaults = [d for d in DEFAULT_IGNORES if d not in existing_content]
-
-            if missing_defaults:
-                console.print(
-                    f"Appending {len(missing_defaults)} missing ignores...", style="dim"
-                )
-                with open(gitignore, "a") as f:
-                    f.write("\n" + "\n".join(missing_defaults) + "\n")
-            else:
-                console.print("All defaults present.", style="dim")
+            # Read and append through one handle so the check and the write
+            # observe the same file.
+            with open(gitignore, "r+") as f:
+                content = f.read()
+                existing = {line.strip() for line in content.splitlines()}
+                missing_defaults = [d for d in DEFAULT_IGNORES if d not in existing]
+
+                if missing_defaults:
+                    console.print(
+                        f"Appending {len(missing_defaults)} missing ignores...",
+                        style="dim",
+                    )
+                    # The read left the handle at EOF; only add a separator
+                    # when the file does not already end with a newline.
+                    prefix = "" if not content or content.endswith("\n") else "\n"
+                    f.write(prefix + "\n".join(missing_defaults) + "\n")
+                else:
+                    console.print("All defaults present.", style="dim")
     else:
         console.print(
             "Skipping .gitignore management (manage_gitignore=false).", style="dim"
@@ -930,16 +1161,19 @@ def setup_repo(registry_path: Path = REGISTRY_FILE) -> None:
 
     # Register the repository path.
     console.print("Registering path...", style="dim")
-    if not registry_path.exists():
-        registry_path.touch()
 
-    with open(registry_path, "r+") as f:
-        content = f.read()
-        if str(cwd) not in content:
+    # Compare whole lines so '/a/b' is not mistaken for '/a/bc'.
+    existing = (
+        set(registry_path.read_text().splitlines()) if registry_path.exists() else set()
+    )
+    if str(cwd) not in existing:
+        # Append mode creates the registry (but not its directory) on first use.
+        registry_path.parent.mkdir(parents=True, exist_ok=True)
+        with open(registry_path, "a") as f:
             f.write(f"{cwd}\n")
-            console.print(f"Registered: [cyan]{cwd}[/cyan]", style="green")
-        else:
-            console.print("Already registered.", style="dim")
+        console.print(f"Registered: [cyan]{cwd}[/cyan]", style="green")
+    else:
+        console.print("Already registered.", style="dim")
 
     console.print("\n[bold green]✔ Pulsar Active.[/bold green]")
 
@@ -1100,8 +1334,32 @@ def show_config_reference() -> None:
     console.print(table)
 
 
-def main() -> None:
-    """Main entry point for the Git Pulsar CLI."""
+_NO_ARG_COMMANDS = frozenset(
+    {
+        "uninstall-service",
+        "now",
+        "finalize",
+        "pause",
+        "resume",
+        "status",
+        "diff",
+        "list",
+        "log",
+        "remove",
+        "sync",
+        "doctor",
+        "config",
+    }
+)
+"""frozenset[str]: Subcommands that can be dispatched without parsing arguments."""
+
+
+def _build_parser() -> argparse.ArgumentParser:
+    """Builds the argument parser for the full command-line interface.
+
+    Returns:
+        argparse.ArgumentParser: The parser with every subcommand registered.
+    """
     parser = argparse.ArgumentParser(
         usage=argparse.SUPPRESS,
         formatter_class=PulsarHelpFormatter,
@@ -1179,16 +1437,38 @@ def main() -> None:
         "--days", type=int, default=30, help="Age in days (default: 30)"
     )
 
-    args = parser.parse_args()
+    return parser
+
+
+def main() -> None:
+    """Main entry point for the Git Pulsar CLI."""
+    # Fast path: a bare argument-less subcommand needs no parser at all, so
+    # skip constructing the full subparser tree for it.
+    if len(sys.argv) == 2 and sys.argv[1] in _NO_ARG_COMMANDS:
+        _dispatch(argparse.Namespace(command=sys.argv[1]), None)
+        return
+
+    parser = _build_parser()
+    _dispatch(parser.parse_args(), parser)
+
 
-    # Handle Subcommands
+def _dispatch(args: argparse.Namespace, parser: argparse.ArgumentParser | None) -> None:
+    """Runs the handler for a parsed subcommand.
+
+    Args:
+        args (argparse.Namespace): The parsed arguments, including `command`.
+        parser (argparse.ArgumentParser | None): The parser used, if one was
+            built (required for `help`).
+    """
     if args.command == "install-service":
+        from . import service
+
         with console.status("Installing background service...", spinner="dots"):
             service.install(interval=args.interval)
         console.print("[bold green]✔ Service installed.[/bold green]")
         return
     elif args.command == "help":
-        parser.print_help()
+        (parser or _build_parser()).print_help()
         return
     elif args.command == "remove":
         unregister_repo()
@@ -1209,11 +1489,15 @@ def main() -> None:
             ops.prune_backups(args.days)
         return
     elif args.command == "uninstall-service":
+        from . import service
+
         with console.status("Uninstalling service...", spinner="dots"):
             service.uninstall()
         console.print("[bold green]✔ Service uninstalled.[/bold green]")
         return
     elif args.command == "now":
+        from . import daemon
+
         daemon.main(interactive=True)
         return
     elif args.command == "restore":
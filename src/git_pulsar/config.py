@@ -1,50 +1,159 @@
+import functools
+import json
 import logging
+import os
 import re
+import threading
 import tomllib
-from dataclasses import dataclass, field, replace
+from dataclasses import dataclass, field, fields, replace
 from pathlib import Path
-from typing import Any
+from typing import Any, ClassVar
 
 from .constants import (
     APP_NAME,
     BACKUP_NAMESPACE,
+    CONFIG_CACHE_FILE,
     CONFIG_FILE,
 )
 
 logger = logging.getLogger(APP_NAME)
 
+FileSignature = tuple[str, int, int]
+"""type: A (path, mtime_ns, size) triple identifying one version of a file."""
+
+_LOAD_CACHE_SIZE = 64
+
+
+def _file_signature(path: Path) -> FileSignature | None:
+    """Stats a config file to identify its current version.
+
+    Args:
+        path (Path): The file to inspect.
+
+    Returns:
+        FileSignature | None: The file's signature, or None if it does not exist.
+    """
+    try:
+        st = os.stat(path)
+    except OSError:
+        return None
+    return str(path), st.st_mtime_ns, st.st_size
+
+
+@functools.cache
+def _field_names(cls: type) -> frozenset[str]:
+    """Returns the field names of a dataclass type, computed once per type.
+
+    Args:
+        cls (type): The dataclass type to inspect.
+
+    Returns:
+        frozenset[str]: The names of the dataclass fields.
+    """
+    # fields() excludes ClassVar pseudo-fields, which are not settable keys.
+    return frozenset(f.name for f in fields(cls))
+
+
+@functools.lru_cache(maxsize=32)
+def _load_toml_cached(path_str: str, mtime_ns: int, size: int) -> dict[str, Any]:
+    """Parses a TOML file, memoized on its path, mtime and size.
+
+    The returned dictionary is shared between callers and must not be mutated.
+
+    Args:
+        path_str (str): Path to the TOML file.
+        mtime_ns (int): The file's modification time, used as part of the key.
+        size (int): The file's size in bytes, used as part of the key.
+
+    Returns:
+        dict[str, Any]: The parsed TOML document.
+    """
+    if path_str == str(CONFIG_FILE):
+        return _load_global_toml(path_str, mtime_ns, size)
+    with open(path_str, "rb") as f:
+        return tomllib.load(f)
+
+
+def _load_global_toml(path_str: str, mtime_ns: int, size: int) -> dict[str, Any]:
+    """Parses the global config, reusing a JSON copy baked on a previous run.
+
+    The daemon is a fresh process on every tick, so the in-process cache never
+    survives. The global config rarely changes, and decoding JSON (implemented
+    in C) is cheaper than parsing TOML (pure Python), so the parsed document is
+    stored in the state directory alongside the signature it was parsed from.
+
+    Args:
+        path_str (str): Path to the global TOML file.
+        mtime_ns (int): The file's modification time.
+        size (int): The file's size in bytes.
+
+    Returns:
+        dict[str, Any]: The parsed TOML document.
+    """
+    try:
+        baked = json.loads(CONFIG_CACHE_FILE.read_bytes())
+        if baked["mtime_ns"] == mtime_ns and baked["size"] == size:
+            data: dict[str, Any] = baked["data"]
+            return data
+    except (OSError, ValueError, KeyError, TypeError):
+        pass
+
+    with open(path_str, "rb") as f:
+        data = tomllib.load(f)
+
+    try:
+        payload = json.dumps({"mtime_ns": mtime_ns, "size": size, "data": data})
+    except (TypeError, ValueError):
+        # TOML dates and times have no JSON form; parse the TOML every time.
+        return data
+
+    tmp_path = CONFIG_CACHE_FILE.with_name(
+        f"{CONFIG_CACHE_FILE.name}.{os.getpid()}.{threading.get_ident()}.tmp"
+    )
+    try:
+        CONFIG_CACHE_FILE.parent.mkdir(parents=True, exist_ok=True)
+        tmp_path.write_text(payload, encoding="utf-8")
+        os.replace(tmp_path, CONFIG_CACHE_FILE)
+    except OSError as e:
+        logger.debug(f"Could not write config cache: {e}")
+        tmp_path.unlink(missing_ok=True)
+    return data
+
+
+_SIZE_RE = re.compile(r"^(\d+(?:\.\d+)?)\s*([kmg]b?)$")
+_TIME_RE = re.compile(r"^(\d+(?:\.\d+)?)\s*(s|sec|m|min|h|hr)s?$")
+
+_SIZE_MULTIPLIERS = {
+    "k": 1024,
+    "kb": 1024,
+    "m": 1024**2,
+    "mb": 1024**2,
+    "g": 1024**3,
+    "gb": 1024**3,
+}
+_TIME_MULTIPLIERS = {"s": 1, "sec": 1, "m": 60, "min": 60, "h": 3600, "hr": 3600}
+
 
 def parse_size(value: int | str) -> int:
     """Converts human-readable size strings (e.g., '100MB') to bytes."""
     if isinstance(value, int):
         return value
-    match = re.match(r"^(\d+(?:\.\d+)?)\s*([kmg]b?)$", str(value).strip().lower())
+    match = _SIZE_RE.match(str(value).strip().lower())
     if not match:
         raise ValueError(f"Invalid size format '{value}'")
     num, unit = float(match.group(1)), match.group(2)
-    multiplier = {
-        "k": 1024,
-        "kb": 1024,
-        "m": 1024**2,
-        "mb": 1024**2,
-        "g": 1024**3,
-        "gb": 1024**3,
-    }
-    return int(num * multiplier[unit])
+    return int(num * _SIZE_MULTIPLIERS[unit])
 
 
 def parse_time(value: int | str) -> int:
     """Converts human-readable time strings (e.g., '1hr', '30m') to seconds."""
     if isinstance(value, int):
         return value
-    match = re.match(
-        r"^(\d+(?:\.\d+)?)\s*(s|sec|m|min|h|hr)s?$", str(value).strip().lower()
-    )
+    match = _TIME_RE.match(str(value).strip().lower())
     if not match:
         raise ValueError(f"Invalid time format '{value}'")
     num, unit = float(match.group(1)), match.group(2)
-    multiplier = {"s": 1, "sec": 1, "m": 60, "min": 60, "h": 3600, "hr": 3600}
-    return int(num * multiplier[unit])
+    return int(num * _TIME_MULTIPLIERS[unit])
 
 
 @dataclass
@@ -104,20 +213,18 @@ class DaemonConfig:
     eco_mode_percent: int = 20
     preset: str | None = None
 
+    # Preset name -> (commit_interval, push_interval), in seconds.
+    _PRESETS: ClassVar[dict[str, tuple[int, int]]] = {
+        "paranoid": (300, 300),  # 5 mins / 5 mins
+        "aggressive": (600, 600),  # 10 mins / 10 mins
+        "balanced": (900, 3600),  # 15 mins / 1 hour
+        "lazy": (3600, 14400),  # 1 hour / 4 hours
+    }
+
     def apply_preset(self) -> None:
         """Overwrites intervals based on the selected preset."""
-        if self.preset == "paranoid":
-            self.commit_interval = 300  # 5 mins
-            self.push_interval = 300  # 5 mins
-        elif self.preset == "aggressive":
-            self.commit_interval = 600  # 10 mins
-            self.push_interval = 600  # 10 mins
-        elif self.preset == "balanced":
-            self.commit_interval = 900  # 15 mins
-            self.push_interval = 3600  # 1 hour
-        elif self.preset == "lazy":
-            self.commit_interval = 3600  # 1 hour
-            self.push_interval = 14400  # 4 hours
+        if self.preset and (intervals := self._PRESETS.get(self.preset)):
+            self.commit_interval, self.push_interval = intervals
 
 
 @dataclass
@@ -136,51 +243,114 @@ class Config:
     files: FilesConfig = field(default_factory=FilesConfig)
     daemon: DaemonConfig = field(default_factory=DaemonConfig)
 
-    # Cache for the base global configuration
-    _global_cache: "Config | None" = None
+    # Cache for the base global configuration, tagged with its file signature.
+    _global_cache: ClassVar[tuple[FileSignature | None, "Config"] | None] = None
+
+    # Merged per-repository configurations, keyed by repo and local file signatures.
+    _load_cache: ClassVar[dict[tuple[Any, ...], "Config"]] = {}
+
+    # Guards both caches so that concurrent backup workers can load safely.
+    _cache_lock: ClassVar[threading.Lock] = threading.Lock()
 
     @classmethod
     def load(cls, repo_path: Path | None = None) -> "Config":
         """Loads and merges configuration from defaults, global, and local sources.
 
+        Parsed results are cached and reused until the size or mtime of one of
+        the contributing files changes. Each call returns an independent copy,
+        and the method is safe to call from multiple threads.
+
         Args:
             repo_path (Path | None): The repository root to search for local config.
 
         Returns:
             Config: The fully merged configuration object.
         """
-        # 1. Load or Retrieve Global Config
-        if cls._global_cache is None:
-            instance = cls()
-            if CONFIG_FILE.exists():
-                instance._merge_from_file(CONFIG_FILE)
-            cls._global_cache = instance
-
-        # Start with a copy of the cached global config
-        instance = replace(cls._global_cache)
-
-        # 2. Load Local Config (if applicable)
+        # Stat every candidate file before taking the lock.
+        global_sig = _file_signature(CONFIG_FILE)
+        local_toml = pyproject = None
+        local_sig = pyproject_sig = None
         if repo_path:
             local_toml = repo_path / "pulsar.toml"
             pyproject = repo_path / "pyproject.toml"
+            local_sig = _file_signature(local_toml)
+            pyproject_sig = None if local_sig else _file_signature(pyproject)
+
+        with cls._cache_lock:
+            # 1. Load or Retrieve Global Config
+            if cls._global_cache is None or cls._global_cache[0] != global_sig:
+                instance = cls()
+                if global_sig:
+                    instance._merge_from_file(CONFIG_FILE, signature=global_sig)
+                cls._global_cache = (global_sig, instance)
+                # Merged entries were derived from the previous global layer.
+                cls._load_cache.clear()
+
+            base = cls._global_cache[1]
+            if not repo_path:
+                return base._copy()
+
+            # 2. Load Local Config (if applicable)
+            key = (str(repo_path), local_sig, pyproject_sig)
+            cached = cls._load_cache.get(key)
+            if cached is None:
+                cached = base._copy()
+                if local_sig and local_toml:
+                    cached._merge_from_file(local_toml, signature=local_sig)
+                elif pyproject_sig and pyproject:
+                    cached._merge_from_file(
+                        pyproject, section="tool.pulsar", signature=pyproject_sig
+                    )
+
+                if len(cls._load_cache) >= _LOAD_CACHE_SIZE:
+                    # Evict the oldest entry (dicts preserve insertion order).
+                    del cls._load_cache[next(iter(cls._load_cache))]
+                cls._load_cache[key] = cached
+
+            return cached._copy()
+
+    def _copy(self) -> "Config":
+        """Returns a copy that shares no mutable state with this instance.
 
-            if local_toml.exists():
-                instance._merge_from_file(local_toml)
-            elif pyproject.exists():
-                instance._merge_from_file(pyproject, section="tool.pulsar")
-
-        return instance
-
-    def _merge_from_file(self, path: Path, section: str | None = None) -> None:
+        Returns:
+            Config: A copy with every section (and the ignore list) duplicated.
+        """
+        return replace(
+            self,
+            core=replace(self.core),
+            limits=replace(self.limits),
+            files=replace(self.files, ignore=list(self.files.ignore)),
+            daemon=replace(self.daemon),
+        )
+
+    def _merge_from_file(
+        self,
+        path: Path,
+        section: str | None = None,
+        signature: FileSignature | None = None,
+    ) -> None:
         """Parses a TOML file and merges it into the current instance.
 
+        Missing and empty files are skipped without being opened.
+
         Args:
             path (Path): Path to the TOML file.
             section (str | None): Dot-separated section path (e.g., 'tool.pulsar').
+            signature (FileSignature | None): The file's signature if the caller
+                has already stat'ed it, to avoid a second stat.
         """
         try:
-            with open(path, "rb") as f:
-                data = tomllib.load(f)
+            if signature is None:
+                try:
+                    st = os.stat(path)
+                except FileNotFoundError:
+                    return
+                signature = (str(path), st.st_mtime_ns, st.st_size)
+
+            path_str, mtime_ns, size = signature
+            if size == 0:
+                return
+            data = _load_toml_cached(path_str, mtime_ns, size)
 
             if section:
                 for key in section.split("."):
@@ -203,8 +373,10 @@ class Config:
                 self.daemon.apply_preset()
             if "files" in data:
                 # Extract ignore list to prevent it from being overwritten during dataclass update
-                new_ignores = data["files"].pop("ignore", [])
-                self.files = self._update_dataclass("files", self.files, data["files"])
+                # (copied first, since the parsed document is shared via the cache).
+                files_data = dict(data["files"])
+                new_ignores = files_data.pop("ignore", [])
+                self.files = self._update_dataclass("files", self.files, files_data)
                 if new_ignores:
                     self.files.ignore.extend(new_ignores)
                     self.files.ignore = list(dict.fromkeys(self.files.ignore))
@@ -217,11 +389,11 @@ class Config:
     @staticmethod
     def _update_dataclass(section_name: str, instance: Any, updates: dict) -> Any:
         """Updates a dataclass, warning on invalid keys and parsing human-readable formats."""
-        valid_keys = instance.__dataclass_fields__.keys()
+        valid_keys = _field_names(instance.__class__)
         filtered_updates = {}
 
         # 1. Catch and warn about typos / unknown keys
-        invalid_keys = set(updates.keys()) - set(valid_keys)
+        invalid_keys = updates.keys() - valid_keys
         if invalid_keys:
             logger.warning(
                 f"Unknown config keys in [{section_name}]: {', '.join(invalid_keys)}. Ignoring."
@@ -245,4 +417,6 @@ class Config:
                     f"Config error in [{section_name}].{k}: {e}. Falling back to default."
                 )
 
+        if not filtered_updates:
+            return instance
         return replace(instance, **filtered_updates)
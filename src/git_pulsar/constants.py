@@ -1,3 +1,4 @@
+import functools
 import os
 from pathlib import Path
 
@@ -28,9 +29,6 @@ _BASE_STATE = Path(_XDG_STATE) if _XDG_STATE else Path.home() / ".local/state"
 STATE_DIR = _BASE_STATE / "git-pulsar"
 """Path: The directory for runtime state data (logs, registry)."""
 
-# Ensure state directory exists immediately upon module import.
-STATE_DIR.mkdir(parents=True, exist_ok=True)
-
 REGISTRY_FILE = STATE_DIR / "registry"
 """Path: The file path storing the list of registered repositories."""
 
@@ -44,6 +42,9 @@ CONFIG_DIR: Path = Path.home() / ".config/git-pulsar"
 CONFIG_FILE: Path = CONFIG_DIR / "config.toml"
 """Path: The main configuration file path."""
 
+CONFIG_CACHE_FILE: Path = STATE_DIR / "config.json"
+"""Path: A JSON copy of the parsed global configuration, keyed by its mtime."""
+
 MACHINE_ID_FILE: Path = CONFIG_DIR / "machine_id"
 """Path: The file path storing the unique machine identifier."""
 
@@ -51,7 +52,7 @@ MACHINE_NAME_FILE: Path = CONFIG_DIR / "machine_name"
 """Path: The file path storing the user-defined human-readable name."""
 
 # --- Git / Logic Constants ---
-DEFAULT_IGNORES = [
+DEFAULT_IGNORES: tuple[str, ...] = (
     "__pycache__/",
     "*.ipynb_checkpoints",
     "*.pdf",
@@ -59,21 +60,34 @@ DEFAULT_IGNORES = [
     "*.log",
     ".DS_Store",
     ".venv/",
-]
-"""list[str]: Default file patterns added to .gitignore during repository setup."""
-
-GIT_LOCK_FILES = [
-    "MERGE_HEAD",
-    "REBASE_HEAD",
-    "CHERRY_PICK_HEAD",
-    "BISECT_LOG",
-    "rebase-merge",
-    "rebase-apply",
-]
+)
+"""tuple[str, ...]: Default file patterns added to .gitignore during repository setup."""
+
+GIT_LOCK_FILES: frozenset[str] = frozenset(
+    {
+        "MERGE_HEAD",
+        "REBASE_HEAD",
+        "CHERRY_PICK_HEAD",
+        "BISECT_LOG",
+        "rebase-merge",
+        "rebase-apply",
+    }
+)
 """
-list[str]: Git internal files indicating an
+frozenset[str]: Git internal files indicating an
 active state (merge/rebase) that blocks backups.
 """
 
 PID_FILE = REGISTRY_FILE.parent / "daemon.pid"
 """Path: The file path storing the daemon's process ID."""
+
+
+@functools.cache
+def ensure_state_dir() -> None:
+    """Creates the state directory on first use.
+
+    Called by writers of state files rather than at import time, so that commands
+    which never touch state avoid the filesystem calls. Memoized, so repeated
+    calls are free.
+    """
+    STATE_DIR.mkdir(parents=True, exist_ok=True)
@@ -1,89 +1,181 @@
 import atexit
-import datetime
+import errno
+import functools
 import logging
 import os
-import signal
+import re
+import selectors
 import socket
 import subprocess
 import sys
+import threading
 import time
-from collections.abc import Iterator
-from contextlib import contextmanager
+from collections import deque
+from concurrent.futures import FIRST_COMPLETED, Future, ThreadPoolExecutor, wait
 from logging.handlers import RotatingFileHandler
 from pathlib import Path
-from types import FrameType
-
-from rich.console import Console
+from typing import TYPE_CHECKING
 
 from . import ops, system
 from .config import Config
 from .constants import (
     APP_NAME,
+    BACKUP_NAMESPACE,
     GIT_LOCK_FILES,
     LOG_FILE,
     PID_FILE,
     REGISTRY_FILE,
+    ensure_state_dir,
 )
 from .git_wrapper import GitRepo
 from .system import get_system
 
+if TYPE_CHECKING:
+    from rich.console import Console
+
 SYSTEM = get_system()
 
 logger = logging.getLogger(APP_NAME)
 logger.setLevel(logging.INFO)
 
-console = Console()
-err_console = Console(stderr=True)
 
+@functools.cache
+def _console() -> "Console":
+    """Creates the interactive console on first use.
+
+    Background passes only log, so they never construct it.
+
+    Returns:
+        Console: The shared rich console.
+    """
+    from rich.console import Console
 
-@contextmanager
-def temporary_index(repo_path: Path) -> Iterator[dict[str, str]]:
-    """Context manager for creating an isolated git index environment.
+    return Console()
 
-    This allows the daemon to stage and commit files without interfering with the
-    user's actual git index or staging area.
+
+def __getattr__(name: str) -> "Console":
+    """Resolves the `console` module attribute lazily (PEP 562).
+
+    Args:
+        name (str): The attribute being looked up.
+
+    Returns:
+        Console: The shared rich console, for `name == "console"`.
+
+    Raises:
+        AttributeError: For any other name.
+    """
+    if name == "console":
+        return _console()
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+
+
+# Remote connectivity probe: ports tried in parallel, shared deadline, cache TTL.
+REACHABILITY_PORTS = (443, 22)
+REACHABILITY_TIMEOUT = 3.0
+REACHABILITY_TTL = 60.0
+
+# Backup retention enforced by the weekly maintenance pass.
+PRUNE_RETENTION_DAYS = 30
+
+# Background passes back up repos concurrently; each gets a bounded wait,
+# measured from the moment that repo starts.
+BACKUP_WORKERS = 8
+REPO_TIMEOUT = 5.0
+
+# Hard limit per git call from a worker. Timed-out futures are abandoned, not
+# killed, so this is what stops a stalled mount from outliving the pass.
+GIT_TIMEOUT = 60.0
+
+# Battery readings are shared by the skip and eco-mode checks of a pass.
+BATTERY_TTL = 5.0
+
+# Last battery reading: (monotonic time of read, (percent, plugged)).
+_BATTERY_CACHE: tuple[float, tuple[int, bool]] | None = None
+_BATTERY_LOCK = threading.Lock()
+
+# Recent reachability results: host -> (monotonic time of probe, reachable).
+_REACHABILITY_CACHE: dict[str, tuple[float, bool]] = {}
+
+# Per-host probe locks, so concurrent backups sharing a host probe it once.
+_REACHABILITY_LOCKS: dict[str, threading.Lock] = {}
+
+# Serializes registry rewrites from concurrent backup workers.
+_REGISTRY_LOCK = threading.Lock()
+
+# Host of a remote URL: either scheme://[user@]host or scp-style user@host:path.
+_REMOTE_HOST_RE = re.compile(
+    r"^(?:[A-Za-z][A-Za-z0-9+.-]*://(?:[^@/]*@)?|[^@/:]+@)(\[[^\]]+\]|[^:/]+)"
+)
+
+# Parsed remote hosts: (repo, remote) -> (.git/config mtime_ns, host).
+_REMOTE_HOST_CACHE: dict[tuple[str, str], tuple[int, str | None]] = {}
+
+# Usual system gitconfig locations (distro packages, /usr/local, Homebrew).
+_SYSTEM_GITCONFIGS = (
+    "/etc/gitconfig",
+    "/usr/local/etc/gitconfig",
+    "/opt/homebrew/etc/gitconfig",
+)
+
+
+def _has_stale_backups(repo_path: Path, days: int) -> bool:
+    """Checks whether any backup ref is older than the retention period.
+
+    One `for-each-ref` call lists every backup commit date, which lets the
+    maintenance pass skip repos with nothing to prune.
 
     Args:
         repo_path (Path): The path to the repository.
+        days (int): The retention period in days.
 
-    Yields:
-        dict[str, str]: A dictionary containing the modified environment variables.
+    Returns:
+        bool: True if a stale ref exists or the repository could not be opened
+              (so that prune_backups can report the underlying error).
     """
-    temp_index = repo_path / ".git" / "pulsar_index"
-    env = os.environ.copy()
-    env["GIT_INDEX_FILE"] = str(temp_index)
+    cutoff = time.time() - days * 86400
     try:
-        yield env
-    finally:
-        if temp_index.exists():
-            temp_index.unlink()
+        repo = GitRepo(repo_path)
+    except Exception as e:
+        logger.debug(f"Could not open {repo_path}: {e}")
+        return True
+
+    stamps = repo.get_commit_timestamps(f"refs/heads/{BACKUP_NAMESPACE}/")
+    return any(ts < cutoff for ts in stamps.values())
 
 
 def run_maintenance(repos: list[str]) -> None:
     """Checks if weekly maintenance (pruning old backups) is required and runs it.
 
     Args:
-        repos (list[str]): A list of registered repository paths.
+        repos (list[str]): The registered repository paths, already deduplicated.
     """
     # Track the last prune time in the registry directory.
     state_file = REGISTRY_FILE.parent / "last_prune"
 
     # Enforce a 7-day interval.
-    if state_file.exists():
-        age = time.time() - state_file.stat().st_mtime
-        if age < 7 * 86400:
+    try:
+        if time.time() - state_file.stat().st_mtime < 7 * 86400:
             return
+    except FileNotFoundError:
+        pass  # Never pruned before.
 
-    logger.info("MAINTENANCE: Running weekly prune (30d retention)...")
+    logger.info(
+        f"MAINTENANCE: Running weekly prune ({PRUNE_RETENTION_DAYS}d retention)..."
+    )
 
-    for repo_str in set(repos):
+    for repo_str in repos:
+        repo_path = Path(repo_str)
+        if not _has_stale_backups(repo_path, PRUNE_RETENTION_DAYS):
+            continue
         try:
-            ops.prune_backups(30, Path(repo_str))
+            ops.prune_backups(PRUNE_RETENTION_DAYS, repo_path)
         except Exception as e:
             logger.error(f"PRUNE ERROR {repo_str}: {e}")
 
     # Update the timestamp for the next cycle.
     try:
+        ensure_state_dir()
         state_file.touch()
     except OSError as e:
         logger.error(f"MAINTENANCE ERROR: Could not update state file: {e}")
@@ -92,7 +184,8 @@ def run_maintenance(repos: list[str]) -> None:
 def get_remote_host(repo_path: Path, remote_name: str) -> str | None:
     """Extracts the hostname from a git remote URL.
 
-    Supports both SSH (git@...) and HTTPS (https://...) formats.
+    Supports both SSH (git@...) and HTTPS (https://...) formats. Results are
+    cached per repository and remote until `.git/config` is modified.
 
     Args:
         repo_path (Path): The local path to the repository.
@@ -102,25 +195,212 @@ def get_remote_host(repo_path: Path, remote_name: str) -> str | None:
         str | None: The hostname (e.g., 'github.com') or None if parsing fails.
     """
     try:
-        url = subprocess.check_output(
-            ["git", "remote", "get-url", remote_name], cwd=repo_path, text=True
-        ).strip()
-
-        # Handle SSH: git@github.com:user/repo.git
-        if "@" in url:
-            return url.split("@")[1].split(":")[0]
-        # Handle HTTPS: https://github.com/user/repo.git
-        if "://" in url:
-            return url.split("://")[1].split("/")[0]
+        config_mtime: int | None = os.stat(repo_path / ".git" / "config").st_mtime_ns
+    except OSError:
+        config_mtime = None
+
+    key = (str(repo_path), remote_name)
+    cached = _REMOTE_HOST_CACHE.get(key)
+    if config_mtime is not None and cached and cached[0] == config_mtime:
+        return cached[1]
+
+    host = _read_remote_host(repo_path, remote_name)
+    if config_mtime is not None:
+        _REMOTE_HOST_CACHE[key] = (config_mtime, host)
+    return host
+
+
+def _read_config_url(repo_path: Path, remote_name: str) -> str | None:
+    """Reads a remote URL straight from `.git/config`, without spawning git.
+
+    Only the plain `[remote "<name>"] url = ...` layout is handled. If this
+    config, or the global or system config, could rewrite or extend it
+    (`insteadOf`, includes), None is returned so that the caller defers to git
+    itself.
+
+    Args:
+        repo_path (Path): The local path to the repository.
+        remote_name (str): The name of the remote (e.g., 'origin').
+
+    Returns:
+        str | None: The first configured URL, or None if it could not be read.
+    """
+    try:
+        text = (repo_path / ".git" / "config").read_text()
+    except (OSError, UnicodeDecodeError):
+        return None  # Missing, or .git is a gitfile (worktree, submodule).
+
+    if _may_rewrite_urls(text) or _user_config_rewrites_urls():
+        return None
+
+    header = f'[remote "{remote_name}"]'
+    in_section = False
+    for raw_line in text.splitlines():
+        line = raw_line.strip()
+        if line.startswith("["):
+            in_section = line == header
+        elif in_section:
+            key, sep, value = line.partition("=")
+            if sep and key.strip().lower() == "url":
+                return value.strip().strip('"') or None
+    return None
+
+
+def _may_rewrite_urls(text: str) -> bool:
+    """Checks a gitconfig body for settings that can change a remote's URL.
+
+    Args:
+        text (str): The contents of a gitconfig file.
+
+    Returns:
+        bool: True if it has `insteadOf` rules or includes.
+    """
+    lowered = text.lower()
+    return "insteadof" in lowered or "[include" in lowered
+
+
+@functools.cache
+def _user_config_rewrites_urls() -> bool:
+    """Checks whether the global or system gitconfig can change remote URLs.
+
+    Git applies `url.<base>.insteadOf` rules from every config level, so a
+    repository's own `.git/config` is not enough to know its effective URL. The
+    files are read once per process.
+
+    Returns:
+        bool: True if any global or system config (or config injected through
+              the environment) may rewrite URLs, or could not be read.
+    """
+    env = os.environ
+    if "GIT_CONFIG_COUNT" in env or "GIT_CONFIG_PARAMETERS" in env:
+        return True
+
+    if "GIT_CONFIG_GLOBAL" in env:
+        paths = [env["GIT_CONFIG_GLOBAL"]]
+    else:
+        home = os.path.expanduser("~")
+        xdg = env.get("XDG_CONFIG_HOME") or os.path.join(home, ".config")
+        paths = [os.path.join(home, ".gitconfig"), os.path.join(xdg, "git", "config")]
+    if not env.get("GIT_CONFIG_NOSYSTEM"):
+        if "GIT_CONFIG_SYSTEM" in env:
+            paths.append(env["GIT_CONFIG_SYSTEM"])
+        else:
+            paths.extend(_SYSTEM_GITCONFIGS)
+
+    for path in paths:
+        try:
+            text = Path(path).read_text(errors="replace")
+        except FileNotFoundError:
+            continue
+        except OSError:
+            return True  # Unreadable: let git work out the URL.
+        if _may_rewrite_urls(text):
+            return True
+    return False
+
+
+def _read_remote_host(repo_path: Path, remote_name: str) -> str | None:
+    """Looks up a remote URL and parses out its hostname.
+
+    The URL is read from `.git/config` directly when possible; otherwise
+    `git remote get-url` is asked.
+
+    Args:
+        repo_path (Path): The local path to the repository.
+        remote_name (str): The name of the remote (e.g., 'origin').
+
+    Returns:
+        str | None: The hostname (e.g., 'github.com') or None if parsing fails.
+    """
+    try:
+        url = _read_config_url(repo_path, remote_name)
+        if url is None:
+            url = subprocess.check_output(
+                ["git", "remote", "get-url", remote_name],
+                cwd=repo_path,
+                text=True,
+                timeout=GIT_TIMEOUT,
+            ).strip()
+
+        # git@github.com:user/repo.git, https://github.com/user/repo.git, ...
+        # Local paths and file:// URLs have no host and don't match.
+        if match := _REMOTE_HOST_RE.match(url):
+            return match.group(1).strip("[]")
         return None
     except Exception as e:
         logger.debug(f"Failed to parse remote host for '{remote_name}': {e}")
         return None
 
 
+def _probe_ports(host: str, ports: tuple[int, ...], timeout: float) -> bool:
+    """Attempts TCP connections to several ports at once.
+
+    The first resolved address of each family (IPv4 and IPv6) is tried, so a
+    host still answers when one family is unroutable locally. All connections
+    are started non-blocking and awaited together with a single shared
+    deadline, so an unreachable host costs one timeout rather than one per
+    address and port. Uses the platform's best selector (epoll/kqueue), which,
+    unlike `select()`, is not limited to descriptors below FD_SETSIZE.
+
+    Args:
+        host (str): The hostname to connect to.
+        ports (tuple[int, ...]): The ports to try.
+        timeout (float): Seconds to wait for any connection to complete.
+
+    Returns:
+        bool: True as soon as any port accepts a connection, False otherwise.
+    """
+    try:
+        infos = socket.getaddrinfo(host, None, type=socket.SOCK_STREAM)
+    except OSError:
+        return False
+
+    # (family, type, proto, canonname, sockaddr); keep one address per family.
+    targets: dict[int, tuple] = {}
+    for info in infos:
+        targets.setdefault(info[0], info[4])
+
+    socks: list[socket.socket] = []
+    with selectors.DefaultSelector() as sel:
+        try:
+            for family, sockaddr in targets.items():
+                for port in ports:
+                    try:
+                        sock = socket.socket(family, socket.SOCK_STREAM)
+                    except OSError:
+                        break  # Family unsupported here (e.g. IPv6 disabled).
+                    socks.append(sock)
+                    sock.setblocking(False)
+                    # IPv6 addresses carry flow info and scope id after the port.
+                    err = sock.connect_ex((sockaddr[0], port, *sockaddr[2:]))
+                    if err == 0:
+                        return True
+                    if err in (errno.EINPROGRESS, errno.EWOULDBLOCK):
+                        sel.register(sock, selectors.EVENT_WRITE, sock)
+
+            deadline = time.monotonic() + timeout
+            while sel.get_map():
+                remaining = deadline - time.monotonic()
+                if remaining <= 0:
+                    break
+                for key, _ in sel.select(remaining):
+                    sock = key.data
+                    if sock.getsockopt(socket.SOL_SOCKET, socket.SO_ERROR) == 0:
+                        return True
+                    sel.unregister(sock)
+            return False
+        finally:
+            for sock in socks:
+                sock.close()
+
+
 def is_remote_reachable(host: str) -> bool:
     """Performs a quick TCP connectivity check on the remote host.
 
+    Results are cached for `REACHABILITY_TTL` seconds so that repositories
+    sharing a host (e.g. github.com) are probed once per daemon pass. Workers
+    that miss the cache at the same time wait on a single in-flight probe.
+
     Args:
         host (str): The hostname to check.
 
@@ -130,15 +410,22 @@ def is_remote_reachable(host: str) -> bool:
     if not host:
         return False  # Implicitly offline if host is unknown.
 
-    for port in [443, 22]:
-        try:
-            # 3 second timeout is sufficient for a local network
-            # or decent internet connection.
-            with socket.create_connection((host, port), timeout=3):
-                return True
-        except OSError:
-            continue
-    return False
+    cached = _REACHABILITY_CACHE.get(host)
+    if cached and time.monotonic() - cached[0] < REACHABILITY_TTL:
+        return cached[1]
+
+    with _REACHABILITY_LOCKS.setdefault(host, threading.Lock()):
+        # Another worker may have finished probing while we waited.
+        now = time.monotonic()
+        cached = _REACHABILITY_CACHE.get(host)
+        if cached and now - cached[0] < REACHABILITY_TTL:
+            return cached[1]
+
+        # 3 second timeout is sufficient for a local network
+        # or decent internet connection.
+        reachable = _probe_ports(host, REACHABILITY_PORTS, REACHABILITY_TIMEOUT)
+        _REACHABILITY_CACHE[host] = (now, reachable)
+    return reachable
 
 
 def is_repo_busy(repo_path: Path, interactive: bool = False) -> bool:
@@ -156,35 +443,41 @@ def is_repo_busy(repo_path: Path, interactive: bool = False) -> bool:
     """
     git_dir = repo_path / ".git"
 
+    # List the git directory once instead of probing each lock file.
+    try:
+        with os.scandir(git_dir) as entries:
+            names = {entry.name for entry in entries}
+    except OSError:
+        return False  # Missing, or a gitfile rather than a directory.
+
     # 1. Check for operational locks (e.g., MERGE_HEAD).
-    for f in GIT_LOCK_FILES:
-        if (git_dir / f).exists():
-            return True
+    if not GIT_LOCK_FILES.isdisjoint(names):
+        return True
 
     # 2. Check for index.lock (Race Condition Handler).
-    lock_file = git_dir / "index.lock"
-    if lock_file.exists():
-        # A. Check for stale lock (> 24 hours).
+    if "index.lock" in names:
+        lock_file = git_dir / "index.lock"
+        # One stat both confirms the lock still exists and dates it.
         try:
-            mtime = lock_file.stat().st_mtime
-            age_hours = (time.time() - mtime) / 3600
-            if age_hours > 24:
-                msg = f"Stale lock detected in {repo_path.name} ({age_hours:.1f}h old)."
-                logger.warning(msg)
-                if interactive:
-                    console.print(
-                        f"[bold yellow]WARNING:[/bold yellow] {msg}\n   "
-                        f"Run 'rm {lock_file}' to fix."
-                    )
-                else:
-                    SYSTEM.notify("Pulsar Warning", f"Stale lock in {repo_path.name}")
-                return True
+            mtime = os.stat(lock_file).st_mtime
         except OSError:
-            pass  # File vanished (race resolved).
-
-        # B. Fail fast if lock still exists
-        if lock_file.exists():
-            return True
+            return False  # File vanished (race resolved).
+
+        # Stale lock (> 24 hours): warn the user, still treat as busy.
+        age_hours = (time.time() - mtime) / 3600
+        if age_hours > 24:
+            msg = f"Stale lock detected in {repo_path.name} ({age_hours:.1f}h old)."
+            logger.warning(msg)
+            if interactive:
+                _console().print(
+                    f"[bold yellow]WARNING:[/bold yellow] {msg}\n   "
+                    f"Run 'rm {lock_file}' to fix."
+                )
+            else:
+                SYSTEM.notify("Pulsar Warning", f"Stale lock in {repo_path.name}")
+
+        # Fail fast while the lock exists.
+        return True
 
     return False
 
@@ -192,57 +485,87 @@ def is_repo_busy(repo_path: Path, interactive: bool = False) -> bool:
 def prune_registry(original_path_str: str) -> None:
     """Removes a missing repository path from the registry file.
 
+    The registry is only rewritten (and fsynced) if its normalized contents
+    actually change.
+
     Args:
         original_path_str (str): The path string to remove.
     """
-    if not REGISTRY_FILE.exists():
-        return
-
     target = original_path_str.strip()
-    tmp_file = REGISTRY_FILE.with_suffix(".tmp")
+    # Unique per writer, so a CLI process pruning at the same time can't clobber it.
+    tmp_file = REGISTRY_FILE.with_name(
+        f"{REGISTRY_FILE.name}.{os.getpid()}.{threading.get_ident()}.tmp"
+    )
 
-    try:
-        # 1. Read existing registry.
-        with open(REGISTRY_FILE) as f:
-            lines = f.readlines()
-
-        # 2. Write valid lines to temp file.
-        with open(tmp_file, "w") as f:
-            for line in lines:
-                clean_line = line.strip()
-                if clean_line and clean_line != target:
-                    f.write(clean_line + "\n")
-            f.flush()
-            os.fsync(f.fileno())  # Force write to disk.
-
-        # 3. Atomic Swap.
-        os.replace(tmp_file, REGISTRY_FILE)
-
-        repo_name = Path(original_path_str).name
-        logger.info(f"PRUNED: {original_path_str} removed from registry.")
-        SYSTEM.notify("Backup Stopped", f"Removed missing repo: {repo_name}")
+    # Workers prune concurrently; serialize the read-modify-write so one
+    # removal can't resurrect a path another just dropped.
+    with _REGISTRY_LOCK:
+        try:
+            # 1. Read existing registry (raw bytes, decoded once as paths).
+            try:
+                with open(REGISTRY_FILE, "rb") as f:
+                    data = f.read()
+            except FileNotFoundError:
+                return
+
+            stripped = (line.strip() for line in os.fsdecode(data).splitlines())
+            lines = [line for line in stripped if line]
+            kept = [line for line in lines if line != target]
+            new_data = os.fsencode("".join(f"{line}\n" for line in kept))
+            if new_data == data:
+                return  # Target absent and nothing to tidy: skip the write + fsync.
+
+            # 2. Write valid lines to temp file.
+            with open(tmp_file, "wb") as f:
+                f.write(new_data)
+                f.flush()
+                os.fsync(f.fileno())  # Force write to disk.
+
+            # 3. Atomic Swap.
+            os.replace(tmp_file, REGISTRY_FILE)
+
+            if len(kept) != len(lines):
+                repo_name = Path(original_path_str).name
+                logger.info(f"PRUNED: {original_path_str} removed from registry.")
+                SYSTEM.notify("Backup Stopped", f"Removed missing repo: {repo_name}")
+
+        except OSError as e:
+            logger.error(f"ERROR: Could not prune registry. {e}")
+            tmp_file.unlink(missing_ok=True)
 
-    except OSError as e:
-        logger.error(f"ERROR: Could not prune registry. {e}")
-        if tmp_file.exists():
-            tmp_file.unlink()
+
+def _get_battery() -> tuple[int, bool]:
+    """Reads the battery state, reusing a reading up to `BATTERY_TTL` old.
+
+    The battery is machine-wide, so every repository in a pass (and both the
+    skip and eco-mode checks for each) can share one reading. On macOS that
+    saves a `pmset` call per check.
+
+    Returns:
+        tuple[int, bool]: The battery percentage and whether AC power is connected.
+    """
+    global _BATTERY_CACHE
+    with _BATTERY_LOCK:
+        now = time.monotonic()
+        if _BATTERY_CACHE and now - _BATTERY_CACHE[0] < BATTERY_TTL:
+            return _BATTERY_CACHE[1]
+        status = SYSTEM.get_battery()
+        _BATTERY_CACHE = (now, status)
+    return status
 
 
 def _should_skip(repo_path: Path, config: Config, interactive: bool) -> str | None:
     """Determines if the backup for a given repository should be skipped.
 
     Args:
-        repo_path (Path): The repository path.
+        repo_path (Path): The resolved repository path, known to exist.
         config (Config): The configuration instance for this repository.
         interactive (bool): Whether the session is interactive (CLI) or background.
 
     Returns:
         str | None: The reason for skipping, or None if backup should proceed.
     """
-    if not repo_path.exists():
-        return "Path missing"
-
-    if (repo_path / ".git" / "pulsar_paused").exists():
+    if os.path.lexists(os.path.join(repo_path, ".git", "pulsar_paused")):
         return "Paused by user"
 
     if not interactive:
@@ -250,7 +573,7 @@ def _should_skip(repo_path: Path, config: Config, interactive: bool) -> str | No
             return "System under load"
 
         # Check battery levels (don't drain battery on background tasks).
-        pct, plugged = SYSTEM.get_battery()
+        pct, plugged = _get_battery()
         # Uses config value instead of hardcoded '10'
         if not plugged and pct < config.daemon.min_battery_percent:
             return "Battery critical"
@@ -259,7 +582,11 @@ def _should_skip(repo_path: Path, config: Config, interactive: bool) -> str | No
 
 
 def _attempt_push(
-    repo: GitRepo, refspec: str, config: Config, interactive: bool
+    repo: GitRepo,
+    refspec: str,
+    config: Config,
+    interactive: bool,
+    base_env: dict[str, str] | None = None,
 ) -> None:
     """Attempts to push the backup reference to the remote.
 
@@ -270,9 +597,11 @@ def _attempt_push(
         refspec (str): The refspec to push (e.g., 'ref:ref').
         config (Config): The configuration instance for this repository.
         interactive (bool): Whether to output status to the console.
+        base_env (dict[str, str] | None, optional): Environment to extend.
+                                                    Defaults to os.environ.
     """
     # 1. Eco Mode Check.
-    percent, plugged = SYSTEM.get_battery()
+    percent, plugged = _get_battery()
     # Uses config value instead of hardcoded '20'
     if not plugged and percent < config.daemon.eco_mode_percent:
         logger.info(f"ECO MODE {repo.path.name}: Committed. Push skipped.")
@@ -287,16 +616,15 @@ def _attempt_push(
 
     # 3. Push Execution.
     try:
-        env = os.environ.copy()
-        env["GIT_SSH_COMMAND"] = "ssh -o BatchMode=yes"
+        env = {**(base_env or os.environ), "GIT_SSH_COMMAND": "ssh -o BatchMode=yes"}
         cmd = ["push", remote_name, refspec]
 
         if interactive:
-            with console.status(
+            with _console().status(
                 f"[bold blue]Pushing {repo.path.name}...[/bold blue]", spinner="dots"
             ):
                 repo._run(cmd, capture=True, env=env)
-            console.print(
+            _console().print(
                 f"[bold green]SUCCESS:[/bold green] {repo.path.name}: Pushed."
             )
         else:
@@ -305,52 +633,91 @@ def _attempt_push(
 
     except Exception as e:
         if interactive:
-            console.print(f"[bold red]PUSH ERROR {repo.path.name}:[/bold red] {e}")
+            _console().print(f"[bold red]PUSH ERROR {repo.path.name}:[/bold red] {e}")
         else:
             logger.error(f"PUSH ERROR {repo.path.name}: {e}")
 
 
-def _get_ref_timestamp(repo: GitRepo, ref: str) -> int:
-    """Gets the commit timestamp of a specific reference.
+def _get_ref_timestamps(repo: GitRepo, refs: list[str]) -> dict[str, int]:
+    """Gets the commit timestamps of several references with one git call.
 
     Args:
         repo (GitRepo): The repository instance.
-        ref (str): The reference to check.
+        refs (list[str]): The fully qualified references to check.
 
     Returns:
-        int: Unix timestamp of the commit, or 0 if ref does not exist.
+        dict[str, int]: Unix commit timestamp per reference, or 0 for references
+                        that do not exist.
     """
+    stamps = dict.fromkeys(refs, 0)
     try:
-        ts = repo._run(["log", "-1", "--format=%ct", ref])
-        return int(ts.strip())
+        output = repo._run(
+            ["for-each-ref", "--format=%(refname) %(committerdate:unix)", *refs]
+        )
     except Exception as e:
-        logger.debug(f"Could not get timestamp for {ref}: {e}")
-        return 0
+        logger.debug(f"Could not get timestamps for {refs}: {e}")
+        return stamps
+
+    for line in output.splitlines():
+        ref, _, ts = line.partition(" ")
+        # for-each-ref patterns also match deeper refs; keep exact names only.
+        if ref in stamps and ts.isdigit():
+            stamps[ref] = int(ts)
+    return stamps
+
+
+@functools.lru_cache(maxsize=256)
+def _remote_backup_ref(local_backup_ref: str, remote_name: str) -> str:
+    """Maps a local backup ref to its remote-tracking counterpart.
 
+    Memoized: the mapping is invariant for a given branch and remote.
 
-def run_backup(original_path_str: str, interactive: bool = False) -> None:
-    """Orchestrates the backup workflow for a single repository."""
-    repo_path = Path(original_path_str).resolve()
+    Args:
+        local_backup_ref (str): The local ref (e.g., 'refs/heads/wip/pulsar/...').
+        remote_name (str): The name of the remote (e.g., 'origin').
+
+    Returns:
+        str: The remote-tracking ref (e.g., 'refs/remotes/origin/wip/pulsar/...').
+    """
+    ref_suffix = local_backup_ref.removeprefix("refs/heads/")
+    return f"refs/remotes/{remote_name}/{ref_suffix}"
+
+
+def run_backup(
+    original_path_str: str,
+    interactive: bool = False,
+    base_env: dict[str, str] | None = None,
+) -> None:
+    """Orchestrates the backup workflow for a single repository.
+
+    Args:
+        original_path_str (str): The registered repository path.
+        interactive (bool, optional): Whether to output status to the console.
+                                      Defaults to False.
+        base_env (dict[str, str] | None, optional): Environment snapshot shared
+                                                    across a daemon pass.
+                                                    Defaults to os.environ.
+    """
+    try:
+        # A strict resolve stats the path anyway; a vanished repo fails here.
+        repo_path = Path(original_path_str).resolve(strict=True)
+    except (FileNotFoundError, NotADirectoryError):
+        prune_registry(original_path_str)
+        return
 
     # Load context-aware config (Global + Local)
     config = Config.load(repo_path)
 
     # Pass config to _should_skip
     if reason := _should_skip(repo_path, config, interactive):
-        if reason == "Path missing":
-            prune_registry(original_path_str)
-        elif reason == "System under load":
+        if reason == "System under load":
             pass
         else:
             logger.info(f"SKIPPED {repo_path.name}: {reason}")
         return
 
-    # Pass config to has_large_files (re-added safety check)
-    if ops.has_large_files(repo_path, config):
-        return
-
     try:
-        repo = GitRepo(repo_path)
+        repo = GitRepo(repo_path, timeout=GIT_TIMEOUT)
         current_branch = repo.current_branch()
         if not current_branch:
             return
@@ -362,7 +729,7 @@ def run_backup(original_path_str: str, interactive: bool = False) -> None:
 
             # Throttle checks to every 15 minutes (900 seconds) to prevent network thrashing
             if current_time - last_check_ts >= 900:
-                pct, plugged = SYSTEM.get_battery()
+                pct, plugged = _get_battery()
                 # Respect eco-mode: avoid spinning up the radio if battery is low
                 if plugged or pct >= config.daemon.eco_mode_percent:
                     remote_name = config.core.remote_name
@@ -391,75 +758,88 @@ def run_backup(original_path_str: str, interactive: bool = False) -> None:
         # --- COMMIT PHASE ---
         # Define Refs
         local_backup_ref = ops.get_backup_ref(current_branch)
-        ref_suffix = local_backup_ref.replace("refs/heads/", "")
-        remote_backup_ref = f"refs/remotes/{config.core.remote_name}/{ref_suffix}"
+        remote_backup_ref = _remote_backup_ref(
+            local_backup_ref, config.core.remote_name
+        )
+
+        # One lookup serves both phases; a fresh commit below is tracked directly.
+        stamps = _get_ref_timestamps(repo, [local_backup_ref, remote_backup_ref])
+        last_commit_ts = stamps[local_backup_ref]
+        last_push_ts = stamps[remote_backup_ref]
+        committed = False
 
-        last_commit_ts = _get_ref_timestamp(repo, local_backup_ref)
         time_since_commit = time.time() - last_commit_ts
 
         if time_since_commit >= config.daemon.commit_interval:
-            with temporary_index(repo_path) as env:
-                # Stage current working directory into temp index.
-                # Use wrapper method if available, or repo._run(["add", "."], env=env)
-                repo.add_all()
-                # Note: GitRepo.add_all() in wrapper doesn't accept env.
-                # Keeping manual run with env.
-                repo._run(["add", "."], env=env)
+            # Large-file safety check; only a pass that will snapshot needs it.
+            if ops.has_large_files(repo_path, config, timeout=GIT_TIMEOUT):
+                return
+
+            with repo.temporary_index(base_env):
+                # Stage current working directory into temp index only; the
+                # user's real index is never touched.
+                repo._run(["add", "."])
 
                 # Write Tree.
-                tree_oid = repo.write_tree(env=env)
+                tree_oid = repo.write_tree()
+
+                # Resolve both parents and the previous backup tree in one call.
+                prev_tree_rev = f"{local_backup_ref}^{{tree}}"
+                resolved = repo.rev_parse_many(
+                    [local_backup_ref, "HEAD", prev_tree_rev]
+                )
 
                 # Determine Parents (Synthetic Merge).
-                parents = []
-                if parent_backup := repo.rev_parse(local_backup_ref):
-                    parents.append(parent_backup)
-                if parent_head := repo.rev_parse("HEAD"):
-                    parents.append(parent_head)
+                parent_backup = resolved[local_backup_ref]
+                parents = [
+                    oid for oid in (parent_backup, resolved["HEAD"]) if oid is not None
+                ]
 
                 # Check for actual changes
-                should_commit = True
-                if parent_backup:
-                    prev_tree = repo._run(["rev-parse", f"{parent_backup}^{{tree}}"])
-                    if prev_tree == tree_oid:
-                        should_commit = False
+                should_commit = not (
+                    parent_backup and resolved[prev_tree_rev] == tree_oid
+                )
 
                 if should_commit:
-                    timestamp = datetime.datetime.now().strftime("%Y-%m-%d %H:%M:%S")
+                    # Local time, e.g. "2024-01-31 14:05:09".
+                    timestamp = time.strftime("%Y-%m-%d %H:%M:%S", time.localtime())
 
                     # Use wrapper method
                     commit_oid = repo.commit_tree(
                         tree=tree_oid,
                         parents=parents,
                         message=f"Shadow backup {timestamp}",
-                        env=env,
                     )
 
                     # Use wrapper method
                     repo.update_ref(local_backup_ref, commit_oid, parent_backup)
+                    committed = True
 
                     if interactive:
-                        console.print(f"[green]Committed {repo_path.name}[/green]")
+                        _console().print(f"[green]Committed {repo_path.name}[/green]")
 
         # --- PUSH PHASE ---
-        current_local_ts = _get_ref_timestamp(repo, local_backup_ref)
-        last_push_ts = _get_ref_timestamp(repo, remote_backup_ref)
-
         time_since_push = time.time() - last_push_ts
-        has_new_data = current_local_ts > last_push_ts
+        has_new_data = committed or last_commit_ts > last_push_ts
 
         if has_new_data and (
             time_since_push >= config.daemon.push_interval or interactive
         ):
             refspec = f"{local_backup_ref}:{local_backup_ref}"
             # Pass config to _attempt_push
-            _attempt_push(repo, refspec, config, interactive)
+            _attempt_push(repo, refspec, config, interactive, base_env)
 
     except Exception:
         logger.exception(f"CRITICAL {repo_path.name}: Backup iteration failed")
 
 
-def setup_logging(interactive: bool) -> None:
-    """Configures the logging subsystem."""
+def setup_logging(interactive: bool, config: Config) -> None:
+    """Configures the logging subsystem.
+
+    Args:
+        interactive (bool): Whether to log to stdout only (CLI) or also to file.
+        config (Config): The global configuration, loaded once by main().
+    """
     formatter = logging.Formatter(
         "[%(asctime)s] %(levelname)s: %(message)s", "%Y-%m-%d %H:%M:%S"
     )
@@ -471,12 +851,10 @@ def setup_logging(interactive: bool) -> None:
     logger.addHandler(stream_handler)
 
     if not interactive:
-        # Load fresh global config to get log limits
-        conf = Config.load()
-
+        ensure_state_dir()
         file_handler = RotatingFileHandler(
             LOG_FILE,
-            maxBytes=conf.limits.max_log_size,
+            maxBytes=config.limits.max_log_size,
             backupCount=5,
         )
         file_handler.setFormatter(formatter)
@@ -486,30 +864,30 @@ def setup_logging(interactive: bool) -> None:
 def main(interactive: bool = False) -> None:
     """The main daemon execution loop.
 
-    Processes all registered repositories, handles signals, and enforces timeouts.
+    Processes all registered repositories and enforces per-repo timeouts.
+    Background passes run up to `BACKUP_WORKERS` backups at once; interactive
+    passes run one at a time so console output stays in registry order. A repo
+    still running `REPO_TIMEOUT` seconds after it started is no longer waited
+    on, and stops counting against that limit so the repos behind it still run.
 
     Args:
         interactive (bool, optional): Whether to run a single pass (CLI 'now' command).
                                       Defaults to False.
     """
-    setup_logging(interactive)
+    # Global config is loaded once per pass; repos layer their own on top.
+    setup_logging(interactive, Config.load())
 
-    repos = [str(p) for p in system.get_registered_repos()]
+    # Deduplicate once, keeping registry order for a deterministic pass.
+    repos = list(dict.fromkeys(system.get_registered_paths()))
 
     if not repos:
         if interactive:
-            console.print(
+            _console().print(
                 "[yellow]Registry empty. Run 'git-pulsar' in "
                 "a repo to register it.[/yellow]"
             )
         return
 
-    # Set a timeout handler for stalled network mounts.
-    def timeout_handler(_signum: int, _frame: FrameType | None) -> None:
-        raise TimeoutError("Repo access timed out")
-
-    signal.signal(signal.SIGALRM, timeout_handler)
-
     # PID File Management.
     if not interactive:
         try:
@@ -521,16 +899,49 @@ def main(interactive: bool = False) -> None:
         except OSError as e:
             logger.warning(f"Could not write PID file: {e}")
 
-    for repo_str in set(repos):
-        try:
-            # 5 second timeout per repo to prevent hanging.
-            signal.alarm(5)
-            run_backup(repo_str, interactive=interactive)
-            signal.alarm(0)  # Disable alarm.
-        except TimeoutError:
-            logger.warning(f"TIMEOUT {repo_str}: Skipped (possible stalled mount).")
-        except Exception:
-            logger.exception(f"LOOP ERROR {repo_str}")
+    # Snapshot the environment once; per-call envs overlay a single key on it.
+    base_env = os.environ.copy()
+
+    workers = 1 if interactive else min(BACKUP_WORKERS, len(repos))
+    # Repos are only submitted when a slot is free, so each one starts (and its
+    # deadline starts counting) on submission. Threads beyond `workers` are only
+    # created to replace ones held by abandoned repos.
+    executor = ThreadPoolExecutor(max_workers=len(repos))
+    queued = deque(repos)
+    running: dict[Future[None], tuple[str, float]] = {}
+
+    while queued or running:
+        while queued and len(running) < workers:
+            repo_str = queued.popleft()
+            future = executor.submit(run_backup, repo_str, interactive, base_env)
+            running[future] = (repo_str, time.monotonic())
+
+        # Wake on the next finished repo or the earliest deadline, whichever first.
+        deadline = min(started for _, started in running.values()) + REPO_TIMEOUT
+        done, _ = wait(
+            running,
+            timeout=max(0.0, deadline - time.monotonic()),
+            return_when=FIRST_COMPLETED,
+        )
+        for future in done:
+            repo_str, _ = running.pop(future)
+            try:
+                future.result()
+            except Exception:
+                logger.exception(f"LOOP ERROR {repo_str}")
+
+        # Bounded wait per repo to prevent hanging on stalled network mounts.
+        now = time.monotonic()
+        for future, (repo_str, started) in list(running.items()):
+            if now - started >= REPO_TIMEOUT:
+                del running[future]
+                logger.warning(
+                    f"TIMEOUT {repo_str}: still running after {REPO_TIMEOUT}s "
+                    "(possible stalled mount); no longer waiting on it."
+                )
+
+    # Don't block on abandoned workers; GIT_TIMEOUT bounds their git calls.
+    executor.shutdown(wait=False)
 
     # Run maintenance tasks (pruning).
     run_maintenance(repos)
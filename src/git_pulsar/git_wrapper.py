@@ -1,12 +1,46 @@
 import logging
+import os
 import re
+import shutil
 import subprocess
+from collections.abc import Callable, Iterator, Mapping, Sequence
+from concurrent.futures import ThreadPoolExecutor
+from contextlib import contextmanager
 from pathlib import Path
+from typing import ClassVar
 
 from .constants import APP_NAME
 
 logger = logging.getLogger(APP_NAME)
 
+# Absolute path to git, resolved once, which skips a PATH search per call. On
+# Python 3.13+ subprocess can also take its posix_spawn fast path (no fork()
+# of this process), but only for an executable given with a directory and
+# without cwd=, so commands run as `git -C <repo> ...`. Earlier versions only
+# use posix_spawn with close_fds=False, which _run does not set.
+_GIT = shutil.which("git") or "git"
+
+# A full object name (SHA-1, or SHA-256 in sha256 repositories).
+_FULL_OID_RE = re.compile(r"\A(?:[0-9a-f]{40}|[0-9a-f]{64})\Z")
+
+# Subcommands that never move a ref or HEAD. Any other command run through
+# _run() may do so, and clears the rev_parse() cache first.
+_READ_ONLY_COMMANDS = frozenset(
+    {
+        "cat-file",
+        "commit-tree",
+        "diff",
+        "for-each-ref",
+        "log",
+        "ls-files",
+        "ls-tree",
+        "rev-parse",
+        "show",
+        "status",
+        "write-tree",
+    }
+)
+
 
 class GitRepo:
     """A wrapper around the Git command-line interface for a specific repository.
@@ -19,21 +53,119 @@ class GitRepo:
         path (Path): The file system path to the repository root.
     """
 
-    def __init__(self, path: Path):
+    # Paths already confirmed to hold a .git entry in this process.
+    _validated_paths: ClassVar[set[Path]] = set()
+
+    def __init__(self, path: Path, timeout: float | None = None):
         """Initializes the GitRepo instance.
 
         Args:
             path (Path): The path to the repository root directory.
+            timeout (float | None, optional): Seconds any single git command may
+                                              run before it is killed.
+                                              Defaults to None (no limit).
 
         Raises:
             ValueError: If the specified path does not contain a .git directory.
         """
         self.path = path
-        if not (self.path / ".git").exists():
-            raise ValueError(f"Not a git repository: {self.path}")
+        self.timeout = timeout
+        if self.path not in GitRepo._validated_paths:
+            if not (self.path / ".git").exists():
+                raise ValueError(f"Not a git repository: {self.path}")
+            GitRepo._validated_paths.add(self.path)
+
+        # Memoized result of current_branch(); cleared when HEAD is switched.
+        self._branch: str | None = None
+
+        # Environment applied to every git call inside temporary_index().
+        self._env: dict[str, str] | None = None
+
+        # Successful rev_parse() results; cleared by any ref-moving command.
+        self._rev_cache: dict[str, str] = {}
+
+    @staticmethod
+    def probe(path: Path) -> tuple[Path, str] | None:
+        """Checks for a repository and reads its current branch with one git call.
+
+        Runs `git rev-parse --show-toplevel --abbrev-ref HEAD`, which validates
+        the repository, finds its root, and names the branch together. A
+        repository without commits (unborn HEAD) needs a second
+        `git branch --show-current` call.
+
+        Args:
+            path (Path): The directory to inspect; any directory inside the work
+                         tree works.
+
+        Returns:
+            tuple[Path, str] | None: The work tree root and current branch name
+                                     (empty if HEAD is detached), or None if the
+                                     path is not inside a git work tree.
+
+        Raises:
+            FileNotFoundError: If the git executable is not installed.
+        """
+        res = subprocess.run(
+            [
+                _GIT,
+                "-C",
+                str(path),
+                "rev-parse",
+                "--show-toplevel",
+                "--abbrev-ref",
+                "HEAD",
+            ],
+            capture_output=True,
+            text=True,
+        )
+        lines = res.stdout.splitlines()
+        if not lines:
+            return None
+
+        root = Path(lines[0])
+        if res.returncode == 0 and len(lines) > 1:
+            return root, "" if lines[1] == "HEAD" else lines[1]
+
+        branch = subprocess.run(
+            [_GIT, "-C", str(path), "branch", "--show-current"],
+            capture_output=True,
+            text=True,
+        ).stdout.strip()
+        return root, branch
+
+    @staticmethod
+    def run_parallel[T](
+        calls: Sequence[Callable[[], T]], max_workers: int = 8
+    ) -> list[T]:
+        """Runs independent git queries concurrently.
+
+        Each call spends its time waiting on a git subprocess, which releases
+        the GIL, so N queries overlap instead of paying their latency in turn.
+        Only read-only methods are safe to combine here: commands that move
+        refs or touch the index must not race each other.
+
+        Args:
+            calls (Sequence[Callable[[], T]]): Zero-argument callables, typically
+                                               `functools.partial` over a
+                                               method.
+            max_workers (int, optional): Upper bound on concurrent git
+                                         processes. Defaults to 8.
+
+        Returns:
+            list[T]: The results, in the order of `calls`.
+        """
+        if not calls:
+            return []
+        with ThreadPoolExecutor(max_workers=min(len(calls), max_workers)) as pool:
+            return list(pool.map(lambda call: call(), calls))
 
     def _run(
-        self, args: list[str], capture: bool = True, env: dict | None = None
+        self,
+        args: list[str],
+        capture: bool = True,
+        env: dict | None = None,
+        input: str | None = None,
+        strip: bool = True,
     ) -> str:
         """Executes a Git command within the repository context.
 
@@ -42,54 +174,156 @@ class GitRepo:
             capture (bool, optional):   Whether to capture and return stdout.
                                         Defaults to True.
             env (Optional[dict], optional): Environment variables to pass to the
-                                            subprocess. Useful for manipulating
-                                            GIT_INDEX_FILE. Defaults to None.
+                                            subprocess. Defaults to the
+                                            temporary_index() environment
+                                            when one is active.
+            input (str | None, optional): Text to feed to the command's stdin.
+                                          Defaults to None.
+            strip (bool, optional): Whether to strip surrounding whitespace from
+                                    the output. NUL-delimited (-z) output must
+                                    keep it, as it can be part of a record.
+                                    Callers that split the output into lines
+                                    pass False to skip copying large outputs.
+                                    Defaults to True.
 
         Returns:
-            str:    The stripped stdout of the command if capture is True,
-                    otherwise an empty string.
+            str:    The stdout of the command (stripped if requested) if capture
+                    is True, otherwise an empty string.
 
         Raises:
-            RuntimeError: If the git command returns a non-zero exit code.
+            RuntimeError: If the git command returns a non-zero exit code or
+                          exceeds the instance timeout.
         """
-        logger.debug(f"Executing: git {' '.join(args)}")
+        # Runs for every git call; skip building the message unless it is shown.
+        if logger.isEnabledFor(logging.DEBUG):
+            logger.debug(f"Executing: git {' '.join(args)}")
+
+        if args[0] not in _READ_ONLY_COMMANDS:
+            self._rev_cache.clear()
 
         try:
             res = subprocess.run(
-                ["git", *args],
-                cwd=self.path,
+                [_GIT, "-C", str(self.path), *args],
                 capture_output=capture,
                 text=True,
                 check=True,
-                env=env,
+                env=env if env is not None else self._env,
+                timeout=self.timeout,
+                input=input,
             )
-            return res.stdout.strip() if capture else ""
+            if not capture:
+                return ""
+            return res.stdout.strip() if strip else res.stdout
         except subprocess.CalledProcessError as e:
             raise RuntimeError(f"Git error: {e.stderr or e}") from e
+        except subprocess.TimeoutExpired as e:
+            raise RuntimeError(f"Git timed out: git {args[0]} ({e.timeout}s)") from e
+
+    @contextmanager
+    def temporary_index(
+        self, base_env: Mapping[str, str] | None = None
+    ) -> Iterator[None]:
+        """Routes git calls through an isolated index for the duration of the block.
+
+        This allows the daemon to stage and commit files without interfering with
+        the user's actual git index or staging area. Every command run through
+        this instance inside the block picks up GIT_INDEX_FILE automatically.
+
+        The temporary index starts as a copy of the real one, so its cached stat
+        data lets `git add` rehash only files that changed rather than the whole
+        working tree.
+
+        Args:
+            base_env (Mapping[str, str] | None, optional): Environment to extend.
+                                                           Defaults to os.environ.
+
+        Yields:
+            None
+        """
+        git_dir = self.path / ".git"
+        temp_index = git_dir / "pulsar_index"
+        try:
+            # Git replaces the index via rename, so this never sees a partial file.
+            # copy2 keeps the index mtime, which git compares against entry
+            # mtimes to spot "racily clean" files that must be rehashed.
+            shutil.copy2(git_dir / "index", temp_index)
+        except OSError as e:
+            logger.debug(f"Starting from an empty backup index: {e}")
+            temp_index.unlink(missing_ok=True)
+
+        self._env = {**(base_env or os.environ), "GIT_INDEX_FILE": str(temp_index)}
+        try:
+            yield
+        finally:
+            self._env = None
+            temp_index.unlink(missing_ok=True)
 
     def current_branch(self) -> str:
         """Retrieves the name of the currently checked-out branch.
 
+        The result is cached for the lifetime of this instance and invalidated
+        when `checkout()` switches branches.
+
         Returns:
             str: The name of the current branch.
         """
-        return self._run(["branch", "--show-current"])
+        if self._branch is None:
+            self._branch = self._run(["branch", "--show-current"])
+        return self._branch
 
     def status_porcelain(self, path: str | None = None) -> list[str]:
         """Returns the porcelain (machine-readable) status of the repository.
 
+        Parses NUL-delimited `git status --porcelain -z` output, so paths with
+        newlines or leading spaces survive intact. The source path that follows
+        a rename or copy entry is dropped, giving one entry per change.
+
         Args:
             path (Optional[str], optional): A specific path to check status for.
                                             Defaults to None.
 
         Returns:
-            list[str]: A list of status lines returned by `git status --porcelain`.
+            list[str]: One `XY path` entry per changed or untracked path.
         """
-        cmd = ["status", "--porcelain"]
+        cmd = ["status", "--porcelain", "-z"]
         if path:
             cmd.append(path)
-        output = self._run(cmd)
-        return output.splitlines() if output else []
+        records = iter(self._run(cmd, strip=False).split("\0"))
+        entries = []
+        for record in records:
+            if not record:
+                continue
+            entries.append(record)
+            if "R" in record[:2] or "C" in record[:2]:
+                next(records, None)
+        return entries
+
+    def count_pending(self) -> int:
+        """Counts changed and untracked paths without building a list of lines.
+
+        Parses NUL-delimited `git status --porcelain -z` output in place. Rename
+        and copy entries carry an extra NUL-terminated source path, which is
+        skipped so that each change is counted once (matching the line count of
+        `status_porcelain()`).
+
+        Returns:
+            int: The number of pending entries in the working tree.
+        """
+        output = self._run(["status", "--porcelain", "-z"], strip=False)
+        count = 0
+        pos = 0
+        while pos < len(output):
+            end = output.find("\0", pos)
+            if end == -1:
+                end = len(output)
+            # The first two characters are the XY status code.
+            if "R" in output[pos : pos + 2] or "C" in output[pos : pos + 2]:
+                end = output.find("\0", end + 1)
+                if end == -1:
+                    end = len(output)
+            pos = end + 1
+            count += 1
+        return count
 
     def commit_interactive(self) -> None:
         """Triggers a standard git commit, opening the configured text editor.
@@ -116,6 +350,8 @@ class GitRepo:
         cmd.append(branch)
         if file:
             cmd.extend(["--", file])
+        else:
+            self._branch = None
         self._run(cmd, capture=False)
 
     def commit(self, message: str, no_verify: bool = False) -> None:
@@ -131,13 +367,6 @@ class GitRepo:
             cmd.append("--no-verify")
         self._run(cmd, capture=False)
 
-    def add_all(self) -> None:
-        """
-        Stages all changes (modified, deleted, and untracked files)
-        in the working directory.
-        """
-        self._run(["add", "."], capture=False)
-
     def merge_squash(self, *branches: str) -> None:
         """Performs a squash merge of the specified branches into the current HEAD.
 
@@ -169,11 +398,108 @@ class GitRepo:
             list[str]: A list of matching reference names.
         """
         try:
-            output = self._run(["for-each-ref", "--format=%(refname)", pattern])
-            return output.splitlines() if output else []
+            output = self._run(
+                ["for-each-ref", "--format=%(refname)", pattern], strip=False
+            )
         except Exception as e:
             logger.warning(f"Git error listing refs for {pattern}: {e}")
             return []
+        return output.splitlines()
+
+    def list_refs_with_time(self, pattern: str) -> list[tuple[str, str]]:
+        """Lists references matching a pattern along with their last commit times.
+
+        Replaces `list_refs()` plus one `get_last_commit_time()` per ref with a
+        single `git for-each-ref` call.
+
+        Args:
+            pattern (str): The glob pattern to match (e.g., 'refs/heads/wip/*').
+
+        Returns:
+            list[tuple[str, str]]: (ref name, relative commit time) pairs, in
+                                   git's ref order.
+        """
+        try:
+            output = self._run(
+                [
+                    "for-each-ref",
+                    "--format=%(refname)%00%(committerdate:relative)",
+                    pattern,
+                ],
+                strip=False,
+            )
+        except Exception as e:
+            logger.warning(f"Git error listing refs for {pattern}: {e}")
+            return []
+
+        return [
+            (refname, rel_time)
+            for refname, _, rel_time in (
+                line.partition("\0") for line in output.splitlines()
+            )
+        ]
+
+    def get_commit_timestamps(self, pattern: str) -> dict[str, int]:
+        """Lists references matching a pattern with their Unix commit timestamps.
+
+        Answers with one `git for-each-ref` call instead of a `git log -1` per
+        ref.
+
+        Args:
+            pattern (str): The glob pattern to match (e.g., 'refs/heads/wip/*').
+
+        Returns:
+            dict[str, int]: Committer timestamp per matching ref name, in git's
+                            ref order.
+        """
+        try:
+            output = self._run(
+                [
+                    "for-each-ref",
+                    "--format=%(refname)%00%(committerdate:unix)",
+                    pattern,
+                ],
+                strip=False,
+            )
+        except Exception as e:
+            logger.warning(f"Git error listing refs for {pattern}: {e}")
+            return {}
+
+        stamps: dict[str, int] = {}
+        for line in output.splitlines():
+            refname, _, ts = line.partition("\0")
+            if ts.isdigit():
+                stamps[refname] = int(ts)
+        return stamps
+
+    def branch_summary(self) -> tuple[str, dict[str, str]]:
+        """Lists local branches and their last commit times in a single call.
+
+        This folds `current_branch()` and one `get_last_commit_time()` per ref into
+        a single `git for-each-ref` invocation.
+
+        Returns:
+            tuple[str, dict[str, str]]: The current branch name (empty if HEAD is
+                                        detached) and a mapping of full ref names to
+                                        relative commit times (e.g., '2 hours ago').
+        """
+        output = self._run(
+            [
+                "for-each-ref",
+                "--format=%(refname)%09%(committerdate:relative)%09%(HEAD)",
+                "refs/heads/",
+            ],
+            strip=False,
+        )
+        current = ""
+        times: dict[str, str] = {}
+        for line in output.splitlines():
+            refname, _, rest = line.partition("\t")
+            rel_time, _, head = rest.partition("\t")
+            times[refname] = rel_time
+            if head == "*":
+                current = refname.removeprefix("refs/heads/")
+        return current, times
 
     def get_last_commit_time(self, branch: str) -> str:
         """Gets the relative time since the last commit on a specified branch.
@@ -192,6 +518,11 @@ class GitRepo:
     def rev_parse(self, rev: str) -> str | None:
         """Resolves a revision (tag, branch, relative ref) to a full SHA-1 hash.
 
+        A full object name is returned as-is, since `git rev-parse` would only
+        echo it back. Other successful resolutions are memoized until a command
+        that can move refs runs through this instance. Failures are not cached,
+        so a ref that is created later still resolves.
+
         Args:
             rev (str): The revision to parse (e.g., 'HEAD', 'master').
 
@@ -199,18 +530,58 @@ class GitRepo:
             Optional[str]:  The full SHA-1 hash,
                             or None if the revision could not be resolved.
         """
+        if _FULL_OID_RE.match(rev):
+            return rev
+        if (cached := self._rev_cache.get(rev)) is not None:
+            return cached
         try:
-            return self._run(["rev-parse", rev])
+            sha = self._run(["rev-parse", rev])
         except Exception as e:
             logger.debug(f"rev-parse failed for '{rev}': {e}")
             return None
+        self._rev_cache[rev] = sha
+        return sha
+
+    def rev_parse_many(self, revs: list[str]) -> dict[str, str | None]:
+        """Resolves several revisions to object IDs with a single git call.
+
+        Feeds the revisions to `git cat-file --batch-check`, which answers one
+        line per input, instead of spawning `git rev-parse` for each.
+
+        Args:
+            revs (list[str]): The revisions to resolve (e.g., refs, 'HEAD',
+                              'ref^{tree}').
+
+        Returns:
+            dict[str, str | None]: The object ID per revision, or None for
+                                   revisions that could not be resolved.
+        """
+        resolved: dict[str, str | None] = dict.fromkeys(revs)
+        if not revs:
+            return resolved
+        try:
+            output = self._run(
+                ["cat-file", "--batch-check=%(objectname)"],
+                input="".join(f"{rev}\n" for rev in revs),
+                strip=False,
+            )
+        except Exception as e:
+            logger.debug(f"Batch rev-parse failed for {revs}: {e}")
+            return resolved
+
+        for rev, line in zip(revs, output.splitlines(), strict=False):
+            # Unresolvable input is echoed back as "<rev> missing" (or ambiguous).
+            if line and " " not in line:
+                resolved[rev] = line
+        return resolved
 
     def write_tree(self, env: dict | None = None) -> str:
         """Creates a tree object from the current index.
 
         Args:
-            env (Optional[dict], optional): Environment variables,
-                                            used to specify a temporary index.
+            env (Optional[dict], optional): Environment variables. Defaults to
+                                            the temporary_index() environment
+                                            when one is active.
 
         Returns:
             str: The SHA-1 hash of the created tree object.
@@ -260,14 +631,47 @@ class GitRepo:
             logger.warning(f"Failed to update ref {ref}: {e}")
             raise
 
+    def update_refs(self, updates: list[tuple[str, str | None, str | None]]) -> None:
+        """Updates or deletes several references in one atomic transaction.
+
+        Streams the changes to `git update-ref --stdin -z`, so N refs cost one
+        process and one transaction instead of N of each.
+
+        Args:
+            updates (list[tuple[str, str | None, str | None]]): (ref, new_oid,
+                old_oid) triples. A None new_oid deletes the ref; a None old_oid
+                skips the check that the ref still points where expected.
+
+        Raises:
+            RuntimeError: If git rejects the transaction. No ref is changed.
+        """
+        if not updates:
+            return
+        records = []
+        for ref, new_oid, old_oid in updates:
+            if new_oid is None:
+                records.append(f"delete {ref}\0{old_oid or ''}\0")
+            else:
+                records.append(f"update {ref}\0{new_oid}\0{old_oid or ''}\0")
+        try:
+            self._run(
+                ["update-ref", "-m", "Pulsar backup", "--stdin", "-z"],
+                input="".join(records),
+            )
+        except Exception as e:
+            logger.warning(f"Failed to update {len(updates)} refs: {e}")
+            raise
+
     def get_untracked_files(self) -> list[str]:
         """Lists files that are not tracked by git and are not ignored.
 
         Returns:
             list[str]: A list of untracked file paths.
         """
-        output = self._run(["ls-files", "--others", "--exclude-standard"])
-        return output.splitlines() if output else []
+        output = self._run(
+            ["ls-files", "--others", "--exclude-standard", "-z"], strip=False
+        )
+        return [name for name in output.split("\0") if name]
 
     def run_diff(self, target: str, file: str | None = None) -> None:
         """Executes a git diff operation, outputting directly to stdout.
@@ -284,9 +688,11 @@ class GitRepo:
     def diff_shortstat(self, target: str, source: str) -> tuple[int, int, int]:
         """Retrieves the shortstat differences between two references.
 
-        Executes `git diff --shortstat target...source` to determine the
-        number of files changed, insertions, and deletions present in the
-        source reference that are not in the target.
+        Sums the tab-separated records of `git diff --numstat -z target...source`
+        to count the files changed, insertions, and deletions present in the
+        source reference that are not in the target. Unlike the `--shortstat`
+        summary line, numstat output is not translated, so this works under
+        any locale.
 
         Args:
             target (str): The base reference (e.g., 'main').
@@ -297,18 +703,25 @@ class GitRepo:
                                   Returns (0, 0, 0) if there are no differences or parsing fails.
         """
         try:
-            output = self._run(["diff", "--shortstat", f"{target}...{source}"])
-            if not output:
-                return 0, 0, 0
-
-            files_match = re.search(r"(\d+)\s+file", output)
-            insertions_match = re.search(r"(\d+)\s+insertion", output)
-            deletions_match = re.search(r"(\d+)\s+deletion", output)
-
-            files = int(files_match.group(1)) if files_match else 0
-            insertions = int(insertions_match.group(1)) if insertions_match else 0
-            deletions = int(deletions_match.group(1)) if deletions_match else 0
-
+            output = self._run(
+                ["diff", "--numstat", "-z", f"{target}...{source}"], strip=False
+            )
+            files = insertions = deletions = 0
+            records = iter(output.split("\0"))
+            for record in records:
+                added, _, rest = record.partition("\t")
+                deleted, sep, path = rest.partition("\t")
+                if not sep:
+                    continue  # Trailing empty record.
+                files += 1
+                # Binary files report "-" for both counts.
+                if added != "-":
+                    insertions += int(added)
+                    deletions += int(deleted)
+                if not path:
+                    # Renames carry the old and new paths as two extra records.
+                    next(records, None)
+                    next(records, None)
             return files, insertions, deletions
         except Exception as e:
             logger.warning(f"Failed to parse shortstat for {target}...{source}: {e}")
@@ -1,4 +1,5 @@
 import contextlib
+import functools
 import json
 import logging
 import os
@@ -6,21 +7,34 @@ import subprocess
 import sys
 import time
 from pathlib import Path
-
-from rich.console import Console
-from rich.panel import Panel
-from rich.prompt import Confirm, Prompt
-from rich.table import Table
+from typing import TYPE_CHECKING
 
 from . import system
 from .config import Config
 from .constants import APP_NAME, BACKUP_NAMESPACE
 from .git_wrapper import GitRepo
 
-console = Console()
+if TYPE_CHECKING:
+    from rich.console import Console
+
 logger = logging.getLogger(APP_NAME)
 
 
+@functools.cache
+def _console() -> "Console":
+    """Creates the interactive console on first use.
+
+    The daemon imports this module but rarely prints, so it never pays for
+    rich's import and terminal probing unless output is actually needed.
+
+    Returns:
+        Console: The shared rich console.
+    """
+    from rich.console import Console
+
+    return Console()
+
+
 def get_backup_ref(branch: str) -> str:
     """
     Constructs the fully qualified backup reference for the current machine and branch.
@@ -68,41 +82,33 @@ def get_remote_drift_state(repo_path: Path) -> tuple[bool, int, str, str]:
             logger.debug(f"Fetch failed during drift check: {e}")
             return False, 0, "", ""  # Silently fail if offline or remote is unreachable
 
-        candidates = repo.list_refs(f"refs/heads/{BACKUP_NAMESPACE}/*/{current_branch}")
-        if not candidates:
+        stamps = repo.get_commit_timestamps(
+            f"refs/heads/{BACKUP_NAMESPACE}/*/{current_branch}"
+        )
+        if not stamps:
             return False, 0, "", ""
 
         my_slug = system.get_identity_slug()
         my_backup_ref = get_backup_ref(current_branch)
 
         # Determine our local latest timestamp (backup ref or HEAD)
-        local_ts = 0
-        try:
-            if my_backup_ref in candidates:
-                local_ts = int(
-                    repo._run(["log", "-1", "--format=%ct", my_backup_ref]).strip()
-                )
-            else:
-                local_ts = int(repo._run(["log", "-1", "--format=%ct", "HEAD"]).strip())
-        except Exception as e:
-            logger.debug(f"Failed to get local timestamp: {e}")
+        if my_backup_ref in stamps:
+            local_ts = stamps[my_backup_ref]
+        else:
+            local_ts = 0
+            try:
+                local_ts = int(repo._run(["log", "-1", "--format=%ct", "HEAD"]))
+            except Exception as e:
+                logger.debug(f"Failed to get local timestamp: {e}")
 
-        newest_ts = 0
+        newest_ref = max(stamps, key=stamps.__getitem__)
+        newest_ts = stamps[newest_ref]
         newest_machine = ""
         # Dynamically calculate the machine index in the ref string
         machine_index = 2 + len(BACKUP_NAMESPACE.split("/"))
-
-        for ref in candidates:
-            try:
-                ts = int(repo._run(["log", "-1", "--format=%ct", ref]).strip())
-                if ts > newest_ts:
-                    newest_ts = ts
-                    parts = ref.split("/")
-                    if len(parts) > machine_index:
-                        newest_machine = parts[machine_index]
-            except Exception as e:
-                logger.debug(f"Failed to process ref {ref}: {e}")
-                continue
+        parts = newest_ref.split("/")
+        if len(parts) > machine_index:
+            newest_machine = parts[machine_index]
 
         if newest_ts > local_ts and newest_machine and newest_machine != my_slug:
             minutes_ago = int((time.time() - newest_ts) / 60)
@@ -130,8 +136,6 @@ def get_drift_state(repo_path: Path) -> tuple[float, int]:
             - int: The Unix timestamp of the newest remote session the user was warned about.
     """
     state_file = repo_path / ".git" / "pulsar_drift_state"
-    if not state_file.exists():
-        return 0.0, 0
 
     try:
         content = state_file.read_text().strip()
@@ -142,6 +146,8 @@ def get_drift_state(repo_path: Path) -> tuple[float, int]:
         return float(data.get("last_check_ts", 0.0)), int(
             data.get("warned_remote_ts", 0)
         )
+    except FileNotFoundError:
+        return 0.0, 0  # No drift check has run yet.
     except (OSError, ValueError, json.JSONDecodeError) as e:
         logger.debug(f"Failed to read drift state: {e}")
         return 0.0, 0
@@ -187,6 +193,9 @@ def restore_file(path_str: str, force: bool = False) -> None:
         path_str (str): The relative path to the file to restore.
         force (bool): If True, overwrites uncommitted local changes. Defaults to False.
     """
+    from rich.prompt import Prompt
+
+    console = _console()
     repo = GitRepo(Path.cwd())
     path = Path(path_str)
 
@@ -235,6 +244,9 @@ def sync_session() -> None:
     the most recent one, and (after confirmation) resets the local working directory
     to match it. This facilitates "Smart Handoff" between devices.
     """
+    from rich.panel import Panel
+
+    console = _console()
     repo = GitRepo(Path.cwd())
     current_branch = repo.current_branch()
 
@@ -261,30 +273,16 @@ def sync_session() -> None:
             )
 
     # 2. Find candidate refs (refs/heads/{namespace}/{machine}/{branch}).
-    candidates = repo.list_refs(f"refs/heads/{BACKUP_NAMESPACE}/*/{current_branch}")
+    stamps = repo.get_commit_timestamps(
+        f"refs/heads/{BACKUP_NAMESPACE}/*/{current_branch}"
+    )
 
-    if not candidates:
+    if not stamps:
         console.print("[bold red]ERROR:[/bold red] No backups found anywhere.")
         return
 
-    # 3. Sort candidates by commit timestamp (newest first).
-    latest_ref = None
-    latest_time = 0
-
-    for ref in candidates:
-        try:
-            ts_str = repo._run(["log", "-1", "--format=%ct", ref])
-            ts = int(ts_str.strip())
-            if ts > latest_time:
-                latest_time = ts
-                latest_ref = ref
-        except Exception as e:
-            logger.warning(f"Failed to parse timestamp for backup ref '{ref}': {e}")
-            continue
-
-    if not latest_ref:
-        console.print("[bold red]ERROR:[/bold red] Could not determine latest backup.")
-        return
+    # 3. Pick the candidate with the newest commit timestamp.
+    latest_ref = max(stamps, key=stamps.__getitem__)
 
     # 4. Compare with local state.
     machine_name = latest_ref.split("/")[-2]
@@ -337,6 +335,10 @@ def finalize_work() -> None:
     branch into the main/master branch, effectively finalizing the work session
     and updating the primary project history. Includes a pre-flight dry-run checklist.
     """
+    from rich.prompt import Confirm
+    from rich.table import Table
+
+    console = _console()
     console.print("[bold blue]FINALIZING:[/bold blue] Finalizing work...")
     repo = GitRepo(Path.cwd())
 
@@ -356,11 +358,12 @@ def finalize_work() -> None:
             "[bold blue]Syncing with origin...[/bold blue]", spinner="dots"
         ):
             try:
-                repo._run(["fetch", "origin", "main"], capture=True)
+                # One fetch (and one negotiation) covers main and the backups.
                 repo._run(
                     [
                         "fetch",
                         "origin",
+                        "main",
                         f"refs/heads/{BACKUP_NAMESPACE}/*:refs/heads/{BACKUP_NAMESPACE}/*",
                     ],
                     capture=True,
@@ -370,8 +373,13 @@ def finalize_work() -> None:
                     f"[yellow][bold]WARNING:[/bold] Fetch warning: {e}[/yellow]"
                 )
 
-        # 3. Identify Backup Candidates for the current branch.
-        candidates = repo.list_refs(f"refs/heads/{BACKUP_NAMESPACE}/*/{working_branch}")
+        # 3. Identify Backup Candidates (and their ages) for the current branch.
+        commit_times = dict(
+            repo.list_refs_with_time(
+                f"refs/heads/{BACKUP_NAMESPACE}/*/{working_branch}"
+            )
+        )
+        candidates = list(commit_times)
 
         if not candidates:
             console.print(
@@ -395,14 +403,15 @@ def finalize_work() -> None:
         table.add_column("+", style="green", justify="right")
         table.add_column("-", style="red", justify="right")
 
-        for c in candidates:
+        # One diff per stream; they are independent, so run them side by side.
+        stats = repo.run_parallel(
+            [functools.partial(repo.diff_shortstat, target, c) for c in candidates]
+        )
+
+        for c, (files, ins, dels) in zip(candidates, stats, strict=True):
             machine = c.split("/")[-2] if len(c.split("/")) >= 2 else "unknown"
-            try:
-                rel_time = repo.get_last_commit_time(c)
-            except Exception:
-                rel_time = "Unknown"
+            rel_time = commit_times[c] or "Unknown"
 
-            files, ins, dels = repo.diff_shortstat(target, c)
             table.add_row(machine, rel_time, str(files), str(ins), str(dels))
 
         console.print(table)
@@ -451,6 +460,7 @@ def prune_backups(days: int, repo_path: Path | None = None) -> None:
         days (int): The retention period in days.
         repo_path (Path | None, optional): The path to the repository. Defaults to CWD.
     """
+    console = _console()
     repo = GitRepo(repo_path or Path.cwd())
     cutoff = time.time() - (days * 86400)
 
@@ -459,27 +469,25 @@ def prune_backups(days: int, repo_path: Path | None = None) -> None:
         f"Scanning for backups older than {days} days..."
     )
 
-    refs = repo.list_refs(f"refs/heads/{BACKUP_NAMESPACE}/")
-    deleted_count = 0
+    stamps = repo.get_commit_timestamps(f"refs/heads/{BACKUP_NAMESPACE}/")
+    stale: list[str] = []
 
-    for ref in refs:
-        try:
-            ts_str = repo._run(["log", "-1", "--format=%ct", ref])
-            ts = int(ts_str.strip())
-
-            if ts < cutoff:
-                age_days = (time.time() - ts) / 86400
-                console.print(f"   Deleting {ref} (Age: {age_days:.1f} days)")
-                repo._run(["update-ref", "-d", ref], capture=False)
-                deleted_count += 1
-        except Exception as e:
-            logger.warning(f"Failed to process old backup ref '{ref}': {e}")
-            continue
+    for ref, ts in stamps.items():
+        if ts < cutoff:
+            age_days = (time.time() - ts) / 86400
+            console.print(f"   Deleting {ref} (Age: {age_days:.1f} days)")
+            stale.append(ref)
 
-    if deleted_count == 0:
+    if not stale:
         console.print("[dim]No stale backups found.[/dim]")
     else:
-        console.print(f"[bold red]Dropped {deleted_count} stale refs.[/bold red]")
+        # One transaction for every deletion instead of an update-ref per ref.
+        try:
+            repo.update_refs([(ref, None, None) for ref in stale])
+        except RuntimeError as e:
+            console.print(f"[bold red]ERROR:[/bold red] Could not drop stale refs: {e}")
+            return
+        console.print(f"[bold red]Dropped {len(stale)} stale refs.[/bold red]")
         with console.status(
             "[bold blue]Running garbage collection (git gc)...[/bold blue]",
             spinner="dots",
@@ -497,6 +505,7 @@ def add_ignore(pattern: str) -> None:
     Args:
         pattern (str): The file pattern to ignore (e.g., '*.log').
     """
+    console = _console()
     cwd = Path.cwd()
     config = Config.load(cwd)
     gitignore = cwd / ".gitignore"
@@ -542,43 +551,58 @@ def add_ignore(pattern: str) -> None:
         pass
 
 
-def has_large_files(repo_path: Path, config: Config) -> bool:
+def has_large_files(
+    repo_path: Path, config: Config, timeout: float | None = None
+) -> bool:
     """Scans untracked or modified files for sizes exceeding the limit.
 
     Args:
         repo_path (Path): The path to the repository.
         config (Config): The configuration instance for this repository.
+        timeout (float | None, optional): Seconds to allow `git ls-files`.
+                                          Defaults to None (no limit).
 
     Returns:
         bool: True if a large file is found, False otherwise.
     """
     limit = config.limits.large_file_threshold
 
-    # Only scan files git knows about or sees as untracked.
+    # Only scan files git knows about or sees as untracked. NUL separation keeps
+    # unusual file names (newlines, quoting) intact, and staying in bytes means
+    # names that are not valid in the locale encoding can still be checked.
     try:
-        cmd = ["git", "ls-files", "--others", "--modified", "--exclude-standard"]
-        candidates = subprocess.check_output(cmd, cwd=repo_path, text=True).splitlines()
-    except subprocess.CalledProcessError as e:
+        cmd = ["git", "ls-files", "-z", "--others", "--modified", "--exclude-standard"]
+        output = subprocess.check_output(cmd, cwd=repo_path, timeout=timeout)
+    except subprocess.SubprocessError as e:
         logger.warning(f"Large file scan failed for {repo_path.name}: {e}")
         return False
 
-    for name in candidates:
-        file_path = repo_path / name
+    # Stat raw path bytes, grouped by directory for filesystem cache locality.
+    root = os.fsencode(repo_path)
+    candidates = sorted(
+        (name for name in output.split(b"\0") if name), key=os.path.dirname
+    )
+    for raw_name in candidates:
         try:
-            if file_path.stat().st_size > limit:
-                # Dynamic size formatting (Bytes -> MB)
-                limit_mb = int(limit / (1024 * 1024))
-
-                logger.warning(
-                    f"WARNING {repo_path.name}: Large file detected ({name}). "
-                    "Backup aborted."
-                )
-                system.get_system().notify(
-                    "Backup Aborted", f"File >{limit_mb}MB detected: {name}"
-                )
-                return True
+            size = os.stat(os.path.join(root, raw_name)).st_size
+        except FileNotFoundError:
+            continue  # Listed by --modified because it was deleted.
         except OSError as e:
-            logger.warning(f"Failed to check size of file {name}: {e}")
+            logger.warning(f"Failed to check size of file {os.fsdecode(raw_name)}: {e}")
             continue
 
+        if size > limit:
+            name = os.fsdecode(raw_name)
+            # Dynamic size formatting (Bytes -> MB)
+            limit_mb = int(limit / (1024 * 1024))
+
+            logger.warning(
+                f"WARNING {repo_path.name}: Large file detected ({name}). "
+                "Backup aborted."
+            )
+            system.get_system().notify(
+                "Backup Aborted", f"File >{limit_mb}MB detected: {name}"
+            )
+            return True
+
     return False
@@ -1,3 +1,4 @@
+import functools
 import shutil
 import subprocess
 import sys
@@ -10,23 +11,29 @@ from .constants import APP_LABEL, HOMEBREW_LABEL, LOG_FILE
 console = Console()
 
 
+@functools.lru_cache(maxsize=1)
 def is_service_enabled() -> bool:
     """Checks if the system service is currently loaded and active.
 
+    The result is memoized for the lifetime of the process; `install` and
+    `uninstall` clear the cache when they change the service state.
+
     Returns:
         bool: True if the service is active/loaded, False otherwise.
     """
+    # Both tools report the state through their exit code, so output is discarded
+    # rather than piped and decoded.
     if sys.platform == "darwin":
-        res = subprocess.run(["launchctl", "list"], capture_output=True, text=True)
-        return HOMEBREW_LABEL in res.stdout
+        cmd = ["launchctl", "list", HOMEBREW_LABEL]
     elif sys.platform.startswith("linux"):
-        res = subprocess.run(
-            ["systemctl", "--user", "is-active", f"{APP_LABEL}.timer"],
-            capture_output=True,
-            text=True,
-        )
-        return res.stdout.strip() == "active"
-    return False
+        cmd = ["systemctl", "--user", "is-active", "--quiet", f"{APP_LABEL}.timer"]
+    else:
+        return False
+
+    res = subprocess.run(
+        cmd, stdout=subprocess.DEVNULL, stderr=subprocess.DEVNULL, check=False
+    )
+    return res.returncode == 0
 
 
 def get_executable() -> str:
@@ -145,6 +152,7 @@ def install(interval: int = 900) -> None:
     console.print(f"Installing background service (interval: {interval}s)...")
     if sys.platform.startswith("linux"):
         install_linux(path, log, exe, interval)
+    is_service_enabled.cache_clear()
 
 
 def uninstall() -> None:
@@ -178,5 +186,6 @@ def uninstall() -> None:
             timer_path.unlink()
 
         subprocess.run(["systemctl", "--user", "daemon-reload"])
+        is_service_enabled.cache_clear()
 
     console.print("[bold green]SUCCESS:[/bold green] Service uninstalled.")
@@ -1,3 +1,4 @@
+import functools
 import logging
 import os
 import plistlib
@@ -5,8 +6,7 @@ import socket
 import subprocess
 import sys
 from pathlib import Path
-
-from rich.console import Console
+from typing import TYPE_CHECKING
 
 from .constants import (
     APP_NAME,
@@ -17,16 +17,62 @@ from .constants import (
 )
 from .git_wrapper import GitRepo
 
-console = Console()
+if TYPE_CHECKING:
+    from rich.console import Console
+
 logger = logging.getLogger(APP_NAME)
 
 
+@functools.cache
+def _console() -> "Console":
+    """Creates the interactive console on first use.
+
+    Only the interactive identity setup prints, so the daemon can import
+    this module without loading rich.
+
+    Returns:
+        Console: The shared rich console.
+    """
+    from rich.console import Console
+
+    return Console()
+
+
+# Last registry parse, keyed on (path, inode, mtime_ns, size).
+_REGISTRY_CACHE: tuple[tuple[str, int, int, int], tuple[str, ...]] | None = None
+
+
+def get_registered_paths() -> list[str]:
+    """Reads the registry file and returns the registered paths as plain strings.
+
+    Preferred over `get_registered_repos()` by callers that only need `os.path`
+    checks, since it avoids constructing a `Path` for every entry. The parsed
+    registry is reused until the file is replaced or modified, so repeat calls
+    cost a single `stat`.
+    """
+    global _REGISTRY_CACHE
+
+    registry = str(REGISTRY_FILE)
+    try:
+        st = os.stat(registry)
+        key = (registry, st.st_ino, st.st_mtime_ns, st.st_size)
+        if _REGISTRY_CACHE is not None and _REGISTRY_CACHE[0] == key:
+            return list(_REGISTRY_CACHE[1])
+
+        with open(registry, "rb") as f:
+            data = f.read()
+    except FileNotFoundError:
+        return []
+
+    stripped = (line.strip() for line in os.fsdecode(data).splitlines())
+    paths = tuple(line for line in stripped if line)
+    _REGISTRY_CACHE = (key, paths)
+    return list(paths)
+
+
 def get_registered_repos() -> list[Path]:
     """Reads the registry file and returns a list of registered repository paths."""
-    if not REGISTRY_FILE.exists():
-        return []
-    with open(REGISTRY_FILE) as f:
-        return [Path(line.strip()) for line in f if line.strip()]
+    return [Path(p) for p in get_registered_paths()]
 
 
 class SystemStrategy:
@@ -105,13 +151,14 @@ class LinuxStrategy(SystemStrategy):
     def get_battery(self) -> tuple[int, bool]:
         """Retrieves battery status from sysfs (/sys/class/power_supply)."""
         try:
-            bat_path = Path("/sys/class/power_supply/BAT0")
-            if not bat_path.exists():
-                bat_path = Path("/sys/class/power_supply/BAT1")
-
-            if bat_path.exists():
-                with open(bat_path / "capacity") as f:
-                    percent = int(f.read().strip())
+            for name in ("BAT0", "BAT1"):
+                bat_path = Path("/sys/class/power_supply") / name
+                # Opening directly doubles as the existence check.
+                try:
+                    with open(bat_path / "capacity") as f:
+                        percent = int(f.read().strip())
+                except FileNotFoundError:
+                    continue
                 with open(bat_path / "status") as f:
                     is_plugged = f.read().strip() != "Discharging"
                 return percent, is_plugged
@@ -302,6 +349,7 @@ def configure_identity(repo: GitRepo | None = None) -> None:
     Args:
         repo (GitRepo | None): Optional repo to use for remote discovery.
     """
+    console = _console()
     name_file = get_machine_name_file()
     id_file = get_machine_id_file()
 
@@ -2,6 +2,7 @@
 
 import os
 import time
+from collections.abc import Iterator
 from pathlib import Path
 from unittest.mock import MagicMock
 
@@ -11,6 +12,14 @@ from git_pulsar import cli
 from git_pulsar.config import Config
 
 
+@pytest.fixture(autouse=True)
+def clear_git_dir_cache() -> Iterator[None]:
+    """Ensures every test resolves the working directory's .git entry afresh."""
+    cli._cwd_git_dir.cache_clear()
+    yield
+    cli._cwd_git_dir.cache_clear()
+
+
 def test_show_status_displays_timestamps(
     tmp_path: Path, capsys: pytest.CaptureFixture, mocker: MagicMock
 ) -> None:
@@ -121,7 +130,8 @@ def test_show_status_power_telemetry(
 ) -> None:
     """Verifies that the correct telemetry state is rendered based on battery levels."""
     mocker.patch.object(Path, "exists", return_value=False)  # Skip repo status
-    mocker.patch("git_pulsar.cli.PID_FILE", mocker.MagicMock(exists=lambda: False))
+    mocker.patch("git_pulsar.cli._cwd_git_dir", return_value=None)
+    mocker.patch("git_pulsar.cli.PID_FILE", tmp_path / "daemon.pid")
     mocker.patch("git_pulsar.service.is_service_enabled", return_value=False)
 
     conf = Config()
@@ -138,6 +148,25 @@ def test_show_status_power_telemetry(
     assert expected_text in captured.out
 
 
+def test_show_status_counts_registry_outside_repo(
+    tmp_path: Path, capsys: pytest.CaptureFixture, mocker: MagicMock
+) -> None:
+    """Verifies that the registry count outside a repository ignores blank lines."""
+    registry = tmp_path / "registry"
+    registry.write_text("/a\n\n/b\n   \n/c\n")
+    mocker.patch("git_pulsar.cli.REGISTRY_FILE", registry)
+    mocker.patch("git_pulsar.cli._cwd_git_dir", return_value=None)
+    mocker.patch("git_pulsar.cli.PID_FILE", tmp_path / "daemon.pid")
+    mocker.patch("git_pulsar.service.is_service_enabled", return_value=False)
+    mocker.patch("git_pulsar.config.Config.load", return_value=Config())
+    mock_strat = mocker.patch("git_pulsar.cli.system.get_system").return_value
+    mock_strat.get_battery.return_value = (100, True)
+
+    cli.show_status()
+
+    assert "Watching 3 repositories." in capsys.readouterr().out
+
+
 def test_show_status_health_warning_large_file(
     tmp_path: Path, capsys: pytest.CaptureFixture, mocker: MagicMock
 ) -> None:
@@ -237,6 +266,28 @@ def test_main_runs_daemon_command(mocker: MagicMock) -> None:
     mock_daemon.assert_called_with(interactive=True)
 
 
+def test_main_fast_path_skips_parser(mocker: MagicMock) -> None:
+    """Verifies that bare argument-less subcommands bypass building the parser."""
+    mock_build = mocker.patch("git_pulsar.cli._build_parser")
+    mock_status = mocker.patch("git_pulsar.cli.show_status")
+    mocker.patch("sys.argv", ["git-pulsar", "status"])
+
+    cli.main()
+
+    mock_status.assert_called_once_with()
+    mock_build.assert_not_called()
+
+
+def test_main_parses_subcommand_options(mocker: MagicMock) -> None:
+    """Verifies that subcommands with options are still parsed by argparse."""
+    mock_prune = mocker.patch("git_pulsar.cli.ops.prune_backups")
+    mocker.patch("sys.argv", ["git-pulsar", "prune", "--days", "7"])
+
+    cli.main()
+
+    mock_prune.assert_called_once_with(7)
+
+
 def test_setup_repo_triggers_identity_config(tmp_path: Path, mocker: MagicMock) -> None:
     """Verifies that setting up a repo triggers identity configuration."""
     (tmp_path / ".git").mkdir()
@@ -808,3 +859,315 @@ def test_run_doctor_outputs_large_file_action(
     )
     assert "File >100MB detected" in output
     assert "Untrack the file or run 'git pulsar ignore <filename>'" in output
+
+
+def test_setup_repo_registers_prefix_sibling(tmp_path: Path, mocker: MagicMock) -> None:
+    """Verifies that a registered sibling sharing a path prefix does not block setup."""
+    repo_dir = tmp_path / "repo"
+    (repo_dir / ".git").mkdir(parents=True)
+    mocker.patch.object(Path, "cwd", return_value=repo_dir)
+    mocker.patch("git_pulsar.system.configure_identity")
+
+    registry = tmp_path / "registry"
+    registry.write_text(f"{repo_dir}-old\n")
+
+    cli.setup_repo(registry_path=registry)
+
+    assert registry.read_text().splitlines() == [f"{repo_dir}-old", str(repo_dir)]
+
+
+def test_pid_alive_rejects_recycled_pid_on_linux(mocker: MagicMock) -> None:
+    """Verifies that a live PID owned by another program is not reported as the daemon."""
+    mocker.patch("sys.platform", "linux")
+
+    # The test runner itself is alive but is not a Pulsar daemon.
+    mocker.patch("builtins.open", mocker.mock_open(read_data=b"/usr/bin/vim\x00x.txt"))
+    assert cli._pid_alive(os.getpid()) is False
+
+    mocker.patch(
+        "builtins.open",
+        mocker.mock_open(read_data=b"/usr/bin/python3\x00/usr/bin/git-pulsar-daemon"),
+    )
+    assert cli._pid_alive(os.getpid()) is True
+
+
+def test_pid_alive_missing_process(mocker: MagicMock) -> None:
+    """Verifies that a vanished process is reported as not running on any platform."""
+    mocker.patch("sys.platform", "linux")
+    mocker.patch("builtins.open", side_effect=FileNotFoundError)
+    assert cli._pid_alive(999999) is False
+
+    mocker.patch("sys.platform", "darwin")
+    mocker.patch("os.kill", side_effect=ProcessLookupError)
+    assert cli._pid_alive(999999) is False
+
+
+def test_check_repo_health_skips_status_scan_when_fresh(
+    tmp_path: Path, mocker: MagicMock
+) -> None:
+    """Verifies that a recent backup short-circuits the working tree scan."""
+    mock_repo = mocker.patch("git_pulsar.cli.GitRepo").return_value
+    mocker.patch(
+        "git_pulsar.cli._get_ref", return_value="refs/heads/wip/pulsar/mac/main"
+    )
+    mocker.patch("time.time", return_value=100000)
+    mock_repo._run.return_value = "99990"
+
+    assert cli._check_repo_health(tmp_path, Config()) is None
+    mock_repo.status_porcelain.assert_not_called()
+
+
+def test_check_repo_health_missing_backup_clean_tree(
+    tmp_path: Path, mocker: MagicMock
+) -> None:
+    """Verifies that a clean repository without a backup ref is healthy."""
+    mock_repo = mocker.patch("git_pulsar.cli.GitRepo").return_value
+    mocker.patch(
+        "git_pulsar.cli._get_ref", return_value="refs/heads/wip/pulsar/mac/main"
+    )
+    mock_repo._run.side_effect = RuntimeError("unknown revision")
+    mock_repo.status_porcelain.return_value = []
+
+    assert cli._check_repo_health(tmp_path, Config()) is None
+
+    mock_repo.status_porcelain.return_value = ["?? new.txt"]
+    result = cli._check_repo_health(tmp_path, Config())
+    assert result is not None
+    assert "NO backup found" in result
+
+
+def test_list_repos_renders_rows(
+    tmp_path: Path, capsys: pytest.CaptureFixture, mocker: MagicMock
+) -> None:
+    """Verifies that `list` renders a row for both present and missing repositories."""
+    present = tmp_path / "present"
+    (present / ".git").mkdir(parents=True)
+    missing = tmp_path / "missing"
+
+    registry = tmp_path / "registry"
+    registry.write_text(f"{present}\n{missing}\n")
+    mocker.patch("git_pulsar.cli.REGISTRY_FILE", registry)
+    mocker.patch(
+        "git_pulsar.system.get_registered_paths",
+        return_value=[str(present), str(missing)],
+    )
+    mocker.patch("git_pulsar.ops.get_backup_ref", return_value="refs/heads/wip/x/main")
+    mocker.patch.object(
+        cli.GitRepo,
+        "branch_summary",
+        return_value=("main", {"refs/heads/wip/x/main": "2 mins ago"}),
+    )
+
+    cli.list_repos()
+    out = capsys.readouterr().out
+
+    assert "Active" in out
+    assert "2 mins ago" in out
+    assert "Missing" in out
+
+
+def test_setup_repo_appends_only_missing_ignores(
+    tmp_path: Path, mocker: MagicMock
+) -> None:
+    """Verifies that defaults are matched per line and only missing ones are appended."""
+    (tmp_path / ".git").mkdir()
+    mocker.patch.object(Path, "cwd", return_value=tmp_path)
+    mocker.patch("git_pulsar.system.configure_identity")
+    mocker.patch("git_pulsar.cli.Config.load", return_value=Config())
+
+    gitignore = tmp_path / ".gitignore"
+    # '*.pdf.bak' contains '*.pdf' as a substring but is a different pattern.
+    gitignore.write_text("__pycache__/\n*.pdf.bak\n")
+
+    cli.setup_repo(registry_path=tmp_path / "registry")
+
+    lines = gitignore.read_text().splitlines()
+    assert lines.count("__pycache__/") == 1
+    assert "*.pdf" in lines
+    assert set(cli.DEFAULT_IGNORES) <= set(lines)
+    assert "" not in lines
+
+    # A file without a trailing newline gets one before the appended block.
+    gitignore.write_text("node_modules/")
+    cli.setup_repo(registry_path=tmp_path / "registry")
+    assert gitignore.read_text().splitlines()[:2] == ["node_modules/", "__pycache__/"]
+
+
+def test_analyze_logs_filters_window(tmp_path: Path, mocker: MagicMock) -> None:
+    """Verifies that only recent error lines are returned and a missing log is empty."""
+    log_file = tmp_path / "daemon.log"
+    mocker.patch("git_pulsar.cli.LOG_FILE", log_file)
+    assert cli._analyze_logs() == []
+
+    log_file.write_text(
+        "[2000-01-01 00:00:00] ERROR: ancient failure\n"
+        f"[{time.strftime('%Y-%m-%d %H:%M:%S')}] ERROR: fresh failure\n"
+        f"[{time.strftime('%Y-%m-%d %H:%M:%S')}] INFO: all good\n"
+    )
+
+    errors = cli._analyze_logs(seconds=3600)
+    assert len(errors) == 1
+    assert "fresh failure" in errors[0]
+
+
+def test_run_doctor_reports_background_ssh_failure(
+    tmp_path: Path, mocker: MagicMock
+) -> None:
+    """Verifies that an SSH probe failure on the background thread is reported."""
+    import subprocess
+
+    mocker.patch("git_pulsar.system.get_registered_repos", return_value=[])
+    mocker.patch("git_pulsar.cli.REGISTRY_FILE", tmp_path / "registry")
+    mocker.patch("git_pulsar.service.is_service_enabled", return_value=True)
+    mocker.patch("git_pulsar.cli._check_systemd_linger", return_value=None)
+    mocker.patch(
+        "subprocess.run", side_effect=subprocess.TimeoutExpired(["ssh"], timeout=5)
+    )
+    mocker.patch("git_pulsar.cli._analyze_logs", return_value=[])
+    mock_console = mocker.patch("git_pulsar.cli.console")
+
+    cli.run_doctor()
+
+    output = " ".join(
+        [call.args[0] for call in mock_console.print.call_args_list if call.args]
+    )
+    assert "SSH Check failed" in output
+
+
+def test_probe_github_ssh_fails_fast(mocker: MagicMock) -> None:
+    """Verifies that the SSH probe never prompts and only captures stderr."""
+    import subprocess
+
+    mock_run = mocker.patch("subprocess.run")
+    result: list = []
+
+    cli._probe_github_ssh(result)
+
+    assert result == [mock_run.return_value]
+    cmd = mock_run.call_args.args[0]
+    assert "BatchMode=yes" in cmd
+    assert f"ConnectTimeout={cli.SSH_CONNECT_TIMEOUT}" in cmd
+    kwargs = mock_run.call_args.kwargs
+    assert kwargs["stdout"] is subprocess.DEVNULL
+    assert kwargs["stderr"] is subprocess.PIPE
+    assert kwargs["timeout"] == cli.SSH_PROBE_TIMEOUT
+
+
+def test_unregister_repo_rewrites_registry(tmp_path: Path, mocker: MagicMock) -> None:
+    """Verifies that unregistering drops only the current path from the registry."""
+    repo = tmp_path / "repo"
+    other = tmp_path / "other"
+    registry = tmp_path / "registry"
+    registry.write_text(f"{other}\n{repo}\n")
+    mocker.patch.object(Path, "cwd", return_value=repo)
+    mocker.patch("git_pulsar.cli.REGISTRY_FILE", registry)
+    mocker.patch("git_pulsar.system.REGISTRY_FILE", registry)
+
+    cli.unregister_repo()
+    assert registry.read_text() == f"{other}\n"
+
+    mocker.patch.object(Path, "cwd", return_value=other)
+    cli.unregister_repo()
+    assert registry.read_text() == ""
+
+
+def test_cli_import_defers_daemon_and_service() -> None:
+    """Verifies that importing the CLI does not load the daemon or service modules."""
+    import subprocess
+    import sys
+
+    code = (
+        "import sys, git_pulsar.cli; "
+        "print('git_pulsar.daemon' in sys.modules, 'git_pulsar.service' in sys.modules)"
+    )
+    out = subprocess.check_output([sys.executable, "-c", code], text=True)
+    assert out.split() == ["False", "False"]
+
+
+def test_display_path_abbreviates_home_only_at_boundary() -> None:
+    """Verifies that only the home directory itself (not a sibling prefix) becomes '~'."""
+    home = os.path.join(os.sep, "home", "me")
+
+    assert cli._display_path(os.path.join(home, "code"), home) == os.path.join(
+        "~", "code"
+    )
+    assert cli._display_path(home, home) == "~"
+    assert cli._display_path(home + "2", home) == home + "2"
+    assert cli._display_path(os.path.join(os.sep, "srv", "me"), home) == os.path.join(
+        os.sep, "srv", "me"
+    )
+
+
+def test_tail_lines_returns_trailing_lines(tmp_path: Path, mocker: MagicMock) -> None:
+    """Verifies that the last lines are found across block boundaries."""
+    mocker.patch("git_pulsar.cli.LOG_TAIL_BLOCK", 7)
+    log_file = tmp_path / "daemon.log"
+    log_file.write_bytes(b"".join(f"line {i}\n".encode() for i in range(50)))
+
+    with open(log_file, "rb") as f:
+        assert cli._tail_lines(f, 3) == b"line 47\nline 48\nline 49\n"
+        assert f.tell() == log_file.stat().st_size
+        assert cli._tail_lines(f, 100).count(b"\n") == 50
+
+
+def test_follow_log_streams_appended_data(tmp_path: Path, mocker: MagicMock) -> None:
+    """Verifies that data appended after the initial read is copied to the output."""
+    import io
+
+    log_file = tmp_path / "daemon.log"
+    log_file.write_bytes(b"old\n")
+    mocker.patch("sys.platform", "linux")  # Force the polling fallback.
+
+    def append_then_stop(_: float) -> None:
+        if b"new" in log_file.read_bytes():
+            raise KeyboardInterrupt
+        with open(log_file, "ab") as f:
+            f.write(b"new\n")
+
+    mocker.patch("git_pulsar.cli.time.sleep", side_effect=append_then_stop)
+    out = io.BytesIO()
+
+    with open(log_file, "rb") as f:
+        f.seek(0, os.SEEK_END)
+        with pytest.raises(KeyboardInterrupt):
+            cli._follow_log(f, out)
+
+    assert out.getvalue() == b"new\n"
+
+
+def test_setup_repo_creates_registry_directory(
+    tmp_path: Path, mocker: MagicMock
+) -> None:
+    """Verifies that registering works before the state directory exists."""
+    (tmp_path / ".git").mkdir()
+    mocker.patch.object(Path, "cwd", return_value=tmp_path)
+    mocker.patch("git_pulsar.system.configure_identity")
+    mocker.patch("git_pulsar.cli.Config.load", return_value=Config())
+    registry = tmp_path / "state" / "git-pulsar" / "registry"
+
+    cli.setup_repo(registry_path=registry)
+
+    assert registry.read_text() == f"{tmp_path}\n"
+
+
+def test_show_diff_from_subdirectory_uses_repo_root(
+    tmp_path: Path, mocker: MagicMock, monkeypatch: pytest.MonkeyPatch
+) -> None:
+    """Verifies that `diff` works from inside the tree and reports a missing git."""
+    import subprocess
+
+    subprocess.run(["git", "init", "-q", "-b", "main", str(tmp_path)], check=True)
+    (tmp_path / "sub").mkdir()
+    monkeypatch.chdir(tmp_path / "sub")
+    mocker.patch("git_pulsar.cli.console")
+    mocker.patch("git_pulsar.ops.get_backup_ref", return_value="refs/heads/backup")
+    mock_diff = mocker.patch("git_pulsar.cli.GitRepo.run_diff")
+    mocker.patch("git_pulsar.cli.GitRepo.get_untracked_files", return_value=[])
+
+    cli.show_diff()
+
+    mock_diff.assert_called_once_with("refs/heads/backup")
+
+    mocker.patch("git_pulsar.cli.GitRepo.probe", side_effect=FileNotFoundError)
+    with pytest.raises(SystemExit):
+        cli.show_diff()
@@ -6,6 +6,7 @@ from unittest.mock import MagicMock
 
 import pytest
 
+from git_pulsar import config
 from git_pulsar.config import Config
 
 
@@ -13,8 +14,20 @@ from git_pulsar.config import Config
 def clear_config_cache() -> Any:
     """Ensures every test starts with a clean config cache."""
     Config._global_cache = None
+    Config._load_cache.clear()
+    config._load_toml_cached.cache_clear()
     yield
     Config._global_cache = None
+    Config._load_cache.clear()
+    config._load_toml_cached.cache_clear()
+
+
+@pytest.fixture(autouse=True)
+def isolated_config_cache(tmp_path: Path, mocker: Any) -> Path:
+    """Keeps the baked global config out of the real state directory."""
+    cache_file = tmp_path / "state" / "config.json"
+    mocker.patch("git_pulsar.config.CONFIG_CACHE_FILE", cache_file)
+    return cache_file
 
 
 def test_config_defaults() -> None:
@@ -42,6 +55,15 @@ def test_config_presets() -> None:
     assert conf.daemon.commit_interval == 3600
     assert conf.daemon.push_interval == 14400
 
+    # Unknown presets leave the intervals untouched.
+    conf.daemon.preset = "bogus"
+    conf.daemon.apply_preset()
+    assert conf.daemon.commit_interval == 3600
+
+    # The preset table is not a configurable key.
+    daemon = Config._update_dataclass("daemon", conf.daemon, {"_PRESETS": {}})
+    assert daemon is conf.daemon
+
 
 def test_config_load_merges_layers(tmp_path: Path, mocker: MagicMock) -> None:
     """Verifies the cascading merge logic (Defaults -> Global -> Local).
@@ -153,3 +175,137 @@ def test_config_invalid_keys_and_values(
         "Config error in [daemon].commit_interval: Invalid time format" in caplog.text
     )
     assert "Config error in [limits].max_log_size: Invalid size format" in caplog.text
+
+
+def test_config_load_caches_until_file_changes(tmp_path: Path) -> None:
+    """Verifies that repeated loads reuse the parse until the local file changes."""
+    import os
+
+    local_toml = tmp_path / "pulsar.toml"
+    local_toml.write_text('[files]\nignore = ["*.tmp"]\n')
+
+    first = Config.load(repo_path=tmp_path)
+    # Callers receive independent copies, so mutations must not leak back.
+    first.files.ignore.append("*.mutated")
+    first.daemon.commit_interval = 1
+
+    second = Config.load(repo_path=tmp_path)
+    assert second.files.ignore == ["*.tmp"]
+    assert second.daemon.commit_interval == 600
+
+    local_toml.write_text("[daemon]\ncommit_interval = 42\n")
+    stat = local_toml.stat()
+    os.utime(local_toml, ns=(stat.st_atime_ns, stat.st_mtime_ns + 1_000_000_000))
+
+    assert Config.load(repo_path=tmp_path).daemon.commit_interval == 42
+
+
+def test_merge_from_file_reuses_parsed_toml(tmp_path: Path, mocker: MagicMock) -> None:
+    """Verifies that an unchanged file is parsed once and its document is not mutated."""
+    local_toml = tmp_path / "pulsar.toml"
+    local_toml.write_text('[files]\nignore = ["*.tmp"]\nmanage_gitignore = false\n')
+    spy = mocker.spy(config.tomllib, "load")
+
+    for _ in range(2):
+        conf = Config()
+        conf._merge_from_file(local_toml)
+        assert conf.files.ignore == ["*.tmp"]
+        assert conf.files.manage_gitignore is False
+
+    assert spy.call_count == 1
+
+
+def test_update_dataclass_without_valid_updates_returns_instance() -> None:
+    """Verifies that a section with only unknown keys leaves the instance untouched."""
+    conf = Config()
+    core = conf.core
+
+    result = Config._update_dataclass("core", core, {"bogus": 1})
+    assert result is core
+
+    result = Config._update_dataclass("core", core, {"remote_name": "backup"})
+    assert result is not core
+    assert result.remote_name == "backup"
+
+
+def test_config_load_is_thread_safe(tmp_path: Path, mocker: MagicMock) -> None:
+    """Verifies that concurrent loads of many repos neither fail nor mix results."""
+    from concurrent.futures import ThreadPoolExecutor
+
+    mocker.patch("git_pulsar.config._LOAD_CACHE_SIZE", 4)
+    repos = []
+    for i in range(16):
+        repo = tmp_path / f"repo{i}"
+        repo.mkdir()
+        (repo / "pulsar.toml").write_text(f"[daemon]\ncommit_interval = {i + 1}\n")
+        repos.append(repo)
+
+    with ThreadPoolExecutor(max_workers=8) as pool:
+        results = list(pool.map(Config.load, repos * 8))
+
+    assert [c.daemon.commit_interval for c in results] == list(range(1, 17)) * 8
+
+
+def test_merge_from_file_skips_missing_and_empty(
+    tmp_path: Path, mocker: MagicMock, caplog: pytest.LogCaptureFixture
+) -> None:
+    """Verifies that missing or empty files are skipped without parsing or warnings."""
+    spy = mocker.spy(config.tomllib, "load")
+    empty = tmp_path / "pulsar.toml"
+    empty.write_text("")
+
+    conf = Config()
+    conf._merge_from_file(tmp_path / "absent.toml")
+    conf._merge_from_file(empty)
+
+    assert spy.call_count == 0
+    assert "Failed to load config" not in caplog.text
+    assert conf == Config()
+
+
+def test_global_config_is_baked_to_json(
+    tmp_path: Path, mocker: Any, isolated_config_cache: Path
+) -> None:
+    """Verifies the global config is parsed once and then read back as JSON."""
+    global_config = tmp_path / "config.toml"
+    global_config.write_text('[core]\nremote_name = "upstream"\n')
+    mocker.patch("git_pulsar.config.CONFIG_FILE", global_config)
+
+    assert Config.load().core.remote_name == "upstream"
+    assert isolated_config_cache.exists()
+
+    # A fresh process sees the baked copy and never touches tomllib.
+    Config._global_cache = None
+    config._load_toml_cached.cache_clear()
+    mock_toml = mocker.patch("git_pulsar.config.tomllib.load")
+
+    assert Config.load().core.remote_name == "upstream"
+    mock_toml.assert_not_called()
+
+
+def test_global_config_cache_invalidated_on_edit(
+    tmp_path: Path, mocker: Any, isolated_config_cache: Path
+) -> None:
+    """Verifies a baked copy is ignored once the global config changes."""
+    global_config = tmp_path / "config.toml"
+    global_config.write_text('[core]\nremote_name = "upstream"\n')
+    mocker.patch("git_pulsar.config.CONFIG_FILE", global_config)
+    Config.load()
+
+    global_config.write_text('[core]\nremote_name = "mirror"\n')
+    Config._global_cache = None
+    config._load_toml_cached.cache_clear()
+
+    assert Config.load().core.remote_name == "mirror"
+
+
+def test_global_config_with_dates_is_not_baked(
+    tmp_path: Path, mocker: Any, isolated_config_cache: Path
+) -> None:
+    """Verifies TOML values without a JSON form skip the cache."""
+    global_config = tmp_path / "config.toml"
+    global_config.write_text('[core]\nremote_name = "upstream"\nsince = 2024-01-01\n')
+    mocker.patch("git_pulsar.config.CONFIG_FILE", global_config)
+
+    assert Config.load().core.remote_name == "upstream"
+    assert not isolated_config_cache.exists()
@@ -10,6 +10,12 @@ from git_pulsar.config import Config
 from git_pulsar.constants import BACKUP_NAMESPACE
 
 
+@pytest.fixture(autouse=True)
+def clear_battery_cache(mocker: MagicMock) -> None:
+    """Ensures battery readings never leak between tests."""
+    mocker.patch.object(daemon, "_BATTERY_CACHE", None)
+
+
 @pytest.fixture
 def mock_config(mocker: MagicMock) -> Config:
     """Creates a default Config object and mocks Config.load to return it."""
@@ -47,16 +53,23 @@ def test_run_backup_shadow_commit_flow(
     repo = mock_cls.return_value
     repo.current_branch.return_value = "main"
 
-    # Simulate ref timestamps to ensure Push triggers:
-    mocker.patch("git_pulsar.daemon._get_ref_timestamp", side_effect=[0, 100, 0])
+    # Simulate missing backup refs so both the commit and the push trigger.
+    mocker.patch(
+        "git_pulsar.daemon._get_ref_timestamps",
+        side_effect=lambda _repo, refs: dict.fromkeys(refs, 0),
+    )
 
     # Simulate parent resolution (Head exists, Backup doesn't)
-    repo.rev_parse.side_effect = [None, "head_sha"]
+    repo.rev_parse_many.side_effect = lambda revs: {
+        **dict.fromkeys(revs),
+        "HEAD": "head_sha",
+    }
 
     daemon.run_backup(str(tmp_path))
 
     # Assert plumbing usage
-    repo._run.assert_any_call(["add", "."], env=mocker.ANY)
+    repo.temporary_index.assert_called_once()
+    repo._run.assert_any_call(["add", "."])
     repo.write_tree.assert_called_once()
     repo.commit_tree.assert_called_once()
 
@@ -98,13 +111,13 @@ def test_run_backup_decoupled_push(
     now = 10000
     mocker.patch("time.time", return_value=now)
 
-    def get_timestamp_side_effect(repo: MagicMock, ref: str) -> int:
-        if "remotes" in ref:
-            return now - 1000  # Last push was 1000s ago (Interval 3600 -> Skip)
-        return now - 1000  # Last commit was 1000s ago (Interval 60 -> Commit)
+    def get_timestamps_side_effect(repo: MagicMock, refs: list[str]) -> dict:
+        # Last commit and last push were both 1000s ago:
+        # (Commit interval 60 -> Commit), (Push interval 3600 -> Skip).
+        return dict.fromkeys(refs, now - 1000)
 
     mocker.patch(
-        "git_pulsar.daemon._get_ref_timestamp", side_effect=get_timestamp_side_effect
+        "git_pulsar.daemon._get_ref_timestamps", side_effect=get_timestamps_side_effect
     )
 
     daemon.run_backup(str(tmp_path))
@@ -134,6 +147,13 @@ def test_run_backup_drift_detection_throttled(
     current_time = 10000.0
     mocker.patch("time.time", return_value=current_time)
     mocker.patch("git_pulsar.ops.get_drift_state", return_value=(current_time - 600, 0))
+    # Backups are current, so neither the commit nor the push phase runs.
+    mock_config.daemon.commit_interval = 600
+    mock_config.daemon.push_interval = 3600
+    mocker.patch(
+        "git_pulsar.daemon._get_ref_timestamps",
+        side_effect=lambda _repo, refs: dict.fromkeys(refs, current_time),
+    )
 
     mock_get_host = mocker.patch("git_pulsar.daemon.get_remote_host")
 
@@ -182,3 +202,576 @@ def test_run_backup_drift_detection_triggers_notification(
 
     # Assert state was updated so we don't spam the user again for timestamp 5000
     mock_set_state.assert_called_once_with(tmp_path.resolve(), current_time, 5000)
+
+
+def test_get_ref_timestamps_batches_lookup(tmp_path: Path) -> None:
+    """Verifies that one for-each-ref call maps exact refs and defaults missing ones."""
+    repo = MagicMock()
+    repo._run.return_value = (
+        "refs/heads/wip/a/main 1700000000\nrefs/heads/wip/a/main/nested 1800000000"
+    )
+
+    stamps = daemon._get_ref_timestamps(
+        repo, ["refs/heads/wip/a/main", "refs/remotes/origin/wip/a/main"]
+    )
+
+    assert stamps == {
+        "refs/heads/wip/a/main": 1700000000,
+        "refs/remotes/origin/wip/a/main": 0,
+    }
+    repo._run.assert_called_once()
+
+    repo._run.side_effect = RuntimeError("not a repo")
+    assert daemon._get_ref_timestamps(repo, ["refs/heads/x"]) == {"refs/heads/x": 0}
+
+
+def test_probe_ports_succeeds_on_any_open_port() -> None:
+    """Verifies that one listening port is enough and closed ports fail fast."""
+    import socket
+
+    with socket.socket() as listener, socket.socket() as closed:
+        listener.bind(("127.0.0.1", 0))
+        listener.listen()
+        closed.bind(("127.0.0.1", 0))  # Bound but not listening: refused.
+        open_port = listener.getsockname()[1]
+        closed_port = closed.getsockname()[1]
+
+        assert daemon._probe_ports("127.0.0.1", (closed_port, open_port), 1.0)
+        assert not daemon._probe_ports("127.0.0.1", (closed_port,), 1.0)
+
+
+def test_probe_ports_tries_each_address_family(mocker: MagicMock) -> None:
+    """Verifies an unusable first address (IPv6 disabled) falls through to IPv4."""
+    import errno
+    import socket
+
+    real_socket = socket.socket
+
+    def no_ipv6(family: int, kind: int = socket.SOCK_STREAM) -> socket.socket:
+        if family == socket.AF_INET6:
+            raise OSError(errno.EAFNOSUPPORT, "Address family not supported")
+        return real_socket(family, kind)
+
+    with real_socket() as listener:
+        listener.bind(("127.0.0.1", 0))
+        listener.listen()
+        open_port = listener.getsockname()[1]
+
+        mocker.patch(
+            "git_pulsar.daemon.socket.getaddrinfo",
+            return_value=[
+                (socket.AF_INET6, socket.SOCK_STREAM, 6, "", ("::1", 0, 0, 0)),
+                (socket.AF_INET6, socket.SOCK_STREAM, 6, "", ("::2", 0, 0, 0)),
+                (socket.AF_INET, socket.SOCK_STREAM, 6, "", ("127.0.0.1", 0)),
+            ],
+        )
+        mock_socket = mocker.patch(
+            "git_pulsar.daemon.socket.socket", side_effect=no_ipv6
+        )
+
+        assert daemon._probe_ports("example.test", (open_port,), 1.0)
+        # One attempt per family, not per resolved record.
+        assert mock_socket.call_count == 2
+
+
+def test_is_remote_reachable_caches_result(mocker: MagicMock) -> None:
+    """Verifies that repeated checks for one host within the TTL reuse the result."""
+    mocker.patch.dict(daemon._REACHABILITY_CACHE, clear=True)
+    mock_probe = mocker.patch("git_pulsar.daemon._probe_ports", return_value=True)
+    mock_clock = mocker.patch("git_pulsar.daemon.time.monotonic", return_value=100.0)
+
+    assert daemon.is_remote_reachable("github.com")
+    assert daemon.is_remote_reachable("github.com")
+    assert mock_probe.call_count == 1
+
+    mock_clock.return_value = 100.0 + daemon.REACHABILITY_TTL
+    mock_probe.return_value = False
+    assert not daemon.is_remote_reachable("github.com")
+    assert mock_probe.call_count == 2
+
+
+def test_is_remote_reachable_coalesces_concurrent_probes(mocker: MagicMock) -> None:
+    """Verifies that workers checking the same host share one in-flight probe."""
+    import threading
+    import time
+    from concurrent.futures import ThreadPoolExecutor
+
+    mocker.patch.dict(daemon._REACHABILITY_CACHE, clear=True)
+    started = threading.Event()
+
+    def slow_probe(*_args: object) -> bool:
+        started.set()
+        time.sleep(0.1)
+        return True
+
+    mock_probe = mocker.patch("git_pulsar.daemon._probe_ports", side_effect=slow_probe)
+
+    with ThreadPoolExecutor(max_workers=4) as ex:
+        first = ex.submit(daemon.is_remote_reachable, "github.com")
+        started.wait(1)
+        rest = [ex.submit(daemon.is_remote_reachable, "github.com") for _ in range(3)]
+        results = [f.result() for f in [first, *rest]]
+
+    assert results == [True] * 4
+    assert mock_probe.call_count == 1
+
+
+def test_get_remote_host_cached_until_config_changes(
+    tmp_path: Path, mocker: MagicMock
+) -> None:
+    """Verifies that the remote URL is re-read only after .git/config changes."""
+    import os
+
+    git_config = tmp_path / ".git" / "config"
+    git_config.parent.mkdir()
+    git_config.write_text("[core]\n")
+    mocker.patch.dict(daemon._REMOTE_HOST_CACHE, clear=True)
+    mock_out = mocker.patch(
+        "subprocess.check_output", return_value="git@github.com:user/repo.git\n"
+    )
+
+    assert daemon.get_remote_host(tmp_path, "origin") == "github.com"
+    assert daemon.get_remote_host(tmp_path, "origin") == "github.com"
+    assert mock_out.call_count == 1
+
+    mock_out.return_value = "https://gitlab.com/user/repo.git\n"
+    stat = git_config.stat()
+    os.utime(git_config, ns=(stat.st_atime_ns, stat.st_mtime_ns + 1_000_000_000))
+
+    assert daemon.get_remote_host(tmp_path, "origin") == "gitlab.com"
+    assert mock_out.call_count == 2
+
+
+def test_read_config_url_defers_to_git_for_global_insteadof(
+    tmp_path: Path, monkeypatch: pytest.MonkeyPatch
+) -> None:
+    """Verifies that URL rewrites in the global gitconfig make git resolve the URL."""
+    git_config = tmp_path / "repo" / ".git" / "config"
+    git_config.parent.mkdir(parents=True)
+    git_config.write_text('[remote "origin"]\n\turl = gh:user/repo.git\n')
+    global_config = tmp_path / "gitconfig"
+    global_config.write_text("[core]\n")
+    monkeypatch.setenv("GIT_CONFIG_GLOBAL", str(global_config))
+    monkeypatch.setenv("GIT_CONFIG_NOSYSTEM", "1")
+    monkeypatch.delenv("GIT_CONFIG_COUNT", raising=False)
+    monkeypatch.delenv("GIT_CONFIG_PARAMETERS", raising=False)
+
+    daemon._user_config_rewrites_urls.cache_clear()
+    try:
+        url = daemon._read_config_url(tmp_path / "repo", "origin")
+        assert url == "gh:user/repo.git"
+
+        global_config.write_text('[url "git@github.com:"]\n\tinsteadOf = gh:\n')
+        daemon._user_config_rewrites_urls.cache_clear()
+        assert daemon._read_config_url(tmp_path / "repo", "origin") is None
+    finally:
+        daemon._user_config_rewrites_urls.cache_clear()
+
+
+def test_main_backs_up_each_repo_once_in_order(mocker: MagicMock) -> None:
+    """Verifies that duplicate registry entries are processed once, in order."""
+    mocker.patch(
+        "git_pulsar.system.get_registered_paths", return_value=["/b", "/a", "/b"]
+    )
+    mocker.patch("git_pulsar.daemon.setup_logging")
+    mock_backup = mocker.patch("git_pulsar.daemon.run_backup")
+    mock_maintenance = mocker.patch("git_pulsar.daemon.run_maintenance")
+
+    daemon.main(interactive=True)
+
+    assert [c.args[0] for c in mock_backup.call_args_list] == ["/b", "/a"]
+    mock_maintenance.assert_called_once_with(["/b", "/a"])
+
+
+def test_is_repo_busy_detects_lock_files(tmp_path: Path, mocker: MagicMock) -> None:
+    """Verifies operational locks, fresh index locks, and stale index locks."""
+    import os
+    import time
+
+    git_dir = tmp_path / ".git"
+    git_dir.mkdir()
+    (git_dir / "HEAD").write_text("ref: refs/heads/main\n")
+    assert daemon.is_repo_busy(tmp_path) is False
+
+    (git_dir / "MERGE_HEAD").write_text("abc\n")
+    assert daemon.is_repo_busy(tmp_path) is True
+    (git_dir / "MERGE_HEAD").unlink()
+
+    lock = git_dir / "index.lock"
+    lock.touch()
+    assert daemon.is_repo_busy(tmp_path) is True
+
+    mock_notify = mocker.patch("git_pulsar.daemon.SYSTEM.notify")
+    old = time.time() - 25 * 3600
+    os.utime(lock, (old, old))
+    assert daemon.is_repo_busy(tmp_path) is True
+    mock_notify.assert_called_once()
+
+    # Lock released between the directory listing and the stat.
+    mocker.patch("git_pulsar.daemon.os.stat", side_effect=FileNotFoundError)
+    assert daemon.is_repo_busy(tmp_path) is False
+
+    assert daemon.is_repo_busy(tmp_path / "missing") is False
+
+
+def test_prune_registry_skips_write_when_target_absent(
+    tmp_path: Path, mocker: MagicMock
+) -> None:
+    """Verifies that a clean registry without the target is left untouched."""
+    registry = tmp_path / "registry"
+    registry.write_text("/a\n/b\n")
+    mocker.patch("git_pulsar.daemon.REGISTRY_FILE", registry)
+    mock_notify = mocker.patch("git_pulsar.daemon.SYSTEM.notify")
+    mock_fsync = mocker.patch("git_pulsar.daemon.os.fsync")
+
+    daemon.prune_registry("/c")
+
+    mock_fsync.assert_not_called()
+    mock_notify.assert_not_called()
+    assert registry.read_text() == "/a\n/b\n"
+
+    daemon.prune_registry("/a")
+
+    mock_fsync.assert_called_once()
+    mock_notify.assert_called_once()
+    assert registry.read_text() == "/b\n"
+
+
+def test_prune_registry_concurrent_removals_all_apply(
+    tmp_path: Path, mocker: MagicMock
+) -> None:
+    """Verifies that workers pruning at once don't undo each other's removals."""
+    import threading
+
+    paths = [f"/repo{i}" for i in range(8)]
+    registry = tmp_path / "registry"
+    registry.write_text("".join(f"{p}\n" for p in [*paths, "/kept"]))
+    mocker.patch("git_pulsar.daemon.REGISTRY_FILE", registry)
+    mocker.patch("git_pulsar.daemon.SYSTEM.notify")
+
+    threads = [threading.Thread(target=daemon.prune_registry, args=(p,)) for p in paths]
+    for thread in threads:
+        thread.start()
+    for thread in threads:
+        thread.join()
+
+    assert registry.read_text() == "/kept\n"
+    assert sorted(p.name for p in tmp_path.iterdir()) == ["registry"]
+
+
+def test_run_backup_stages_only_into_temporary_index(
+    tmp_path: Path, mocker: MagicMock, mock_config: Config
+) -> None:
+    """Verifies that the commit phase runs a single, isolated `git add`."""
+    (tmp_path / ".git").mkdir()
+    mocker.patch("git_pulsar.daemon.SYSTEM.is_under_load", return_value=False)
+    mocker.patch("git_pulsar.daemon.SYSTEM.get_battery", return_value=(100, True))
+    mocker.patch("git_pulsar.ops.has_large_files", return_value=False)
+    mocker.patch("git_pulsar.daemon._attempt_push")
+    mocker.patch(
+        "git_pulsar.daemon._get_ref_timestamps",
+        side_effect=lambda _repo, refs: dict.fromkeys(refs, 0),
+    )
+    repo = mocker.patch("git_pulsar.daemon.GitRepo").return_value
+    repo.current_branch.return_value = "main"
+    repo.rev_parse_many.side_effect = lambda revs: {
+        **dict.fromkeys(revs),
+        "HEAD": "head_sha",
+    }
+
+    daemon.run_backup(str(tmp_path))
+
+    add_calls = [c for c in repo._run.call_args_list if c.args[0][:1] == ["add"]]
+    assert len(add_calls) == 1
+    repo.temporary_index.assert_called_once()
+
+
+def test_main_times_out_stalled_repo(tmp_path: Path, mocker: MagicMock) -> None:
+    """Verifies that a stalled backup is skipped without blocking other repos."""
+    import threading
+
+    release = threading.Event()
+    done: list[str] = []
+
+    def fake_backup(repo_str: str, *_args: object) -> None:
+        if repo_str == "/stalled":
+            release.wait(5)
+        done.append(repo_str)
+
+    mocker.patch(
+        "git_pulsar.system.get_registered_paths", return_value=["/stalled", "/ok"]
+    )
+    mocker.patch("git_pulsar.daemon.setup_logging")
+    mocker.patch("git_pulsar.daemon.PID_FILE", tmp_path / "daemon.pid")
+    mocker.patch("git_pulsar.daemon.atexit.register")
+    mocker.patch("git_pulsar.daemon.run_maintenance")
+    mocker.patch("git_pulsar.daemon.REPO_TIMEOUT", 0.05)
+    mocker.patch("git_pulsar.daemon.run_backup", side_effect=fake_backup)
+    mock_warning = mocker.patch("git_pulsar.daemon.logger.warning")
+
+    try:
+        daemon.main(interactive=False)
+    finally:
+        release.set()
+
+    assert "/ok" in done
+    assert "TIMEOUT /stalled" in mock_warning.call_args.args[0]
+
+
+def test_main_runs_repos_queued_behind_stalled_one(
+    tmp_path: Path, mocker: MagicMock
+) -> None:
+    """Verifies a single-worker pass still backs up the repos after a stalled one."""
+    import threading
+
+    release = threading.Event()
+    done: list[str] = []
+
+    def fake_backup(repo_str: str, *_args: object) -> None:
+        if repo_str == "/stalled":
+            release.wait(5)
+        done.append(repo_str)
+
+    mocker.patch(
+        "git_pulsar.system.get_registered_paths",
+        return_value=["/stalled", "/a", "/b"],
+    )
+    mocker.patch("git_pulsar.daemon.setup_logging")
+    mocker.patch("git_pulsar.daemon.run_maintenance")
+    mocker.patch("git_pulsar.daemon.REPO_TIMEOUT", 0.05)
+    mocker.patch("git_pulsar.daemon.run_backup", side_effect=fake_backup)
+    mock_warning = mocker.patch("git_pulsar.daemon.logger.warning")
+
+    try:
+        daemon.main(interactive=True)
+    finally:
+        release.set()
+
+    assert done[:2] == ["/a", "/b"]
+    # Only the repo that overran its own budget is reported, and not as skipped.
+    assert [c.args[0].split(":")[0] for c in mock_warning.call_args_list] == [
+        "TIMEOUT /stalled"
+    ]
+    assert "Skipped" not in mock_warning.call_args.args[0]
+
+
+def test_run_maintenance_skips_repos_without_stale_backups(
+    tmp_path: Path, mocker: MagicMock
+) -> None:
+    """Verifies that prune_backups only runs where an expired backup ref exists."""
+    import time
+
+    mocker.patch("git_pulsar.daemon.REGISTRY_FILE", tmp_path / "registry")
+    mock_prune = mocker.patch("git_pulsar.daemon.ops.prune_backups")
+    now = int(time.time())
+    stamps = {
+        "/fresh": {"refs/heads/a": now, "refs/heads/b": now - 86400},
+        "/stale": {"refs/heads/a": now, "refs/heads/b": now - 40 * 86400},
+    }
+    mock_cls = mocker.patch("git_pulsar.daemon.GitRepo")
+    mock_cls.side_effect = lambda path: MagicMock(
+        get_commit_timestamps=MagicMock(return_value=stamps[str(path)])
+    )
+
+    daemon.run_maintenance(["/fresh", "/stale"])
+
+    mock_prune.assert_called_once_with(30, Path("/stale"))
+    assert (tmp_path / "last_prune").exists()
+
+
+def test_setup_logging_uses_passed_config(tmp_path: Path, mocker: MagicMock) -> None:
+    """Verifies that the log size limit comes from the caller's config."""
+    conf = Config()
+    conf.limits.max_log_size = 1234
+    mock_load = mocker.patch("git_pulsar.daemon.Config.load")
+    mocker.patch("git_pulsar.daemon.ensure_state_dir")
+    mocker.patch("git_pulsar.daemon.logger.addHandler")
+    mock_handler = mocker.patch("git_pulsar.daemon.RotatingFileHandler")
+
+    daemon.setup_logging(False, conf)
+
+    mock_load.assert_not_called()
+    assert mock_handler.call_args.kwargs["maxBytes"] == 1234
+
+
+@pytest.mark.parametrize(
+    ("url", "expected"),
+    [
+        ("git@github.com:user/repo.git", "github.com"),
+        ("ssh://git@example.org:22/repo.git", "example.org"),
+        ("https://gitlab.com/user/repo.git", "gitlab.com"),
+        ("https://token@gitlab.com/user/repo.git", "gitlab.com"),
+        ("ssh://git@[::1]:2222/repo.git", "::1"),
+        ("/srv/git/repo.git", None),
+        ("../relative/repo.git", None),
+        ("file:///srv/git/repo.git", None),
+    ],
+)
+def test_read_remote_host_parses_url_forms(
+    mocker: MagicMock, url: str, expected: str | None
+) -> None:
+    """Verifies hostname extraction for SSH, URL-style, and local remotes."""
+    mocker.patch("subprocess.check_output", return_value=f"{url}\n")
+
+    assert daemon._read_remote_host(Path("/repo"), "origin") == expected
+
+
+def test_remote_backup_ref_maps_local_ref() -> None:
+    """Verifies the local-to-remote backup ref mapping."""
+    local = f"refs/heads/{BACKUP_NAMESPACE}/mac--1234/main"
+
+    assert (
+        daemon._remote_backup_ref(local, "origin")
+        == f"refs/remotes/origin/{BACKUP_NAMESPACE}/mac--1234/main"
+    )
+
+
+def test_console_is_created_lazily() -> None:
+    """Verifies that the module-level console resolves to one shared instance."""
+    daemon._console.cache_clear()
+    assert daemon._console.cache_info().currsize == 0
+
+    assert daemon.console is daemon._console()
+    with pytest.raises(AttributeError):
+        _ = daemon.err_console
+
+
+def test_run_backup_prunes_missing_repo(mocker: MagicMock, tmp_path: Path) -> None:
+    """Verifies a vanished repo is pruned before any config or git work."""
+    mock_prune = mocker.patch("git_pulsar.daemon.prune_registry")
+    mock_load = mocker.patch("git_pulsar.daemon.Config.load")
+    mock_cls = mocker.patch("git_pulsar.daemon.GitRepo")
+    missing = str(tmp_path / "gone")
+
+    daemon.run_backup(missing)
+
+    mock_prune.assert_called_once_with(missing)
+    mock_load.assert_not_called()
+    mock_cls.assert_not_called()
+
+
+def test_battery_reading_is_shared_within_ttl(mocker: MagicMock) -> None:
+    """Verifies repeated battery checks reuse one reading until it expires."""
+    mock_battery = mocker.patch.object(
+        daemon.SYSTEM, "get_battery", return_value=(50, False)
+    )
+    mock_time = mocker.patch("time.monotonic", return_value=100.0)
+
+    assert daemon._get_battery() == (50, False)
+    assert daemon._get_battery() == (50, False)
+    assert mock_battery.call_count == 1
+
+    mock_time.return_value = 100.0 + daemon.BATTERY_TTL
+    daemon._get_battery()
+    assert mock_battery.call_count == 2
+
+
+def test_daemon_import_does_not_load_rich() -> None:
+    """Verifies that a background pass never imports rich."""
+    import subprocess
+    import sys
+
+    code = (
+        "import sys, git_pulsar.daemon; "
+        "print(any(m.startswith('rich') for m in sys.modules))"
+    )
+    out = subprocess.check_output([sys.executable, "-c", code], text=True)
+    assert out.strip() == "False"
+
+
+@pytest.mark.parametrize(
+    ("prev_tree", "should_commit"), [("tree1", False), ("tree0", True)]
+)
+def test_run_backup_compares_against_previous_backup_tree(
+    tmp_path: Path,
+    mocker: MagicMock,
+    mock_config: Config,
+    prev_tree: str,
+    should_commit: bool,
+) -> None:
+    """Verifies that parents and the previous tree come from one batched lookup."""
+    (tmp_path / ".git").mkdir()
+    mocker.patch("git_pulsar.daemon.SYSTEM.is_under_load", return_value=False)
+    mocker.patch("git_pulsar.daemon.SYSTEM.get_battery", return_value=(100, True))
+    mocker.patch("git_pulsar.system.get_identity_slug", return_value="id--1234")
+    mocker.patch("git_pulsar.ops.has_large_files", return_value=False)
+    mocker.patch("git_pulsar.daemon._attempt_push")
+    mocker.patch(
+        "git_pulsar.daemon._get_ref_timestamps",
+        side_effect=lambda _repo, refs: dict.fromkeys(refs, 0),
+    )
+    repo = mocker.patch("git_pulsar.daemon.GitRepo").return_value
+    repo.current_branch.return_value = "main"
+    repo.write_tree.return_value = "tree1"
+    ref = f"refs/heads/{BACKUP_NAMESPACE}/id--1234/main"
+    repo.rev_parse_many.return_value = {
+        ref: "backup1",
+        "HEAD": "head_sha",
+        f"{ref}^{{tree}}": prev_tree,
+    }
+
+    daemon.run_backup(str(tmp_path))
+
+    repo.rev_parse_many.assert_called_once_with([ref, "HEAD", f"{ref}^{{tree}}"])
+    repo.rev_parse.assert_not_called()
+    if should_commit:
+        assert repo.commit_tree.call_args.kwargs["parents"] == ["backup1", "head_sha"]
+    else:
+        repo.commit_tree.assert_not_called()
+
+
+def test_read_remote_host_parses_git_config_without_git(
+    tmp_path: Path, mocker: MagicMock
+) -> None:
+    """Verifies that plain remotes come from .git/config and rewrites defer to git."""
+    git_config = tmp_path / ".git" / "config"
+    git_config.parent.mkdir()
+    git_config.write_text(
+        '[core]\n\tbare = false\n[remote "upstream"]\n\turl = git@example.org:x.git\n'
+        '[remote "origin"]\n\turl = https://github.com/user/repo.git\n'
+        "\tfetch = +refs/heads/*:refs/remotes/origin/*\n"
+    )
+    mock_out = mocker.patch(
+        "subprocess.check_output", return_value="git@gitlab.com:user/repo.git\n"
+    )
+
+    assert daemon._read_remote_host(tmp_path, "origin") == "github.com"
+    assert daemon._read_remote_host(tmp_path, "upstream") == "example.org"
+    mock_out.assert_not_called()
+
+    assert daemon._read_remote_host(tmp_path, "missing") == "gitlab.com"
+    git_config.write_text(
+        git_config.read_text()
+        + '[url "git@gitlab.com:"]\n\tinsteadOf = https://github.com/\n'
+    )
+    assert daemon._read_remote_host(tmp_path, "origin") == "gitlab.com"
+    assert mock_out.call_count == 2
+
+
+def test_run_backup_scans_large_files_only_when_committing(
+    tmp_path: Path, mocker: MagicMock, mock_config: Config
+) -> None:
+    """Verifies the large-file scan is skipped while the commit interval runs."""
+    (tmp_path / ".git").mkdir()
+    mocker.patch("git_pulsar.daemon.SYSTEM.is_under_load", return_value=False)
+    mocker.patch("git_pulsar.daemon.SYSTEM.get_battery", return_value=(100, True))
+    mock_scan = mocker.patch("git_pulsar.ops.has_large_files", return_value=True)
+    mocker.patch("git_pulsar.daemon._attempt_push")
+    repo = mocker.patch("git_pulsar.daemon.GitRepo").return_value
+    repo.current_branch.return_value = "main"
+    mock_config.daemon.commit_interval = 600
+    now = 10000.0
+    mocker.patch("time.time", return_value=now)
+    stamps = mocker.patch(
+        "git_pulsar.daemon._get_ref_timestamps",
+        side_effect=lambda _repo, refs: dict.fromkeys(refs, now - 60),
+    )
+
+    daemon.run_backup(str(tmp_path), interactive=True)
+    mock_scan.assert_not_called()
+
+    # Interval elapsed: the scan runs and a large file blocks the snapshot.
+    stamps.side_effect = lambda _repo, refs: dict.fromkeys(refs, 0)
+    daemon.run_backup(str(tmp_path), interactive=True)
+    mock_scan.assert_called_once()
+    repo.write_tree.assert_not_called()
@@ -1,6 +1,8 @@
 from pathlib import Path
 from unittest.mock import MagicMock
 
+import pytest
+
 from git_pulsar.git_wrapper import GitRepo
 
 
@@ -42,24 +44,429 @@ def test_run_diff_with_file_targeting(mocker: MagicMock, tmp_path: Path) -> None
     )
 
 
-def test_diff_shortstat_regex_parsing(mocker: MagicMock, tmp_path: Path) -> None:
-    """Verifies that shortstat parses correctly, handling missing clauses."""
+def test_diff_shortstat_numstat_parsing(mocker: MagicMock, tmp_path: Path) -> None:
+    """Verifies that numstat records are summed, handling renames and binaries."""
     (tmp_path / ".git").mkdir()
     repo = GitRepo(tmp_path)
     mock_run = mocker.patch.object(repo, "_run")
 
-    # Case 1: Standard output with all three metrics
-    mock_run.return_value = " 3 files changed, 25 insertions(+), 4 deletions(-)"
+    # Case 1: Plain edits across several files
+    mock_run.return_value = "20\t4\ta.py\x005\t0\tb.py\x000\t0\tc.py\x00"
     assert repo.diff_shortstat("main", "backup_ref") == (3, 25, 4)
 
-    # Case 2: Missing deletions clause
-    mock_run.return_value = " 1 file changed, 10 insertions(+)"
-    assert repo.diff_shortstat("main", "backup_ref") == (1, 10, 0)
-
-    # Case 3: Missing insertions clause
-    mock_run.return_value = " 2 files changed, 12 deletions(-)"
-    assert repo.diff_shortstat("main", "backup_ref") == (2, 0, 12)
+    # Case 2: A rename (paths as extra records) and a binary file
+    mock_run.return_value = "3\t1\t\x00old.py\x00new.py\x00-\t-\tlogo.png\x00"
+    assert repo.diff_shortstat("main", "backup_ref") == (2, 3, 1)
 
-    # Case 4: Empty diff (branch is up to date)
+    # Case 3: Empty diff (branch is up to date)
     mock_run.return_value = ""
     assert repo.diff_shortstat("main", "backup_ref") == (0, 0, 0)
+
+    mock_run.assert_called_with(
+        ["diff", "--numstat", "-z", "main...backup_ref"], strip=False
+    )
+
+
+def test_branch_summary_parses_head_and_times(
+    mocker: MagicMock, tmp_path: Path
+) -> None:
+    """Verifies that the current branch and ref times come from one for-each-ref."""
+    (tmp_path / ".git").mkdir()
+    repo = GitRepo(tmp_path)
+    mock_run = mocker.patch.object(repo, "_run")
+
+    mock_run.return_value = (
+        "refs/heads/main\t2 hours ago\t*\n"
+        "refs/heads/wip/pulsar/mac--1234/main\t5 minutes ago\t\n"
+    )
+
+    branch, times = repo.branch_summary()
+
+    assert mock_run.call_count == 1
+    assert branch == "main"
+    assert times == {
+        "refs/heads/main": "2 hours ago",
+        "refs/heads/wip/pulsar/mac--1234/main": "5 minutes ago",
+    }
+
+    # A detached HEAD marks no branch as current.
+    mock_run.return_value = "refs/heads/main\t2 hours ago\t"
+    assert repo.branch_summary()[0] == ""
+
+
+def test_count_pending_counts_renames_once(mocker: MagicMock, tmp_path: Path) -> None:
+    """Verifies that NUL-delimited status entries are counted, with renames as one."""
+    (tmp_path / ".git").mkdir()
+    repo = GitRepo(tmp_path)
+    mock_run = mocker.patch.object(repo, "_run")
+
+    mock_run.return_value = " M a.py\0R  new.py\0old.py\0?? notes.txt\0"
+    assert repo.count_pending() == 3
+    mock_run.assert_called_once_with(["status", "--porcelain", "-z"], strip=False)
+
+    mock_run.return_value = ""
+    assert repo.count_pending() == 0
+
+
+def test_current_branch_is_cached_until_checkout(
+    mocker: MagicMock, tmp_path: Path
+) -> None:
+    """Verifies that the branch is resolved once and re-read after switching."""
+    (tmp_path / ".git").mkdir()
+    repo = GitRepo(tmp_path)
+    mock_run = mocker.patch.object(repo, "_run", return_value="main")
+
+    assert repo.current_branch() == "main"
+    assert repo.current_branch() == "main"
+    assert mock_run.call_count == 1
+
+    # Restoring a single file keeps HEAD where it is.
+    repo.checkout("main", file="a.txt")
+    repo.current_branch()
+    assert mock_run.call_count == 2
+
+    mock_run.return_value = "feature"
+    repo.checkout("feature")
+    assert repo.current_branch() == "feature"
+    assert mock_run.call_count == 4
+
+
+def test_probe_reports_git_dir_and_branch(tmp_path: Path) -> None:
+    """Verifies that probe finds the repo root and names the branch, even unborn."""
+    import subprocess
+
+    assert GitRepo.probe(tmp_path) is None
+
+    subprocess.run(["git", "init", "-q", "-b", "trunk", str(tmp_path)], check=True)
+    assert GitRepo.probe(tmp_path) == (tmp_path, "trunk")
+
+    # Subdirectories report the work tree root, which GitRepo() accepts.
+    (tmp_path / "sub").mkdir()
+    assert GitRepo.probe(tmp_path / "sub") == (tmp_path, "trunk")
+
+    subprocess.run(
+        [
+            "git",
+            "-c",
+            "user.name=t",
+            "-c",
+            "user.email=t@t",
+            "commit",
+            "-q",
+            "--allow-empty",
+            "-m",
+            "init",
+        ],
+        cwd=tmp_path,
+        check=True,
+    )
+    assert GitRepo.probe(tmp_path) == (tmp_path, "trunk")
+
+    subprocess.run(["git", "checkout", "-q", "--detach"], cwd=tmp_path, check=True)
+    assert GitRepo.probe(tmp_path) == (tmp_path, "")
+
+
+def test_temporary_index_applies_env_to_git_calls(
+    mocker: MagicMock, tmp_path: Path
+) -> None:
+    """Verifies that git calls inside the block use the isolated index only."""
+    (tmp_path / ".git").mkdir()
+    mock_run = mocker.patch("subprocess.run")
+    mock_run.return_value.stdout = ""
+    repo = GitRepo(tmp_path)
+    base_env = {"PATH": "/usr/bin"}
+
+    with repo.temporary_index(base_env):
+        (tmp_path / ".git" / "pulsar_index").touch()
+        repo.write_tree()
+    repo.write_tree()
+
+    inside, outside = (c.kwargs["env"] for c in mock_run.call_args_list)
+    assert inside == {
+        "PATH": "/usr/bin",
+        "GIT_INDEX_FILE": str(tmp_path / ".git" / "pulsar_index"),
+    }
+    assert outside is None
+    assert base_env == {"PATH": "/usr/bin"}
+    assert not (tmp_path / ".git" / "pulsar_index").exists()
+
+
+def test_run_enforces_instance_timeout(mocker: MagicMock, tmp_path: Path) -> None:
+    """Verifies that a per-repo timeout is applied and surfaced as a git error."""
+    import subprocess
+
+    (tmp_path / ".git").mkdir()
+    mock_run = mocker.patch(
+        "subprocess.run", side_effect=subprocess.TimeoutExpired(["git"], 2.0)
+    )
+    repo = GitRepo(tmp_path, timeout=2.0)
+
+    with pytest.raises(RuntimeError, match="timed out"):
+        repo.write_tree()
+    assert mock_run.call_args.kwargs["timeout"] == 2.0
+
+
+def test_rev_parse_many_resolves_in_one_call(tmp_path: Path) -> None:
+    """Verifies batched resolution against a real repository, including misses."""
+    import subprocess
+
+    subprocess.run(["git", "init", "-q", str(tmp_path)], check=True)
+    subprocess.run(
+        ["git", "-c", "user.name=t", "-c", "user.email=t@t"]
+        + ["commit", "-q", "--allow-empty", "-m", "init"],
+        cwd=tmp_path,
+        check=True,
+    )
+    repo = GitRepo(tmp_path)
+
+    resolved = repo.rev_parse_many(["HEAD", "refs/heads/missing", "HEAD^{tree}"])
+
+    assert resolved["HEAD"] == repo.rev_parse("HEAD")
+    assert resolved["refs/heads/missing"] is None
+    assert resolved["HEAD^{tree}"] == repo._run(["rev-parse", "HEAD^{tree}"])
+
+
+def test_temporary_index_seeds_from_real_index(tmp_path: Path) -> None:
+    """Verifies the isolated index starts from the user's index and leaves it alone."""
+    import subprocess
+
+    subprocess.run(["git", "init", "-q", str(tmp_path)], check=True)
+    (tmp_path / "tracked.txt").write_text("v1")
+    subprocess.run(["git", "add", "tracked.txt"], cwd=tmp_path, check=True)
+    real_index = (tmp_path / ".git" / "index").read_bytes()
+    (tmp_path / "tracked.txt").write_text("v2")
+    (tmp_path / "new.txt").write_text("new")
+    repo = GitRepo(tmp_path)
+
+    with repo.temporary_index():
+        assert (tmp_path / ".git" / "pulsar_index").read_bytes() == real_index
+        repo._run(["add", "."])
+        tree = repo.write_tree()
+
+    listing = repo._run(["ls-tree", "--name-only", tree]).splitlines()
+    assert listing == ["new.txt", "tracked.txt"]
+    assert repo._run(["show", f"{tree}:tracked.txt"]) == "v2"
+    assert (tmp_path / ".git" / "index").read_bytes() == real_index
+    assert not (tmp_path / ".git" / "pulsar_index").exists()
+
+
+def test_run_skips_debug_message_when_disabled(
+    mocker: MagicMock, tmp_path: Path
+) -> None:
+    """Verifies the per-call debug line is only built when DEBUG is enabled."""
+    from git_pulsar import git_wrapper
+
+    (tmp_path / ".git").mkdir()
+    mocker.patch("subprocess.run").return_value.stdout = ""
+    mock_debug = mocker.patch.object(git_wrapper.logger, "debug")
+    mock_enabled = mocker.patch.object(git_wrapper.logger, "isEnabledFor")
+    repo = GitRepo(tmp_path)
+
+    mock_enabled.return_value = False
+    repo._run(["status"])
+    mock_debug.assert_not_called()
+
+    mock_enabled.return_value = True
+    repo._run(["status"])
+    mock_debug.assert_called_once_with("Executing: git status")
+
+
+def test_rev_parse_memoizes_until_refs_move(mocker: MagicMock, tmp_path: Path) -> None:
+    """Verifies rev_parse caches hits, skips misses, and resets on ref changes."""
+    (tmp_path / ".git").mkdir()
+    repo = GitRepo(tmp_path)
+    mock_run = mocker.patch("subprocess.run")
+    mock_run.return_value.stdout = "a" * 40
+
+    assert repo.rev_parse("main") == "a" * 40
+    assert repo.rev_parse("main") == "a" * 40
+    assert mock_run.call_count == 1
+
+    repo.update_ref("refs/heads/main", "b" * 40)
+    mock_run.return_value.stdout = "b" * 40
+    assert repo.rev_parse("main") == "b" * 40
+    assert mock_run.call_count == 3
+
+    mock_run.side_effect = RuntimeError("unknown revision")
+    assert repo.rev_parse("missing") is None
+    mock_run.side_effect = None
+    assert repo.rev_parse("missing") == "b" * 40
+
+
+def test_list_refs_with_time_pairs_names_and_ages(
+    mocker: MagicMock, tmp_path: Path
+) -> None:
+    """Verifies refs and their relative times come back from a single call."""
+    (tmp_path / ".git").mkdir()
+    repo = GitRepo(tmp_path)
+    mock_run = mocker.patch.object(repo, "_run")
+    mock_run.return_value = "refs/heads/a\x002 hours ago\nrefs/heads/b\x001 day ago"
+
+    pairs = repo.list_refs_with_time("refs/heads/")
+
+    assert pairs == [("refs/heads/a", "2 hours ago"), ("refs/heads/b", "1 day ago")]
+    assert mock_run.call_count == 1
+
+
+def test_temporary_index_keeps_index_mtime(tmp_path: Path) -> None:
+    """Verifies the seeded index keeps the real index mtime for racy-git checks."""
+    import os
+    import subprocess
+
+    subprocess.run(["git", "init", "-q", str(tmp_path)], check=True)
+    (tmp_path / "tracked.txt").write_text("v1")
+    subprocess.run(["git", "add", "tracked.txt"], cwd=tmp_path, check=True)
+    real_index = tmp_path / ".git" / "index"
+    os.utime(real_index, ns=(1_000_000_000, 1_000_000_000))
+    repo = GitRepo(tmp_path)
+
+    with repo.temporary_index():
+        seeded = tmp_path / ".git" / "pulsar_index"
+        assert seeded.stat().st_mtime_ns == real_index.stat().st_mtime_ns
+
+
+def test_status_and_untracked_keep_unusual_paths(tmp_path: Path) -> None:
+    """Verifies -z parsing keeps leading spaces and newlines and folds renames."""
+    import subprocess
+
+    subprocess.run(["git", "init", "-q", str(tmp_path)], check=True)
+    (tmp_path / "a.txt").write_text("a")
+    (tmp_path / "old.txt").write_text("old contents")
+    subprocess.run(["git", "add", "."], cwd=tmp_path, check=True)
+    subprocess.run(
+        ["git", "-c", "user.name=t", "-c", "user.email=t@t", "commit", "-qm", "i"],
+        cwd=tmp_path,
+        check=True,
+    )
+    (tmp_path / "a.txt").write_text("changed")
+    subprocess.run(["git", "mv", "old.txt", "new.txt"], cwd=tmp_path, check=True)
+    (tmp_path / "line\nbreak.txt").write_text("x")
+    repo = GitRepo(tmp_path)
+
+    assert sorted(repo.status_porcelain()) == [
+        " M a.txt",
+        "?? line\nbreak.txt",
+        "R  new.txt",
+    ]
+    assert repo.get_untracked_files() == ["line\nbreak.txt"]
+
+
+def test_run_parallel_overlaps_calls_and_keeps_order() -> None:
+    """Verifies queued queries run concurrently and return in input order."""
+    import functools
+    import threading
+
+    barrier = threading.Barrier(3, timeout=5)
+
+    def query(n: int) -> int:
+        barrier.wait()  # Only returns once all three calls are in flight.
+        return n * 10
+
+    calls = [functools.partial(query, n) for n in range(3)]
+
+    assert GitRepo.run_parallel(calls, max_workers=3) == [0, 10, 20]
+    assert GitRepo.run_parallel([]) == []
+
+
+def test_rev_parse_returns_full_object_names_without_git(
+    mocker: MagicMock, tmp_path: Path
+) -> None:
+    """Verifies full SHA-1/SHA-256 names skip the subprocess entirely."""
+    (tmp_path / ".git").mkdir()
+    repo = GitRepo(tmp_path)
+    mock_run = mocker.patch("subprocess.run")
+    mock_run.return_value.stdout = "c" * 40
+
+    assert repo.rev_parse("a" * 40) == "a" * 40
+    assert repo.rev_parse("b" * 64) == "b" * 64
+    mock_run.assert_not_called()
+
+    assert repo.rev_parse("A" * 40) == "c" * 40  # Not canonical; ask git.
+    assert mock_run.call_count == 1
+
+
+def test_update_refs_applies_one_transaction(tmp_path: Path) -> None:
+    """Verifies batched updates and deletions land together, or not at all."""
+    import subprocess
+
+    subprocess.run(["git", "init", "-q", str(tmp_path)], check=True)
+    subprocess.run(
+        ["git", "-c", "user.name=t", "-c", "user.email=t@t", "commit", "-q"]
+        + ["--allow-empty", "-m", "init"],
+        cwd=tmp_path,
+        check=True,
+    )
+    repo = GitRepo(tmp_path)
+    head = repo.rev_parse("HEAD")
+    assert head
+    repo.update_refs([("refs/heads/a", head, None), ("refs/heads/b", head, None)])
+    assert repo.list_refs("refs/heads/") == [
+        "refs/heads/a",
+        "refs/heads/b",
+        repo._run(["symbolic-ref", "HEAD"]),
+    ]
+
+    # A stale old-oid check fails the whole transaction.
+    with pytest.raises(RuntimeError):
+        repo.update_refs(
+            [("refs/heads/a", None, None), ("refs/heads/b", None, "0" * 39 + "1")]
+        )
+    assert "refs/heads/a" in repo.list_refs("refs/heads/")
+
+    repo.update_refs([("refs/heads/a", None, None), ("refs/heads/b", None, head)])
+    assert repo.list_refs("refs/heads/a") == repo.list_refs("refs/heads/b") == []
+
+
+def test_init_stats_each_repository_once(mocker: MagicMock, tmp_path: Path) -> None:
+    """Verifies the .git check is skipped for paths already validated."""
+    (tmp_path / ".git").mkdir()
+    mocker.patch.object(GitRepo, "_validated_paths", set())
+    spy = mocker.spy(Path, "exists")
+
+    GitRepo(tmp_path)
+    GitRepo(tmp_path)
+    assert spy.call_count == 1
+
+    with pytest.raises(ValueError, match="Not a git repository"):
+        GitRepo(tmp_path / "missing")
+    assert tmp_path / "missing" not in GitRepo._validated_paths
+
+
+def test_run_uses_posix_spawn_fast_path(mocker: MagicMock, tmp_path: Path) -> None:
+    """Verifies git is launched by absolute path via -C, so no fork() is needed."""
+    import subprocess
+
+    # Before Python 3.13, subprocess only uses posix_spawn with close_fds=False.
+    if not (
+        getattr(subprocess, "_USE_POSIX_SPAWN", False)
+        and getattr(subprocess, "_HAVE_POSIX_SPAWN_CLOSEFROM", False)
+    ):
+        pytest.skip("subprocess does not use posix_spawn with close_fds here")
+
+    subprocess.run(["git", "init", "-q", str(tmp_path)], check=True)
+    spy = mocker.spy(subprocess.Popen, "_posix_spawn")
+
+    assert GitRepo(tmp_path)._run(["rev-parse", "--git-dir"]) == ".git"
+    assert spy.call_count == 1
+
+
+def test_get_commit_timestamps_reads_refs_in_one_call(
+    mocker: MagicMock, tmp_path: Path
+) -> None:
+    """Verifies that ref names and Unix timestamps come from one for-each-ref."""
+    (tmp_path / ".git").mkdir()
+    repo = GitRepo(tmp_path)
+    mock_run = mocker.patch.object(repo, "_run")
+    mock_run.return_value = (
+        "refs/heads/wip/pulsar/a/main\x001700000000\n"
+        "refs/heads/wip/pulsar/b/main\x001800000000\n"
+    )
+
+    assert repo.get_commit_timestamps("refs/heads/wip/pulsar/*/main") == {
+        "refs/heads/wip/pulsar/a/main": 1700000000,
+        "refs/heads/wip/pulsar/b/main": 1800000000,
+    }
+    assert mock_run.call_count == 1
+
+    mock_run.side_effect = RuntimeError("not a repo")
+    assert repo.get_commit_timestamps("refs/heads/") == {}
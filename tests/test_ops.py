@@ -1,7 +1,6 @@
 import json
 import os
 from pathlib import Path
-from typing import Any
 from unittest.mock import MagicMock
 
 import pytest
@@ -22,7 +21,7 @@ def test_restore_clean(mocker: MagicMock) -> None:
     mock_repo = mock_cls.return_value
     mock_repo.status_porcelain.return_value = []
 
-    mocker.patch("git_pulsar.ops.console")
+    mocker.patch("git_pulsar.ops._console")
 
     # Mock get_identity_slug
     mock_repo.current_branch.return_value = "main"
@@ -49,10 +48,10 @@ def test_restore_dirty_cancels(tmp_path: Path, mocker: MagicMock) -> None:
     mock_repo = mock_cls.return_value
     mock_repo.status_porcelain.return_value = ["M script.py"]
     mocker.patch("git_pulsar.ops.get_backup_ref", return_value="refs/backup")
-    mocker.patch("git_pulsar.ops.console")
+    mocker.patch("git_pulsar.ops._console")
 
     # Mock the prompt to return 'c' for cancel
-    mocker.patch("git_pulsar.ops.Prompt.ask", return_value="c")
+    mocker.patch("rich.prompt.Prompt.ask", return_value="c")
 
     with pytest.raises(SystemExit) as excinfo:
         ops.restore_file("script.py")
@@ -75,10 +74,10 @@ def test_restore_dirty_overwrites(tmp_path: Path, mocker: MagicMock) -> None:
     mock_repo = mock_cls.return_value
     mock_repo.status_porcelain.return_value = ["M script.py"]
     mocker.patch("git_pulsar.ops.get_backup_ref", return_value="refs/backup")
-    mocker.patch("git_pulsar.ops.console")
+    mocker.patch("git_pulsar.ops._console")
 
     # Mock the prompt to return 'o' for overwrite
-    mocker.patch("git_pulsar.ops.Prompt.ask", return_value="o")
+    mocker.patch("rich.prompt.Prompt.ask", return_value="o")
 
     ops.restore_file("script.py")
 
@@ -99,10 +98,10 @@ def test_restore_dirty_views_diff(tmp_path: Path, mocker: MagicMock) -> None:
     mock_repo = mock_cls.return_value
     mock_repo.status_porcelain.return_value = ["M script.py"]
     mocker.patch("git_pulsar.ops.get_backup_ref", return_value="refs/backup")
-    mocker.patch("git_pulsar.ops.console")
+    mocker.patch("git_pulsar.ops._console")
 
     # Mock the prompt to return 'v' (view), then 'c' (cancel) on the second pass
-    mocker.patch("git_pulsar.ops.Prompt.ask", side_effect=["v", "c"])
+    mocker.patch("rich.prompt.Prompt.ask", side_effect=["v", "c"])
 
     with pytest.raises(SystemExit):
         ops.restore_file("script.py")
@@ -123,26 +122,15 @@ def test_sync_session_success(mocker: MagicMock) -> None:
     repo.current_branch.return_value = "main"
 
     # Mock user confirmation 'y'.
-    mock_console = mocker.patch("git_pulsar.ops.console")
-    mock_console.input.return_value = "y"
+    mock_console = mocker.patch("git_pulsar.ops._console")
+    mock_console.return_value.input.return_value = "y"
 
-    # 1. Setup candidate refs from multiple machines.
-    repo.list_refs.return_value = [
-        f"refs/heads/{BACKUP_NAMESPACE}/laptop/main",
-        f"refs/heads/{BACKUP_NAMESPACE}/desktop/main",
-    ]
-
-    # 2. Setup timestamp logic (desktop is newer).
-    def mock_run(cmd: list[str], *args: Any, **kwargs: Any) -> str:
-        # Check if "desktop" or "laptop" is in the command arguments.
-        cmd_str = " ".join(cmd)
-        if cmd[0] == "log" and "desktop" in cmd_str:
-            return "2000"
-        if cmd[0] == "log" and "laptop" in cmd_str:
-            return "1000"
-        return ""
-
-    repo._run.side_effect = mock_run
+    # 1. Setup candidate refs from multiple machines (desktop is newer).
+    repo.get_commit_timestamps.return_value = {
+        f"refs/heads/{BACKUP_NAMESPACE}/laptop/main": 1000,
+        f"refs/heads/{BACKUP_NAMESPACE}/desktop/main": 2000,
+    }
+    repo._run.return_value = ""
 
     # 3. Setup tree diff (simulate remote tree != local tree).
     repo.write_tree.return_value = "local_tree"
@@ -180,17 +168,19 @@ def test_finalize_octopus_merge(mocker: MagicMock) -> None:
     repo.current_branch.return_value = "feature-branch"
     repo.rev_parse.side_effect = ["sha", None]  # main exists, master doesn't
     repo.diff_shortstat.return_value = (2, 10, 5)
+    repo.run_parallel.side_effect = lambda calls: [call() for call in calls]
 
-    # Provide a string so rich doesn't panic
-    repo.get_last_commit_time.return_value = "2 hours ago"
-
-    mocker.patch("git_pulsar.ops.console")
+    mocker.patch("git_pulsar.ops._console")
 
     # Mock the new pre-flight confirmation to proceed
-    mocker.patch("git_pulsar.ops.Confirm.ask", return_value=True)
+    mocker.patch("rich.prompt.Confirm.ask", return_value=True)
 
-    # Simulate finding 3 backup streams.
-    repo.list_refs.return_value = ["ref_A", "ref_B", "ref_C"]
+    # Simulate finding 3 backup streams (times are strings so rich doesn't panic).
+    repo.list_refs_with_time.return_value = [
+        ("ref_A", "2 hours ago"),
+        ("ref_B", "1 day ago"),
+        ("ref_C", "3 days ago"),
+    ]
 
     ops.finalize_work()
 
@@ -203,6 +193,11 @@ def test_finalize_octopus_merge(mocker: MagicMock) -> None:
     # 3. Verify Interactive Commit trigger.
     repo.commit_interactive.assert_called_once()
 
+    # 4. Verify main and the backup refs arrive in a single fetch.
+    fetches = [c for c in repo._run.call_args_list if c.args[0][0] == "fetch"]
+    assert len(fetches) == 1
+    assert fetches[0].args[0][:3] == ["fetch", "origin", "main"]
+
 
 def test_finalize_aborts_on_user_decline(mocker: MagicMock) -> None:
     """Verifies that declining the pre-flight checklist exits cleanly without checking out."""
@@ -211,15 +206,16 @@ def test_finalize_aborts_on_user_decline(mocker: MagicMock) -> None:
     repo.current_branch.return_value = "feature-branch"
     repo.rev_parse.side_effect = ["sha", None]
     repo.diff_shortstat.return_value = (2, 10, 5)
+    repo.run_parallel.side_effect = lambda calls: [call() for call in calls]
 
-    # Provide a string so rich doesn't panic
-    repo.get_last_commit_time.return_value = "2 hours ago"
-
-    mocker.patch("git_pulsar.ops.console")
+    mocker.patch("git_pulsar.ops._console")
 
     # Mock the pre-flight confirmation to abort
-    mocker.patch("git_pulsar.ops.Confirm.ask", return_value=False)
-    repo.list_refs.return_value = ["ref_A", "ref_B"]
+    mocker.patch("rich.prompt.Confirm.ask", return_value=False)
+    repo.list_refs_with_time.return_value = [
+        ("ref_A", "2 hours ago"),
+        ("ref_B", "1 day ago"),
+    ]
 
     with pytest.raises(SystemExit) as excinfo:
         ops.finalize_work()
@@ -267,22 +263,10 @@ def test_get_remote_drift_state_local_is_newer(
         return_value="refs/heads/wip/pulsar/laptop--123/main",
     )
 
-    repo.list_refs.return_value = [
-        "refs/heads/wip/pulsar/desktop--456/main",
-        "refs/heads/wip/pulsar/laptop--123/main",
-    ]
-
-    def mock_run_side_effect(cmd: list[str], **kwargs: Any) -> str:
-        if cmd[0] == "fetch":
-            return ""
-        if cmd[0] == "log":
-            if "desktop" in cmd[-1]:
-                return "1000"
-            if "laptop" in cmd[-1]:
-                return "2000"
-        return "0"
-
-    repo._run.side_effect = mock_run_side_effect
+    repo.get_commit_timestamps.return_value = {
+        "refs/heads/wip/pulsar/desktop--456/main": 1000,
+        "refs/heads/wip/pulsar/laptop--123/main": 2000,
+    }
 
     drift, ts, machine, warning = ops.get_remote_drift_state(tmp_path)
     assert not drift
@@ -302,22 +286,10 @@ def test_get_remote_drift_state_remote_is_newer(
         return_value="refs/heads/wip/pulsar/laptop--123/main",
     )
 
-    repo.list_refs.return_value = [
-        "refs/heads/wip/pulsar/desktop--456/main",
-        "refs/heads/wip/pulsar/laptop--123/main",
-    ]
-
-    def mock_run_side_effect(cmd: list[str], **kwargs: Any) -> str:
-        if cmd[0] == "fetch":
-            return ""
-        if cmd[0] == "log":
-            if "desktop" in cmd[-1]:
-                return "2000"
-            if "laptop" in cmd[-1]:
-                return "1000"
-        return "0"
-
-    repo._run.side_effect = mock_run_side_effect
+    repo.get_commit_timestamps.return_value = {
+        "refs/heads/wip/pulsar/desktop--456/main": 2000,
+        "refs/heads/wip/pulsar/laptop--123/main": 1000,
+    }
     mocker.patch("time.time", return_value=2900.0)
 
     drift, ts, machine, warning = ops.get_remote_drift_state(tmp_path)
@@ -377,7 +349,7 @@ def test_has_large_files_uses_config_limit(tmp_path: Path, mocker: MagicMock) ->
     mock_strat = mocker.patch("git_pulsar.ops.system.get_system").return_value
 
     # Mock git ls-files to return a file
-    mocker.patch("subprocess.check_output", return_value="big_file.txt")
+    mocker.patch("subprocess.check_output", return_value=b"big_file.txt")
 
     # Create the 'large' file in the isolated temp directory
     (tmp_path / "big_file.txt").write_text("a" * 600)  # 600 bytes > 500 limit
@@ -387,3 +359,45 @@ def test_has_large_files_uses_config_limit(tmp_path: Path, mocker: MagicMock) ->
     assert result is True
     # Verify the mock strategy intercepted the call
     mock_strat.notify.assert_called_with("Backup Aborted", mocker.ANY)
+
+
+def test_has_large_files_parses_nul_separated_names(
+    tmp_path: Path, mocker: MagicMock
+) -> None:
+    """Verifies NUL-separated candidates, including odd names and deleted files."""
+    from git_pulsar.config import Config
+
+    conf = Config()
+    conf.limits.large_file_threshold = 10
+    mock_strat = mocker.patch("git_pulsar.ops.system.get_system").return_value
+    mock_out = mocker.patch(
+        "subprocess.check_output",
+        return_value=b"deleted.txt\0small.txt\0odd\nname\0",
+    )
+    (tmp_path / "small.txt").write_text("tiny")
+
+    assert ops.has_large_files(tmp_path, conf) is False
+    assert "-z" in mock_out.call_args.args[0]
+
+    (tmp_path / "odd\nname").write_text("x" * 20)
+    assert ops.has_large_files(tmp_path, conf) is True
+    assert "odd\nname" in mock_strat.notify.call_args.args[1]
+
+
+def test_prune_backups_deletes_stale_refs_in_one_batch(mocker: MagicMock) -> None:
+    """Verifies expired backup refs are dropped with a single update_refs call."""
+    import time
+
+    repo = mocker.patch("git_pulsar.ops.GitRepo").return_value
+    mocker.patch("git_pulsar.ops._console")
+    now = int(time.time())
+    ages = {"ref_old": now - 40 * 86400, "ref_new": now, "ref_older": now - 90 * 86400}
+    repo.get_commit_timestamps.return_value = ages
+
+    ops.prune_backups(30, Path("/repo"))
+
+    repo.update_refs.assert_called_once_with(
+        [("ref_old", None, None), ("ref_older", None, None)]
+    )
+    # One for-each-ref answers every timestamp; no git log per ref.
+    assert not any(c.args[0][0] == "log" for c in repo._run.call_args_list)
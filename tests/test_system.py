@@ -136,8 +136,8 @@ def test_configure_identity_creates_file(tmp_path: Path, mocker: MagicMock) -> N
         tmp_path (Path): Pytest fixture for a temporary directory.
         mocker (MagicMock): Pytest fixture for mocking.
     """
-    mock_console = mocker.patch("git_pulsar.system.console")
-    mock_console.input.return_value = "my-laptop"
+    mock_console = mocker.patch("git_pulsar.system._console")
+    mock_console.return_value.input.return_value = "my-laptop"
 
     # 'machine_id' is for the stable UUID (generated automatically)
     # 'machine_name' is for the user input
@@ -177,12 +177,12 @@ def test_configure_identity_skips_existing(tmp_path: Path, mocker: MagicMock) ->
     mock_name_file.write_text("existing-name")
     mocker.patch("git_pulsar.system.get_machine_name_file", return_value=mock_name_file)
 
-    mock_console = mocker.patch("git_pulsar.system.console")
+    mock_console = mocker.patch("git_pulsar.system._console")
 
     system.configure_identity()
 
     # Should exit early without asking for input
-    mock_console.input.assert_not_called()
+    mock_console.return_value.input.assert_not_called()
 
 
 def test_get_registered_repos_parses_cleanly(tmp_path: Path, mocker: MagicMock) -> None:
@@ -196,3 +196,67 @@ def test_get_registered_repos_parses_cleanly(tmp_path: Path, mocker: MagicMock)
     assert len(repos) == 2
     assert Path("/path/one") in repos
     assert Path("/path/two") in repos
+    assert system.get_registered_paths() == ["/path/one", "/path/two"]
+
+    mocker.patch("git_pulsar.system.REGISTRY_FILE", tmp_path / "missing")
+    assert system.get_registered_paths() == []
+
+
+def test_get_registered_paths_reuses_parse_until_modified(
+    tmp_path: Path, mocker: MagicMock
+) -> None:
+    """Verifies that an unchanged registry is served from the stat-keyed cache."""
+    import os
+
+    reg_file = tmp_path / "registry"
+    reg_file.write_text("/a\n/b\n")
+    mocker.patch("git_pulsar.system.REGISTRY_FILE", reg_file)
+
+    assert system.get_registered_paths() == ["/a", "/b"]
+    spy_open = mocker.patch("builtins.open", wraps=open)
+    paths = system.get_registered_paths()
+    assert paths == ["/a", "/b"]
+    spy_open.assert_not_called()
+
+    # Callers get their own list.
+    paths.append("/c")
+    assert system.get_registered_paths() == ["/a", "/b"]
+
+    reg_file.write_text("/a\n/b\n/c\n")
+    os.utime(reg_file, ns=(1, 1))
+    assert system.get_registered_paths() == ["/a", "/b", "/c"]
+
+
+def test_get_registered_paths_keeps_undecodable_names(
+    tmp_path: Path, mocker: MagicMock
+) -> None:
+    """Verifies that registry entries round-trip as filesystem paths."""
+    import os
+
+    reg_file = tmp_path / "registry"
+    reg_file.write_bytes(b"/ok\r\n/caf\xe9\n")
+    mocker.patch("git_pulsar.system.REGISTRY_FILE", reg_file)
+
+    paths = system.get_registered_paths()
+
+    assert paths[0] == "/ok"
+    assert os.fsencode(paths[1]) == b"/caf\xe9"
+
+
+def test_linux_battery_falls_back_to_bat1(mocker: MagicMock) -> None:
+    """Verifies the Linux battery probe reads BAT1 when BAT0 is absent."""
+    import io
+
+    files = {
+        "/sys/class/power_supply/BAT1/capacity": "42\n",
+        "/sys/class/power_supply/BAT1/status": "Discharging\n",
+    }
+
+    def fake_open(path: Path) -> io.StringIO:
+        if str(path) not in files:
+            raise FileNotFoundError(path)
+        return io.StringIO(files[str(path)])
+
+    mocker.patch("builtins.open", side_effect=fake_open)
+
+    assert system.LinuxStrategy().get_battery() == (42, False)